@@ -8,7 +8,7 @@ import os
 import sys
 import json
 import argparse
-import requests
+from jiralib import http
 from collections import defaultdict
 from typing import List, Dict
 
@@ -24,7 +24,7 @@ def list_open_report_issues(token: str, repo: str) -> List[dict]:
     out = []
     page = 1
     while True:
-        r = requests.get(url, headers=headers, params={**params, "page": page})
+        r = http.get(url, headers=headers, params={**params, "page": page})
         if r.status_code != 200:
             break
         data = r.json()
@@ -44,7 +44,7 @@ def close_issue(token: str, repo: str, issue_number: int) -> bool:
         "Authorization": f"token {token}",
         "Accept": "application/vnd.github.v3+json",
     }
-    r = requests.patch(url, headers=headers, json={"state": "closed"})
+    r = http.patch(url, headers=headers, json={"state": "closed"})
     return r.status_code == 200
 
 
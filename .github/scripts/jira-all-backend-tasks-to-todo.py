@@ -12,10 +12,9 @@ import base64
 import json
 import os
 import sys
-import time
 from pathlib import Path
 
-import requests
+from jiralib import workflow
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 JIRA_ISSUES_FILE = PROJECT_ROOT / ".github" / "jira-backend-issues.json"
@@ -39,18 +38,6 @@ def load_jira_env(paths: list) -> None:
                         os.environ[k.strip()] = v.strip().strip("'\"")
 
 
-def get_transitions(jira_url: str, headers: dict, issue_key: str) -> list:
-    try:
-        r = requests.get(
-            f"{jira_url}/rest/api/3/issue/{issue_key}/transitions",
-            headers=headers,
-            timeout=10,
-        )
-        return r.json().get("transitions", []) if r.status_code == 200 else []
-    except Exception:
-        return []
-
-
 def find_todo_transition_id(transitions: list) -> str | None:
     for t in transitions:
         name = (t.get("name") or "").strip().lower()
@@ -61,25 +48,17 @@ def find_todo_transition_id(transitions: list) -> str | None:
     return None
 
 
-def transition_to_todo(jira_url: str, headers: dict, issue_key: str) -> bool:
-    transitions = get_transitions(jira_url, headers, issue_key)
-    tid = find_todo_transition_id(transitions)
-    if not tid:
-        return False
-    r = requests.post(
-        f"{jira_url}/rest/api/3/issue/{issue_key}/transitions",
-        headers=headers,
-        json={"transition": {"id": tid}},
-        timeout=10,
-    )
-    return r.status_code == 204
-
-
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="GAM-1·GAM-2 제외, GAM-3~6 하위 작업만 '해야 할 일'로 전환"
     )
     parser.add_argument("--dry-run", action="store_true", help="API 호출 없이 대상만 출력")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=workflow.DEFAULT_CONCURRENCY,
+        help="동시 전환 수 (기본 %(default)s)",
+    )
     args = parser.parse_args()
 
     load_jira_env(["docs/jira/jira.env", "jira.env"])
@@ -135,16 +114,21 @@ def main() -> None:
         "Accept": "application/json",
     }
 
-    success, fail = 0, 0
-    for i in to_transition:
-        key = i["key"]
-        if transition_to_todo(jira_url, headers, key):
-            print(f"  ✓ {key} → 해야 할 일")
-            success += 1
+    def report(result: dict) -> None:
+        if result["ok"]:
+            print(f"  ✓ {result['key']} → 해야 할 일")
         else:
-            print(f"  ✗ {key} 전환 실패 (이미 To Do이거나 전환 불가)")
-            fail += 1
-        time.sleep(0.35)
+            print(f"  ✗ {result['key']} 전환 실패 ({result['error']})")
+
+    results = workflow.transition_many(
+        jira_url,
+        headers,
+        [(i["key"], find_todo_transition_id) for i in to_transition],
+        concurrency=args.concurrency,
+        on_result=report,
+    )
+    success = sum(1 for r in results if r["ok"])
+    fail = len(results) - success
 
     REPORT_FILE.parent.mkdir(parents=True, exist_ok=True)
     with open(REPORT_FILE, "w", encoding="utf-8") as f:
@@ -152,6 +136,9 @@ def main() -> None:
         f.write(f"- 대상: {len(to_transition)}개 (GAM-1·GAM-2 제외)\n")
         f.write(f"- 성공: {success}개\n")
         f.write(f"- 실패: {fail}개\n")
+        for r in results:
+            if not r["ok"]:
+                f.write(f"  - {r['key']}: {r['error']}\n")
     print(f"\n완료: 성공 {success}개, 실패 {fail}개")
     print(f"보고서: {REPORT_FILE}")
 
@@ -12,10 +12,9 @@ import base64
 import json
 import os
 import sys
-import time
 from pathlib import Path
 
-import requests
+from jiralib import http, workflow
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 JIRA_ISSUES_FILE = PROJECT_ROOT / ".github" / "jira-backend-issues.json"
@@ -44,20 +43,8 @@ def is_done_status(status: str) -> bool:
     return (status or "").strip().lower() in {s.lower() for s in DONE_NAMES}
 
 
-def get_transitions(jira_url: str, headers: dict, issue_key: str) -> list:
-    try:
-        r = requests.get(
-            f"{jira_url}/rest/api/3/issue/{issue_key}/transitions",
-            headers=headers,
-            timeout=10,
-        )
-        return r.json().get("transitions", []) if r.status_code == 200 else []
-    except Exception:
-        return []
-
-
 def transition_to_done(jira_url: str, headers: dict, issue_key: str) -> bool:
-    transitions = get_transitions(jira_url, headers, issue_key)
+    transitions = workflow.get_transitions(jira_url, headers, issue_key)
     tid = None
     for t in transitions:
         to_name = (t.get("to", {}) or {}).get("name") or ""
@@ -68,18 +55,12 @@ def transition_to_done(jira_url: str, headers: dict, issue_key: str) -> bool:
         tid = transitions[0].get("id")
     if not tid:
         return False
-    r = requests.post(
-        f"{jira_url}/rest/api/3/issue/{issue_key}/transitions",
-        headers=headers,
-        json={"transition": {"id": tid}},
-        timeout=10,
-    )
-    return r.status_code == 204
+    return workflow.post_transition(jira_url, headers, issue_key, tid)
 
 
 def add_label(jira_url: str, headers: dict, issue_key: str, label: str) -> bool:
     try:
-        r = requests.put(
+        r = http.put(
             f"{jira_url}/rest/api/3/issue/{issue_key}",
             headers=headers,
             json={"update": {"labels": [{"add": label}]}},
@@ -94,7 +75,7 @@ def add_label(jira_url: str, headers: dict, issue_key: str, label: str) -> bool:
 def delete_issue(jira_url: str, headers: dict, issue_key: str) -> tuple[bool, str]:
     """삭제 시도. (성공 여부, 실패 시 메시지)"""
     try:
-        r = requests.delete(
+        r = http.delete(
             f"{jira_url}/rest/api/3/issue/{issue_key}",
             headers=headers,
             params={"deleteSubtasks": "false"},
@@ -167,6 +148,8 @@ def main() -> None:
         "Accept": "application/json",
     }
 
+    workflow.prime(jira_url, headers, [s["key"] for s in stories])
+
     deleted, archived, failed = [], [], []
     for s in stories:
         key = s["key"]
@@ -178,16 +161,13 @@ def main() -> None:
             if ok:
                 print(f"  ✓ 삭제 {key}")
                 deleted.append({"key": key, "summary": summary})
-                time.sleep(0.35)
                 continue
             print(f"  ⊘ 삭제 불가 {key} → 보관 처리 ({err[:60]})")
 
         # 보관: 라벨 + 완료 전환
         label_ok = add_label(jira_url, headers, key, ARCHIVE_LABEL)
-        time.sleep(0.25)
         if not is_done_status(status):
             trans_ok = transition_to_done(jira_url, headers, key)
-            time.sleep(0.35)
         else:
             trans_ok = True
 
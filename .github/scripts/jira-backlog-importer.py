@@ -16,18 +16,32 @@ JIRA 백로그 문서 파싱 및 자동 이슈 생성 스크립트
     export JIRA_EMAIL=your-email@example.com
     export JIRA_API_TOKEN=YOUR_API_TOKEN
     python3 jira-backlog-importer.py
+
+기본 모드는 부모 키가 정해진 이슈부터 동시에 생성 (동시 실행 수 --concurrency, 기본 JIRA_CONCURRENCY 또는 8):
+    python3 jira-backlog-importer.py --concurrency 16
+
+일괄 생성 모드 (/rest/api/3/issue/bulk, 요청당 최대 50건, Epic → Story → Task 순, 기본 모드와 같은 이슈 구조):
+    python3 jira-backlog-importer.py --bulk
+
+Task-Story Relates 링크는 Task 생성 본문(update.issuelinks)에 넣어 추가 요청 없이 만든다.
+링크 대신 Task를 Epic 직속으로 만들려면 (이슈 구조가 기본 모드와 달라짐):
+    python3 jira-backlog-importer.py --bulk --bulk-no-link-tasks
 """
 
-import re
+import asyncio
 import json
 import sys
 import os
 import argparse
-import base64
-import requests
-from typing import Dict, List, Optional, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from jiralib import backlog, http, session
+from typing import Dict, List, Optional, Set, Tuple
 from pathlib import Path
 
+BULK_CREATE_LIMIT = 50  # JIRA bulk create 요청당 최대 이슈 수
+
+
 class JiraBacklogImporter:
     def __init__(self, jira_url: str, jira_email: str, jira_api_token: str, project_key: str, backlog_file: str, 
                  backend_assignee_email: str = None, frontend_assignee_account_id: str = None):
@@ -40,20 +54,16 @@ class JiraBacklogImporter:
         self.frontend_assignee_account_id = frontend_assignee_account_id
         
         # 인증 헤더 생성
-        auth_string = f"{jira_email}:{jira_api_token}"
-        self.auth_header = base64.b64encode(auth_string.encode()).decode()
-        self.headers = {
-            "Authorization": f"Basic {self.auth_header}",
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        }
+        self.headers = session.auth_headers(jira_email, jira_api_token)
         
         # 매핑 저장소
         self.mapping: Dict[str, str] = {}
         self.epic_keys: Dict[str, str] = {}  # GAM-1 -> GAM-1
         
         # Assignee 매핑 (백로그 파일명으로 구분)
-        self.assignee_cache: Dict[str, str] = {}  # email -> accountId 캐시
+        self.assignee_cache: Dict[str, Optional[str]] = {}  # email -> accountId 캐시 (찾지 못한 이메일은 None)
+        self.assignee_locks: Dict[str, threading.Lock] = {}  # email -> 조회 중 잠금 (동시 생성 시 검색 1회)
+        self.assignee_locks_guard = threading.Lock()
     
     def get_assignee_account_id(self, assignee_text: str) -> Optional[str]:
         """Assignee 텍스트를 accountId로 변환"""
@@ -74,179 +84,94 @@ class JiraBacklogImporter:
         return None
     
     def get_account_id_by_email(self, email: str) -> Optional[str]:
-        """이메일로 accountId 조회"""
+        """이메일로 accountId 조회 (스레드 안전: 이메일마다 먼저 온 스레드만 검색하고 나머지는 결과를 기다림)"""
         if email in self.assignee_cache:
             return self.assignee_cache[email]
         
-        try:
-            url = f"{self.jira_url}/rest/api/3/user/search"
-            params = {"query": email}
-            response = requests.get(url, headers=self.headers, params=params)
+        with self.assignee_locks_guard:
+            lock = self.assignee_locks.setdefault(email, threading.Lock())
+        with lock:
+            if email in self.assignee_cache:
+                return self.assignee_cache[email]
             
-            if response.status_code == 200:
-                users = response.json()
-                if users:
-                    account_id = users[0].get('accountId')
-                    if account_id:
-                        self.assignee_cache[email] = account_id
-                        return account_id
-        except:
-            pass
+            try:
+                url = f"{self.jira_url}/rest/api/3/user/search"
+                params = {"query": email}
+                response = http.get(url, headers=self.headers, params=params)
+                
+                if response.status_code == 200:
+                    users = response.json()
+                    account_id = users[0].get('accountId') if users else None
+                    # 없는 사용자도 기억해 Story 마다 다시 검색하지 않음
+                    self.assignee_cache[email] = account_id
+                    return account_id
+            except:
+                pass
         
         return None
         
     def parse_backlog(self) -> Tuple[List[Dict], List[Dict], List[Dict]]:
-        """백로그 문서를 파싱하여 Epic, Story, Task 정보 추출"""
-        with open(self.backlog_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        """백로그 문서를 파싱하여 Epic, Story, Task 정보 추출 (jiralib.backlog 트리 기반)"""
+        doc = backlog.load(self.backlog_file)
         
         epics = []
         stories = []
         tasks = []
         
-        # Epic 파싱 (다음 Epic이 나올 때까지 또는 문서 끝까지)
-        epic_pattern = r'## Epic \d+:(.*?)(?=## Epic \d+:|$)'
-        epic_matches = re.finditer(epic_pattern, content, re.DOTALL)
-        
-        for epic_match in epic_matches:
-            epic_text = epic_match.group(1)
-            
-            # Epic ID 추출
-            epic_id_match = re.search(r'\*\*Epic ID\*\*:\s*(\S+)', epic_text)
-            if not epic_id_match:
+        for epic in doc.epics:
+            # Epic ID 없는 섹션은 하위 Story 포함 건너뜀
+            if not epic.id:
                 continue
             
-            epic_id = epic_id_match.group(1).strip()
-            
-            # Epic Name 추출
-            epic_name_match = re.search(r'\*\*Epic Name\*\*:\s*(.+?)(?:\n|$)', epic_text)
-            epic_name = epic_name_match.group(1).strip() if epic_name_match else ""
-            
-            # Business Value 추출
-            business_value_match = re.search(r'\*\*Business Value\*\*:\s*(.+?)(?:\n|$)', epic_text)
-            business_value = business_value_match.group(1).strip() if business_value_match else ""
-            
-            # Target Sprint 추출
-            target_sprint_match = re.search(r'\*\*Target Sprint\*\*:\s*(.+?)(?:\n|$)', epic_text)
-            target_sprint = target_sprint_match.group(1).strip() if target_sprint_match else ""
-            
-            # Total Story Points 추출
-            story_points_match = re.search(r'\*\*Total Story Points\*\*:\s*(\d+)\s*SP', epic_text)
-            total_sp = story_points_match.group(1) if story_points_match else ""
-            
             epics.append({
-                'id': epic_id,
-                'name': epic_name,
-                'business_value': business_value,
-                'target_sprint': target_sprint,
-                'total_story_points': total_sp,
-                'text': epic_text
+                'id': epic.id,
+                'name': epic.name,
+                'business_value': epic.fields.get('Business Value', ''),
+                'target_sprint': epic.fields.get('Target Sprint', ''),
+                'total_story_points': backlog.parse_points(epic.fields.get('Total Story Points', '')),
+                'text': doc.source(epic)
             })
             
-            # Story 파싱 (Epic 내부)
-            # Epic 섹션의 끝까지 파싱 (다음 Epic 또는 문서 끝까지)
-            story_pattern = r'### Story (\S+):\s*(.+?)(?=### Story \S+:|## Epic \d+:|$)'
-            story_matches = re.finditer(story_pattern, epic_text, re.DOTALL)
-            
-            for story_match in story_matches:
-                story_id = story_match.group(1).strip()
-                story_text = story_match.group(2)
-                
-                # Story Type 추출
-                story_type_match = re.search(r'\*\*Story Type\*\*:\s*(.+?)(?:\n|$)', story_text)
-                story_type = story_type_match.group(1).strip() if story_type_match else "Story"
-                
-                # Priority 추출
-                priority_match = re.search(r'\*\*Priority\*\*:\s*(.+?)(?:\n|$)', story_text)
-                priority = priority_match.group(1).strip() if priority_match else "Medium"
-                
-                # Story Points 추출
-                sp_match = re.search(r'\*\*Story Points\*\*:\s*(\d+)\s*SP', story_text)
-                story_points = sp_match.group(1) if sp_match else ""
-                
-                # Assignee 추출
-                assignee_match = re.search(r'\*\*Assignee\*\*:\s*(.+?)(?:\n|$)', story_text)
-                assignee = assignee_match.group(1).strip() if assignee_match else ""
-                
-                # Sprint 추출
-                sprint_match = re.search(r'\*\*Sprint\*\*:\s*(.+?)(?:\n|$)', story_text)
-                sprint = sprint_match.group(1).strip() if sprint_match else ""
-                
-                # Labels 추출
-                labels_match = re.search(r'\*\*Labels\*\*:\s*(.+?)(?:\n|$)', story_text)
-                labels_str = labels_match.group(1).strip() if labels_match else ""
+            for story in epic.stories:
+                labels_str = story.fields.get('Labels', '')
                 labels = [label.strip().strip('`') for label in labels_str.split(',')] if labels_str else []
                 
-                # Description 추출
-                desc_match = re.search(r'\*\*Description\*\*:\s*(.+?)(?:\*\*User Story\*\*:|$)', story_text, re.DOTALL)
-                description = desc_match.group(1).strip() if desc_match else ""
-                
-                # User Story 추출
-                user_story_match = re.search(r'\*\*User Story\*\*:\s*```\s*(.+?)\s*```', story_text, re.DOTALL)
-                user_story = user_story_match.group(1).strip() if user_story_match else ""
-                
-                # Acceptance Criteria 추출
-                ac_match = re.search(r'\*\*Acceptance Criteria\*\*:\s*(.+?)(?:\*\*Tasks\*\*:|$)', story_text, re.DOTALL)
-                acceptance_criteria = ac_match.group(1).strip() if ac_match else ""
-                
-                # Tasks 추출
-                tasks_match = re.search(r'\*\*Tasks\*\*:\s*(.+?)(?:\*\*Technical Notes\*\*:|\*\*Definition of Done\*\*:|$)', story_text, re.DOTALL)
-                tasks_text = tasks_match.group(1) if tasks_match else ""
-                
-                story_tasks = []
-                if tasks_text:
-                    task_pattern = r'- \[ \] (\S+):\s*(.+?)(?=\n- \[ \]|\n\n|$)'
-                    task_matches = re.finditer(task_pattern, tasks_text, re.DOTALL)
-                    for task_match in task_matches:
-                        task_id = task_match.group(1).strip()
-                        task_desc = task_match.group(2).strip()
-                        story_tasks.append({
-                            'id': task_id,
-                            'description': task_desc
-                        })
-                
-                # Technical Notes 추출
-                tech_notes_match = re.search(r'\*\*Technical Notes\*\*:\s*```\w+\s*(.+?)\s*```', story_text, re.DOTALL)
-                technical_notes = tech_notes_match.group(1).strip() if tech_notes_match else ""
-                
-                # Definition of Done 추출
-                dod_match = re.search(r'\*\*Definition of Done\*\*:\s*(.+?)(?=---|$)', story_text, re.DOTALL)
-                definition_of_done = dod_match.group(1).strip() if dod_match else ""
-                
-                # Story 제목 추출 (Story ID 다음)
-                title_match = re.search(r'### Story \S+:\s*(.+?)(?:\n|$)', story_text)
-                title = title_match.group(1).strip() if title_match else story_id
+                story_tasks = [
+                    {'id': task.id, 'description': task.description}
+                    for task in story.tasks
+                    if not task.checked
+                ]
                 
                 stories.append({
-                    'id': story_id,
-                    'epic_id': epic_id,
-                    'title': title,
-                    'type': story_type,
-                    'priority': priority,
-                    'story_points': story_points,
-                    'assignee': assignee,
-                    'sprint': sprint,
+                    'id': story.id,
+                    'epic_id': epic.id,
+                    'title': story.title or story.id,
+                    'type': story.fields.get('Story Type') or 'Story',
+                    'priority': story.fields.get('Priority') or 'Medium',
+                    'story_points': backlog.parse_points(story.fields.get('Story Points', '')),
+                    'assignee': story.fields.get('Assignee', ''),
+                    'sprint': story.fields.get('Sprint', ''),
                     'labels': labels,
-                    'description': description,
-                    'user_story': user_story,
-                    'acceptance_criteria': acceptance_criteria,
+                    'description': story.blocks.get('Description', ''),
+                    'user_story': backlog.fenced(story.blocks.get('User Story', '')),
+                    'acceptance_criteria': story.blocks.get('Acceptance Criteria', ''),
                     'tasks': story_tasks,
-                    'technical_notes': technical_notes,
-                    'definition_of_done': definition_of_done
+                    'technical_notes': backlog.fenced(story.blocks.get('Technical Notes', '')),
+                    'definition_of_done': story.blocks.get('Definition of Done', '')
                 })
                 
                 # Tasks를 tasks 리스트에 추가
                 for task in story_tasks:
                     tasks.append({
                         'id': task['id'],
-                        'story_id': story_id,
+                        'story_id': story.id,
                         'description': task['description']
                     })
         
         return epics, stories, tasks
     
-    def create_epic(self, epic: Dict) -> Optional[str]:
-        """Epic 생성"""
+    def build_epic_payload(self, epic: Dict) -> Dict:
+        """Epic 생성 요청 본문"""
         epic_name = epic['name']
         business_value = epic.get('business_value', '')
         target_sprint = epic.get('target_sprint', '')
@@ -280,9 +205,15 @@ class JiraBacklogImporter:
         # Epic Name 필드 설정 (JIRA 버전에 따라 다를 수 있음)
         # customfield_10011은 Epic Link 필드이므로 제거
         # Epic Name은 summary 필드에 이미 포함되어 있음
-        
+        return payload
+
+    def create_epic(self, epic: Dict) -> Optional[str]:
+        """Epic 생성"""
+        epic_name = epic['name']
+        payload = self.build_epic_payload(epic)
+
         try:
-            response = requests.post(
+            response = http.post(
                 f"{self.jira_url}/rest/api/3/issue",
                 headers=self.headers,
                 json=payload
@@ -314,7 +245,7 @@ class JiraBacklogImporter:
                     }
                 }
                 
-                response = requests.put(
+                response = http.put(
                     f"{self.jira_url}/rest/api/3/issue/{story_key}",
                     headers=self.headers,
                     json=payload
@@ -334,7 +265,7 @@ class JiraBacklogImporter:
                 "outwardIssue": {"key": epic_key}
             }
             
-            response = requests.post(
+            response = http.post(
                 f"{self.jira_url}/rest/api/3/issueLink",
                 headers=self.headers,
                 json=payload
@@ -349,8 +280,8 @@ class JiraBacklogImporter:
         print(f"    ⚠ Epic 연결 실패: {story_key} -> {epic_key} (수동 연결 필요)")
         return False
     
-    def create_story(self, story: Dict, epic_key: str) -> Optional[str]:
-        """Story 생성 및 Epic 연결"""
+    def build_story_payload(self, story: Dict, epic_key: Optional[str] = None) -> Dict:
+        """Story 생성 요청 본문. epic_key를 주면 parent 필드로 Epic에 바로 연결."""
         title = story['title']
         description = story.get('description', '')
         user_story = story.get('user_story', '')
@@ -436,9 +367,18 @@ class JiraBacklogImporter:
             assignee_account_id = self.get_assignee_account_id(assignee)
             if assignee_account_id:
                 payload["fields"]["assignee"] = {"accountId": assignee_account_id}
-        
+
+        if epic_key:
+            payload["fields"]["parent"] = {"key": epic_key}
+        return payload
+
+    def create_story(self, story: Dict, epic_key: str) -> Optional[str]:
+        """Story 생성 및 Epic 연결"""
+        title = story['title']
+        payload = self.build_story_payload(story)
+
         try:
-            response = requests.post(
+            response = http.post(
                 f"{self.jira_url}/rest/api/3/issue",
                 headers=self.headers,
                 json=payload
@@ -460,23 +400,38 @@ class JiraBacklogImporter:
             print(f"  ✗ Story 생성 오류: {story['id']} - {str(e)}")
             return None
     
-    def create_task(self, task: Dict, story_key: str, epic_key: str) -> Optional[str]:
-        """Task 생성 및 Story 연결 (Next-Gen 프로젝트 대응)"""
-        description = task['description']
-        
+    def build_task_payload(self, task: Dict, epic_key: Optional[str] = None,
+                           story_key: Optional[str] = None) -> Dict:
+        """
+        Task 생성 요청 본문. epic_key를 주면 parent 필드로 Epic 직속 생성,
+        story_key를 주면 생성과 함께 Story와 Relates 링크 (link_task_to_story 와 같은 방향).
+        """
         # Next-Gen 프로젝트에서는 Story가 Sub-task의 부모가 될 수 없으므로
         # 일반 Task로 생성하고 Story와 Issue Link로 연결
         # Task에는 Epic Link 필드가 없을 수 있으므로 제거
         payload = {
             "fields": {
                 "project": {"key": self.project_key},
-                "summary": description,
+                "summary": task['description'],
                 "issuetype": {"id": "10076"}  # 작업 (Next-Gen 프로젝트는 ID 사용)
             }
         }
-        
+        if epic_key:
+            payload["fields"]["parent"] = {"key": epic_key}
+        if story_key:
+            payload["update"] = {"issuelinks": [{"add": {
+                "type": {"name": "Relates"},
+                "outwardIssue": {"key": story_key},
+            }}]}
+        return payload
+
+    def create_task(self, task: Dict, story_key: str, epic_key: str) -> Optional[str]:
+        """Task 생성 및 Story 연결 (Next-Gen 프로젝트 대응)"""
+        description = task['description']
+        payload = self.build_task_payload(task)
+
         try:
-            response = requests.post(
+            response = http.post(
                 f"{self.jira_url}/rest/api/3/issue",
                 headers=self.headers,
                 json=payload
@@ -507,7 +462,7 @@ class JiraBacklogImporter:
                 "outwardIssue": {"key": story_key}
             }
             
-            response = requests.post(
+            response = http.post(
                 f"{self.jira_url}/rest/api/3/issueLink",
                 headers=self.headers,
                 json=payload
@@ -526,7 +481,7 @@ class JiraBacklogImporter:
     def get_epic_link_field(self) -> Optional[str]:
         """Epic Link 필드 ID 조회"""
         try:
-            response = requests.get(
+            response = http.get(
                 f"{self.jira_url}/rest/api/3/issue/createmeta?projectKeys={self.project_key}&issuetypeNames=Story&expand=projects.issuetypes.fields",
                 headers=self.headers
             )
@@ -540,105 +495,264 @@ class JiraBacklogImporter:
         except:
             return "customfield_10011"  # 기본값
     
+    def bulk_create_issues(self, payloads: List[Dict]) -> Tuple[List[Optional[str]], Set[int]]:
+        """
+        POST /rest/api/3/issue/bulk 로 최대 50건씩 생성.
+        Returns: (입력 순서대로 키 (실패 시 None), 결과를 알 수 없는 입력 인덱스)
+        JIRA가 거부한 요소(4xx, errors)만 실패로 보고, 전송 오류(타임아웃 등)·5xx 응답 청크는
+        이미 생성됐을 수 있으므로 결과 불명으로 돌려준다 (개별 재생성하면 중복).
+        """
+        keys: List[Optional[str]] = []
+        unknown: Set[int] = set()
+        for start in range(0, len(payloads), BULK_CREATE_LIMIT):
+            chunk = payloads[start:start + BULK_CREATE_LIMIT]
+            chunk_keys: List[Optional[str]] = [None] * len(chunk)
+            try:
+                response = http.post(
+                    f"{self.jira_url}/rest/api/3/issue/bulk",
+                    headers=self.headers,
+                    json={"issueUpdates": chunk}
+                )
+                try:
+                    data = response.json()
+                except ValueError:
+                    data = {}
+                if response.status_code >= 500 and not data.get("errors"):
+                    print(f"  ✗ 일괄 생성 결과 불명: {response.status_code} {response.text[:200]}")
+                    unknown.update(range(start, start + len(chunk)))
+                elif response.status_code not in (200, 201) and not data.get("errors"):
+                    print(f"  ✗ 일괄 생성 실패: {response.status_code} {response.text[:200]}")
+                else:
+                    # issues는 성공한 요소만 입력 순서대로 담기므로 실패 인덱스를 건너뛰며 매칭
+                    errors = data.get("errors", [])
+                    failed = {e.get("failedElementNumber") for e in errors}
+                    created = iter(data.get("issues", []))
+                    for i in range(len(chunk)):
+                        if i in failed:
+                            continue
+                        issue = next(created, None)
+                        if issue:
+                            chunk_keys[i] = issue["key"]
+                    for e in errors:
+                        detail = e.get("elementErrors", {}).get("errors") or e.get("elementErrors")
+                        print(f"  ⚠ 일괄 생성 요소 실패 #{start + e.get('failedElementNumber', 0)}: {detail}")
+            except Exception as e:
+                print(f"  ✗ 일괄 생성 결과 불명 (전송 오류): {str(e)}")
+                unknown.update(range(start, start + len(chunk)))
+            keys.extend(chunk_keys)
+        return keys, unknown
+
     def load_existing_mapping(self, mapping_file: str) -> None:
         """기존 매핑 파일 로드 (중복 이슈 생성 방지)."""
         if not os.path.exists(mapping_file):
             return
-        try:
-            with open(mapping_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            for k, v in data.items():
-                if not k.startswith('_') and isinstance(v, str):
-                    self.mapping[k] = v
-            print(f"기존 매핑 로드: {len(self.mapping)}개 항목 (재실행 시 중복 생성 스킵)")
-        except Exception as e:
-            print(f"매핑 파일 로드 실패 (무시): {e}")
+        for k, v in session.load_mapping(mapping_file).items():
+            if not k.startswith('_') and isinstance(v, str):
+                self.mapping[k] = v
+        print(f"기존 매핑 로드: {len(self.mapping)}개 항목 (재실행 시 중복 생성 스킵)")
 
-    def run(self):
-        """백로그 파싱 및 JIRA 이슈 생성 실행"""
-        print("=" * 60)
-        print("JIRA 백로그 문서 파싱 및 자동 이슈 생성")
-        print("=" * 60)
-        print(f"프로젝트: {self.project_key}")
-        print(f"백로그 파일: {self.backlog_file}")
-        print()
+    def create_all(self, epics: List[Dict], stories: List[Dict], tasks: List[Dict],
+                   concurrency: int = http.DEFAULT_CONCURRENCY) -> None:
+        """
+        이슈를 의존성 순서대로 흘려보내며 생성 (링크도 건별 호출).
+        Epic 키가 정해지는 즉시 그 Story 들을, Story 키가 정해지는 즉시 그 Task 들을 제출하고
+        최대 concurrency 건을 동시에 처리한다 → 소요 시간이 이슈 수가 아닌 계층 깊이 × 응답 지연에 가깝다.
+        """
+        print(f"이슈 생성 중 (Epic → Story → Task, 동시 {max(1, concurrency)}건)...")
+        asyncio.run(self._create_pipeline(epics, stories, tasks, max(1, concurrency)))
 
-        mapping_file = ".github/jira-mapping.json"
-        # 기존 매핑 로드 (중복 일정/이슈 방지)
-        self.load_existing_mapping(mapping_file)
-        print()
+    async def _create_pipeline(self, epics: List[Dict], stories: List[Dict], tasks: List[Dict],
+                               concurrency: int) -> None:
+        # 부모 ID -> 자식 목록 (Task 마다 Story 목록을 훑지 않도록)
+        stories_by_epic: Dict[str, List[Dict]] = {}
+        for story in stories:
+            stories_by_epic.setdefault(story['epic_id'], []).append(story)
+        tasks_by_story: Dict[str, List[Dict]] = {}
+        for task in tasks:
+            tasks_by_story.setdefault(task['story_id'], []).append(task)
 
-        # 백로그 파싱
-        print("백로그 문서 파싱 중...")
-        epics, stories, tasks = self.parse_backlog()
-        print(f"파싱 완료: Epic {len(epics)}개, Story {len(stories)}개, Task {len(tasks)}개")
-        print()
+        semaphore = asyncio.Semaphore(concurrency)
+        loop = asyncio.get_running_loop()
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            async def call(fn, *args):
+                # 동시 실행 수는 HTTP 호출 구간에만 적용 (자식 대기 중에는 슬롯을 잡지 않음)
+                async with semaphore:
+                    return await loop.run_in_executor(executor, fn, *args)
+
+            async def run_task(task: Dict, story_key: str, epic_key: str) -> None:
+                if task['id'] in self.mapping:
+                    print(f"    ⊘ Task 스킵 (기존 이슈): {task['id']} -> {self.mapping[task['id']]}")
+                    return
+                task_key = await call(self.create_task, task, story_key, epic_key)
+                if task_key:
+                    self.mapping[task['id']] = task_key
+
+            async def run_story(story: Dict, epic_key: Optional[str]) -> None:
+                story_key = None
+                if not epic_key:
+                    print(f"  ✗ Story 생성 실패: {story['id']} - Epic {story['epic_id']}를 찾을 수 없음")
+                elif story['id'] in self.mapping:
+                    story_key = self.mapping[story['id']]
+                    print(f"  ⊘ Story 스킵 (기존 이슈): {story['id']} -> {story_key}")
+                else:
+                    story_key = await call(self.create_story, story, epic_key)
+                    if story_key:
+                        self.mapping[story['id']] = story_key
+                children = tasks_by_story.pop(story['id'], [])
+                if not story_key:
+                    for task in children:
+                        print(f"    ✗ Task 생성 실패: {task['id']} - Story {story['id']}를 찾을 수 없음")
+                    return
+                await asyncio.gather(*(run_task(task, story_key, epic_key) for task in children))
+
+            async def run_epic(epic: Dict) -> None:
+                if epic['id'] in self.mapping:
+                    epic_key = self.mapping[epic['id']]
+                    print(f"  ⊘ Epic 스킵 (기존 이슈): {epic['id']} -> {epic_key}")
+                else:
+                    epic_key = await call(self.create_epic, epic)
+                    if epic_key:
+                        self.mapping[epic['id']] = epic_key
+                if epic_key:
+                    self.epic_keys[epic['id']] = epic_key
+                await asyncio.gather(*(run_story(story, epic_key) for story in stories_by_epic.pop(epic['id'], [])))
+
+            await asyncio.gather(*(run_epic(epic) for epic in epics))
+
+        # Epic/Story 목록에 없는 부모를 가리키는 항목
+        for orphans in stories_by_epic.values():
+            for story in orphans:
+                print(f"  ✗ Story 생성 실패: {story['id']} - Epic {story['epic_id']}를 찾을 수 없음")
+        for orphans in tasks_by_story.values():
+            for task in orphans:
+                print(f"    ✗ Task 생성 실패: {task['id']} - Story {task['story_id']}를 찾을 수 없음")
 
-        # Epic: 이미 매핑에 있으면 생성 스킵
-        print("Epic 생성 중...")
+    def create_all_bulk(self, epics: List[Dict], stories: List[Dict], tasks: List[Dict],
+                        link_tasks: bool = True) -> None:
+        """
+        계층별 일괄 생성. Story는 parent 필드로 Epic에 바로 연결.
+        Task는 기본 모드처럼 Story와 Relates 링크로 연결하되 링크를 생성 본문에 넣어 별도 호출이 없고,
+        link_tasks=False 이면 링크 대신 parent 필드로 Epic 직속 생성.
+        """
+        # Epic
+        print("Epic 일괄 생성 중...")
+        pending = []
         for epic in epics:
             if epic['id'] in self.mapping:
-                epic_key = self.mapping[epic['id']]
-                self.epic_keys[epic['id']] = epic_key
-                print(f"  ⊘ Epic 스킵 (기존 이슈): {epic['id']} -> {epic_key}")
-                continue
-            epic_key = self.create_epic(epic)
+                self.epic_keys[epic['id']] = self.mapping[epic['id']]
+                print(f"  ⊘ Epic 스킵 (기존 이슈): {epic['id']} -> {self.mapping[epic['id']]}")
+            else:
+                pending.append(epic)
+        uncertain: List[str] = []
+        keys, unknown = self.bulk_create_issues([self.build_epic_payload(e) for e in pending])
+        for i, (epic, epic_key) in enumerate(zip(pending, keys)):
+            if epic_key:
+                print(f"✓ Epic 생성 성공: {epic['id']} -> {epic_key} ({epic['name']})")
+            elif i in unknown:
+                uncertain.append(epic['id'])
+            else:
+                epic_key = self.create_epic(epic)  # 실패 요소는 개별 재시도
             if epic_key:
                 self.epic_keys[epic['id']] = epic_key
                 self.mapping[epic['id']] = epic_key
 
         print()
 
-        # Story: 이미 매핑에 있으면 생성 스킵
-        print("Story 생성 중...")
-        story_keys = {}
+        # Story
+        print("Story 일괄 생성 중...")
+        story_keys: Dict[str, str] = {}
+        story_epic: Dict[str, str] = {}
+        pending = []
         for story in stories:
-            epic_id = story['epic_id']
-            epic_key = self.epic_keys.get(epic_id)
-
+            epic_key = self.epic_keys.get(story['epic_id'])
             if not epic_key:
-                print(f"  ✗ Story 생성 실패: {story['id']} - Epic {epic_id}를 찾을 수 없음")
+                print(f"  ✗ Story 생성 실패: {story['id']} - Epic {story['epic_id']}를 찾을 수 없음")
                 continue
-
+            story_epic[story['id']] = epic_key
             if story['id'] in self.mapping:
-                story_key = self.mapping[story['id']]
-                story_keys[story['id']] = story_key
-                print(f"  ⊘ Story 스킵 (기존 이슈): {story['id']} -> {story_key}")
-                continue
-
-            story_key = self.create_story(story, epic_key)
+                story_keys[story['id']] = self.mapping[story['id']]
+                print(f"  ⊘ Story 스킵 (기존 이슈): {story['id']} -> {self.mapping[story['id']]}")
+            else:
+                pending.append(story)
+        keys, unknown = self.bulk_create_issues(
+            [self.build_story_payload(s, story_epic[s['id']]) for s in pending]
+        )
+        for i, (story, story_key) in enumerate(zip(pending, keys)):
+            if story_key:
+                print(f"  ✓ Story 생성 성공: {story['id']} -> {story_key} ({story['title']})")
+            elif i in unknown:
+                uncertain.append(story['id'])
+            else:
+                story_key = self.create_story(story, story_epic[story['id']])
             if story_key:
                 story_keys[story['id']] = story_key
                 self.mapping[story['id']] = story_key
 
         print()
 
-        # Task: 이미 매핑에 있으면 생성 스킵
-        print("Task 생성 중...")
-        for task in tasks:
-            story_id = task['story_id']
-            story_key = story_keys.get(story_id)
+        # Task: Next-Gen에서는 Story가 부모가 될 수 없으므로 Story 링크 (link_tasks=False 이면 Epic 직속)
+        def task_payload(task: Dict) -> Dict:
+            if link_tasks:
+                return self.build_task_payload(task, story_key=story_keys[task['story_id']])
+            return self.build_task_payload(task, story_epic.get(task['story_id']))
 
+        print("Task 일괄 생성 중...")
+        pending = []
+        for task in tasks:
+            story_key = story_keys.get(task['story_id'])
             if not story_key:
-                print(f"    ✗ Task 생성 실패: {task['id']} - Story {story_id}를 찾을 수 없음")
+                print(f"    ✗ Task 생성 실패: {task['id']} - Story {task['story_id']}를 찾을 수 없음")
                 continue
-
             if task['id'] in self.mapping:
                 print(f"    ⊘ Task 스킵 (기존 이슈): {task['id']} -> {self.mapping[task['id']]}")
                 continue
+            pending.append(task)
+        keys, unknown = self.bulk_create_issues(
+            [task_payload(t) for t in pending]
+        )
+        for i, (task, task_key) in enumerate(zip(pending, keys)):
+            story_key = story_keys[task['story_id']]
+            if task_key:
+                print(f"    ✓ Task 생성 성공: {task['id']} -> {task_key} ({task['description'][:50]}...)")
+            elif i in unknown:
+                uncertain.append(task['id'])
+            else:
+                task_key = self.create_task(task, story_key, story_epic.get(task['story_id']))
+            if task_key:
+                self.mapping[task['id']] = task_key
 
-            # Story의 Epic 찾기
-            epic_id = None
-            for story in stories:
-                if story['id'] == story_id:
-                    epic_id = story['epic_id']
-                    break
+        if uncertain:
+            # 개별 재생성하면 중복될 수 있으므로 매핑에 넣지 않고 다음 실행으로 넘김
+            print()
+            print(f"⚠ 생성 결과를 알 수 없는 항목 {len(uncertain)}개 (개별 생성 안 함): {', '.join(uncertain)}")
+            print("  JIRA에서 생성 여부를 확인해 .github/jira-mapping.json 에 추가한 뒤 재실행하세요 (없으면 그대로 재실행).")
 
-            epic_key = self.epic_keys.get(epic_id) if epic_id else None
+    def run(self, bulk: bool = False, link_tasks: bool = True,
+            concurrency: int = http.DEFAULT_CONCURRENCY):
+        """백로그 파싱 및 JIRA 이슈 생성 실행"""
+        print("=" * 60)
+        print("JIRA 백로그 문서 파싱 및 자동 이슈 생성")
+        print("=" * 60)
+        print(f"프로젝트: {self.project_key}")
+        print(f"백로그 파일: {self.backlog_file}")
+        print()
 
-            task_key = self.create_task(task, story_key, epic_key)
-            if task_key:
-                self.mapping[task['id']] = task_key
+        mapping_file = ".github/jira-mapping.json"
+        # 기존 매핑 로드 (중복 일정/이슈 방지)
+        self.load_existing_mapping(mapping_file)
+        print()
+
+        # 백로그 파싱
+        print("백로그 문서 파싱 중...")
+        epics, stories, tasks = self.parse_backlog()
+        print(f"파싱 완료: Epic {len(epics)}개, Story {len(stories)}개, Task {len(tasks)}개")
+        print()
+
+        if bulk:
+            self.create_all_bulk(epics, stories, tasks, link_tasks=link_tasks)
+        else:
+            self.create_all(epics, stories, tasks, concurrency=concurrency)
 
         print()
         # 매핑 파일 저장 (기존 + 신규 병합)
@@ -663,6 +777,12 @@ def main():
     parser.add_argument('--backend-assignee-email', help='백엔드 담당자 이메일', default=os.getenv('JIRA_EMAIL'))
     parser.add_argument('--frontend-assignee-account-id', help='프론트엔드 담당자 Account ID', 
                        default='557058:e1565656-70eb-4dcb-ac30-a2880e81a8db')  # 홍지운
+    parser.add_argument('--bulk', action='store_true',
+                       help='bulk create API로 계층별 일괄 생성 (요청당 최대 50건)')
+    parser.add_argument('--bulk-no-link-tasks', action='store_true',
+                       help='--bulk 사용 시 Task-Story Relates 링크 대신 Task를 Epic 직속으로 생성 (이슈 구조가 기본 모드와 달라짐)')
+    parser.add_argument('--concurrency', type=int, default=http.DEFAULT_CONCURRENCY,
+                       help='기본 모드 동시 생성 수 (기본 %(default)s)')
     
     args = parser.parse_args()
     
@@ -693,7 +813,7 @@ def main():
         frontend_assignee_account_id=args.frontend_assignee_account_id
     )
     
-    importer.run()
+    importer.run(bulk=args.bulk, link_tasks=not args.bulk_no_link_tasks, concurrency=args.concurrency)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JIRA 스크립트 종단 벤치마크 (가짜 JIRA 서버 + 합성 데이터, 요청 수·시간·메모리 예산 검사).
+
+규모(이슈 수)마다 임시 디렉터리에 프로젝트 사본(스크립트, 설정, jiralib.synthetic 의 백로그·Kotlin 소스)을 만들고
+가짜 JIRA 서버(jira-fake-server.py)를 별도 프로세스로 띄운 뒤 아래 단계를 실제 스크립트 그대로 서브프로세스로 실행한다.
+    import        jira-backlog-importer.py           기본 모드(동시 생성 + Epic 연결 시도) 생성
+    import-rerun  jira-backlog-importer.py           같은 백로그 재실행 (매핑에 있는 항목은 건너뛰므로 요청 0)
+    import-bulk   jira-backlog-importer.py --bulk    이슈·매핑을 지우고 bulk API 로 다시 생성 (기본 모드와 같은 계층·링크)
+    report        jira-generate-report.py            전체 이슈 조회 후 보고서
+    set-dates     jira-set-dates.py                  백로그 주차 -> duedate
+    dates-rerun   jira-set-dates.py                  같은 일정 재실행 (현재 값과 같으면 PUT 없이 일괄 검색만)
+    verify        jira-verify-code-strict.py         스냅샷 작업 전체 코드 검증 (HTTP 없음)
+    transition    jira-transition-issues.py          모든 작업 완료 전환
+    epics-done    jira-transition-epics-done-if-children-done.py  스냅샷 작업->에픽 매핑의 모든 에픽 완료 전환
+단계마다 벽시계 시간, 가짜 서버가 받은 HTTP 요청 수, 서브프로세스 최대 RSS 를 재고
+체크인된 예산(.github/jira-benchmark-budgets.json)을 넘으면 종료 코드 1.
+요청 수는 결정적이므로 그대로 비교한다 (N+1 호출이 다시 생기면 바로 드러난다).
+레이트 리미터는 끄고(JIRA_RATE_LIMIT=0) 코드 자체의 비용만 잰다.
+Linux 는 exec 전 메모리 최고치를 자식의 ru_maxrss 에 남기므로, 단계 실행은 시작 직후 띄운 작은 실행기 프로세스가
+맡고(벤치마크 프로세스가 커져도 자식 RSS 에 섞이지 않음) 가짜 서버도 별도 프로세스로 둔다.
+
+사용법:
+    python3 .github/scripts/jira-benchmark.py                        # 100, 1000, 10000 이슈
+    python3 .github/scripts/jira-benchmark.py --sizes 100,1000 --only import,report
+    python3 .github/scripts/jira-benchmark.py --update-budgets        # 측정값으로 예산 갱신
+    python3 .github/scripts/jira-benchmark.py --check requests,rss_mb # CI: 기계 속도와 무관한 항목만
+"""
+import argparse
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import urllib.request
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from jiralib import backlog, session
+from jiralib.synthetic import SyntheticProject
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+SCRIPTS_DIR = PROJECT_ROOT / ".github" / "scripts"
+REPORTS_DIR = PROJECT_ROOT / "reports" / "backup"
+BUDGET_FILE = PROJECT_ROOT / ".github" / "jira-benchmark-budgets.json"
+DEFAULT_SIZES = (100, 1000, 10000)
+PROJECT_KEY = "GAM"
+
+# 예산 갱신 시 측정값에 더하는 여유 (요청 수는 여유 없음)
+TIME_HEADROOM = 2.0
+TIME_FLOOR = 2.0
+RSS_HEADROOM = 1.3
+
+STORIES_PER_EPIC = 5
+TASKS_PER_STORY = 4
+
+
+def synthetic_project(issues: int) -> SyntheticProject:
+    """이슈(에픽+스토리+작업) 수가 대략 issues 가 되는 합성 프로젝트."""
+    per_epic = 1 + STORIES_PER_EPIC * (1 + TASKS_PER_STORY)
+    epics = max(1, round(issues / per_epic))
+    return SyntheticProject(
+        tasks=epics * STORIES_PER_EPIC * TASKS_PER_STORY,
+        prefix=PROJECT_KEY,
+        stories_per_epic=STORIES_PER_EPIC,
+        tasks_per_story=TASKS_PER_STORY,
+    )
+
+
+def build_workspace(root: Path, issues: int) -> None:
+    """임시 프로젝트: 스크립트 사본(PROJECT_ROOT 가 사본 기준이 되도록) + 합성 입력."""
+    shutil.copytree(SCRIPTS_DIR, root / ".github" / "scripts", ignore=shutil.ignore_patterns("__pycache__"))
+    (root / "reports" / "backup").mkdir(parents=True)
+    for path in REPORTS_DIR.glob("*.py"):
+        shutil.copy2(path, root / "reports" / "backup" / path.name)
+    config = PROJECT_ROOT / ".github" / "jira-config.json"
+    if config.exists():
+        shutil.copy2(config, root / ".github" / "jira-config.json")
+    # 스냅샷·매핑은 단계 실행 결과로 만들어지므로 백로그와 소스만
+    synthetic_project(issues).write(root, jira=False)
+
+
+class FakeServer:
+    """jira-fake-server.py 서브프로세스 (빈 포트) + 제어 엔드포인트 호출."""
+
+    def __init__(self, latency: float):
+        self.proc = subprocess.Popen(
+            [sys.executable, str(SCRIPTS_DIR / "jira-fake-server.py"), "--port", "0", "--empty",
+             "--project", PROJECT_KEY, "--latency", str(latency)],
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+        )
+        line = self.proc.stdout.readline()
+        match = re.search(r"http://\S+", line)
+        if not match:
+            self.stop()
+            raise RuntimeError(f"가짜 JIRA 서버 시작 실패: {line.strip()}")
+        self.url = match.group(0)
+
+    def control(self, name: str, method: str = "GET"):
+        request = urllib.request.Request(f"{self.url}/_fake/{name}", method=method)
+        with urllib.request.urlopen(request, timeout=60) as response:
+            body = response.read()
+        return json.loads(body) if body else None
+
+    def stop(self) -> None:
+        self.proc.terminate()
+        try:
+            self.proc.communicate(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            self.proc.communicate()
+
+
+def write_snapshot(root: Path, issues: List[dict]) -> None:
+    """가짜 서버 이슈 -> jira-backend-issues.json, jira-task-to-epic-mapping.json (refresh 스크립트가 만드는 것과 같은 형식)."""
+    github = root / ".github"
+    (github / "jira-backend-issues.json").write_text(json.dumps(issues, ensure_ascii=False, indent=2), encoding="utf-8")
+    parent = {i["key"]: i["parent"] for i in issues}
+    task_to_epic = {}
+    for i in issues:
+        if i["type"] == "작업" and i["parent"]:
+            task_to_epic[i["key"]] = parent.get(i["parent"]) or i["parent"]
+    # --bulk 로 만든 Task 는 parent 없이 Story 와 Relates 링크만 있으므로
+    # jira-build-task-epic-mapping.py 처럼 백로그 구조(+ 임포터 매핑으로 JIRA 키 변환)에서 에픽을 찾는다
+    mapping = session.load_mapping(str(github / "jira-mapping.json"))
+    doc = backlog.parse((root / "docs" / "jira" / "JIRA_BACKLOG.md").read_text(encoding="utf-8"))
+    for epic in doc.epics:
+        for story in epic.stories:
+            for task in story.tasks:
+                if mapping.get(task.id) and mapping.get(epic.id):
+                    task_to_epic.setdefault(mapping[task.id], mapping[epic.id])
+    (github / "jira-task-to-epic-mapping.json").write_text(
+        json.dumps({"task_to_epic": task_to_epic}, ensure_ascii=False, indent=2), encoding="utf-8"
+    )
+
+
+def _task_keys(issues: List[dict]) -> List[str]:
+    return [i["key"] for i in issues if i["type"] == "작업"]
+
+
+# (단계, 스크립트(작업 디렉터리 기준), 인자 생성기(스냅샷 이슈 목록 -> argv))
+STEPS = [
+    ("import", ".github/scripts/jira-backlog-importer.py", lambda issues: ["--backlog-file", "docs/jira/JIRA_BACKLOG.md"]),
+    ("import-rerun", ".github/scripts/jira-backlog-importer.py", lambda issues: ["--backlog-file", "docs/jira/JIRA_BACKLOG.md"]),
+    ("import-bulk", ".github/scripts/jira-backlog-importer.py",
+     lambda issues: ["--backlog-file", "docs/jira/JIRA_BACKLOG.md", "--bulk"]),
+    ("report", "reports/backup/jira-generate-report.py", lambda issues: ["--output", "reports/benchmark-report.md"]),
+    ("set-dates", ".github/scripts/jira-set-dates.py", lambda issues: []),
+    ("dates-rerun", ".github/scripts/jira-set-dates.py", lambda issues: []),
+    ("verify", ".github/scripts/jira-verify-code-strict.py", lambda issues: ["--all-tasks"]),
+    ("transition", ".github/scripts/jira-transition-issues.py", lambda issues: ["--issues", ",".join(_task_keys(issues))]),
+    ("epics-done", ".github/scripts/jira-transition-epics-done-if-children-done.py", lambda issues: []),
+]
+
+
+# 실행기: 표준 입력의 작업(JSON 한 줄)마다 자식을 띄우고 {exit_code, seconds, maxrss} 한 줄 출력
+RUNNER_CODE = r"""
+import json, os, subprocess, sys, time
+for line in sys.stdin:
+    job = json.loads(line)
+    started = time.perf_counter()
+    with open(job["log"], "w", encoding="utf-8") as log:
+        proc = subprocess.Popen(job["argv"], cwd=job["cwd"], env=job["env"], stdout=log, stderr=subprocess.STDOUT)
+        _, status, rusage = os.wait4(proc.pid, 0)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    print(json.dumps({"exit_code": proc.returncode, "seconds": time.perf_counter() - started,
+                      "maxrss": rusage.ru_maxrss}), flush=True)
+"""
+
+
+class StepRunner:
+    """단계 실행기 프로세스. 벤치마크가 데이터를 읽기 전에 만들어야 한다."""
+
+    def __init__(self):
+        self.proc = subprocess.Popen(
+            [sys.executable, "-c", RUNNER_CODE], stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True
+        )
+
+    def run(self, root: Path, env: Dict[str, str], script: str, argv: List[str], log_path: Path) -> dict:
+        """스크립트 실행 결과 {seconds, rss_mb, exit_code}. 출력은 로그 파일로."""
+        job = {"argv": [sys.executable, script, *argv], "cwd": str(root), "env": env, "log": str(log_path)}
+        self.proc.stdin.write(json.dumps(job) + "\n")
+        self.proc.stdin.flush()
+        result = json.loads(self.proc.stdout.readline())
+        # ru_maxrss: Linux 는 KB, macOS 는 바이트
+        rss_mb = result["maxrss"] / (1024 * 1024 if sys.platform == "darwin" else 1024)
+        return {"seconds": round(result["seconds"], 3), "rss_mb": round(rss_mb, 1), "exit_code": result["exit_code"]}
+
+    def close(self) -> None:
+        self.proc.stdin.close()
+        self.proc.wait()
+
+
+def run_size(runner: StepRunner, issues: int, only: Optional[List[str]], latency: float, keep: bool) -> Dict[str, dict]:
+    """규모 하나의 전체 단계 측정. 앞 단계 결과(이슈·매핑)가 다음 단계 입력이므로 only 여도 앞 단계는 실행한다."""
+    root = Path(tempfile.mkdtemp(prefix=f"jira-bench-{issues}-"))
+    results: Dict[str, dict] = {}
+    try:
+        build_workspace(root, issues)
+        server = FakeServer(latency)
+        try:
+            env = dict(
+                os.environ,
+                JIRA_URL=server.url,
+                JIRA_EMAIL="bench@example.com",
+                JIRA_API_TOKEN="bench",
+                JIRA_RATE_LIMIT="0",
+                JIRA_HTTP_SUMMARY="0",
+                JIRA_METRICS_DIR="",
+                PYTHONDONTWRITEBYTECODE="1",
+            )
+            last = max(i for i, (name, _, _) in enumerate(STEPS) if not only or name in only)
+            snapshot: List[dict] = []
+            for name, script, make_args in STEPS[:last + 1]:
+                if name == "import-bulk":
+                    server.control("clear", "POST")
+                    (root / ".github" / "jira-mapping.json").unlink(missing_ok=True)
+                if name == "verify":
+                    snapshot = server.control("snapshot")
+                    write_snapshot(root, snapshot)
+                server.control("reset", "POST")
+                result = runner.run(root, env, script, make_args(snapshot), root / f"bench-{name}.log")
+                stats = server.control("stats")
+                result["requests"] = stats["total"]
+                result["calls"] = stats["calls"]
+                if not only or name in only:
+                    results[name] = result
+                if result["exit_code"] != 0:
+                    print(f"  ✗ {name} 종료 코드 {result['exit_code']} (로그: {root / f'bench-{name}.log'})", file=sys.stderr)
+                    keep = True
+                    break
+        finally:
+            server.stop()
+    finally:
+        if keep:
+            print(f"  작업 디렉터리 유지: {root}", file=sys.stderr)
+        else:
+            shutil.rmtree(root, ignore_errors=True)
+    return results
+
+
+def load_budgets(path: Path) -> dict:
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+METRICS = {"requests": "건", "seconds": "초", "rss_mb": "MB"}
+
+
+def check(result: dict, budget: Optional[dict], metrics: List[str]) -> List[str]:
+    """예산 초과 항목 설명 목록 (예산이 없으면 빈 목록)."""
+    if not budget:
+        return []
+    over = []
+    if result["exit_code"] != 0:
+        over.append(f"종료 코드 {result['exit_code']}")
+    for metric in metrics:
+        unit = METRICS[metric]
+        limit = budget.get(metric)
+        if limit is not None and result[metric] > limit:
+            over.append(f"{metric} {result[metric]}{unit} > 예산 {limit}{unit}")
+    return over
+
+
+def budget_from(result: dict) -> dict:
+    return {
+        "requests": result["requests"],
+        "seconds": round(max(TIME_FLOOR, result["seconds"] * TIME_HEADROOM), 1),
+        "rss_mb": round(result["rss_mb"] * RSS_HEADROOM),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JIRA 스크립트 종단 벤치마크 (요청 수·시간·RSS 예산)")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="쉼표 구분 이슈 수")
+    parser.add_argument("--only", help=f"쉼표 구분 단계 ({', '.join(s[0] for s in STEPS)})")
+    parser.add_argument("--budget-file", type=Path, default=BUDGET_FILE)
+    parser.add_argument("--update-budgets", action="store_true", help="측정값(+여유)으로 예산 파일 갱신")
+    parser.add_argument("--check", default=",".join(METRICS),
+                        help="검사할 항목 (기본 전체, 다른 기계에서는 requests,rss_mb 권장)")
+    parser.add_argument("--latency", type=float, default=0.0, help="가짜 서버 요청당 지연(초)")
+    parser.add_argument("--json", type=Path, help="측정 결과 JSON 저장 경로")
+    parser.add_argument("--keep", action="store_true", help="임시 작업 디렉터리 유지")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    only = [s.strip() for s in args.only.split(",")] if args.only else None
+    metrics = [m.strip() for m in args.check.split(",") if m.strip()]
+    unknown = (set(only or []) - {s[0] for s in STEPS}) | (set(metrics) - set(METRICS))
+    if unknown:
+        print(f"❌ 알 수 없는 단계/항목: {', '.join(sorted(unknown))}", file=sys.stderr)
+        sys.exit(2)
+
+    runner = StepRunner()
+    budgets = load_budgets(args.budget_file)
+    measured: Dict[str, Dict[str, dict]] = {}
+    failures: List[str] = []
+    print(f"{'규모':>6}  {'단계':<13} {'시간(s)':>8} {'요청':>7} {'RSS(MB)':>8}  예산")
+    for size in sizes:
+        results = run_size(runner, size, only, args.latency, args.keep)
+        measured[str(size)] = results
+        for name, result in results.items():
+            budget = budgets.get(str(size), {}).get(name)
+            over = [] if args.update_budgets else check(result, budget, metrics)
+            verdict = "없음" if not budget else ("초과: " + "; ".join(over) if over else "OK")
+            print(f"{size:>6}  {name:<13} {result['seconds']:>8.2f} {result['requests']:>7} {result['rss_mb']:>8.1f}  {verdict}")
+            if over:
+                failures.append(f"{size}/{name}: {'; '.join(over)}")
+                top = sorted(result["calls"].items(), key=lambda kv: -kv[1])[:5]
+                for endpoint, n in top:
+                    print(f"{'':>8}{n:>7}  {endpoint}")
+            if result["exit_code"] != 0 and args.update_budgets:
+                failures.append(f"{size}/{name}: 종료 코드 {result['exit_code']}")
+
+    runner.close()
+
+    if args.json:
+        args.json.write_text(json.dumps(measured, ensure_ascii=False, indent=2), encoding="utf-8")
+    if args.update_budgets and not failures:
+        for size, results in measured.items():
+            for name, result in results.items():
+                budgets.setdefault(size, {})[name] = budget_from(result)
+        budgets["_comment"] = (
+            "jira-benchmark.py 예산. requests 는 가짜 서버가 받은 요청 수(정확히 비교), "
+            "seconds/rss_mb 는 측정값에 여유를 둔 상한. 갱신: jira-benchmark.py --update-budgets"
+        )
+        ordered = {"_comment": budgets.pop("_comment")}
+        ordered.update(sorted(budgets.items(), key=lambda kv: int(kv[0])))
+        args.budget_file.write_text(json.dumps(ordered, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"\n예산 갱신: {args.budget_file}")
+    if failures:
+        print("\n❌ 예산 초과:", file=sys.stderr)
+        for line in failures:
+            print(f"  - {line}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,12 +9,17 @@ import re
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+from jiralib import backlog
+from jiralib.titleindex import TitleIndex
+
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 JIRA_ISSUES_FILE = PROJECT_ROOT / ".github" / "jira-backend-issues.json"
 BACKLOG_FILE = PROJECT_ROOT / "docs" / "jira" / "JIRA_BACKLOG.md"
 CODE_VERIFICATION_FILE = PROJECT_ROOT / ".github" / "code-completion-verification.json"
 OUTPUT_MAPPING = PROJECT_ROOT / ".github" / "jira-to-backlog-mapping.json"
 OUTPUT_REPORT = PROJECT_ROOT / "reports" / "jira-mapping-analysis.md"
+STORY_KEY_RE = re.compile(r"GAM-\d+")
+TASK_KEY_RE = re.compile(r"GAM-\d+(?:-\d+)?")
 
 # Epic 구조 (백로그 기준)
 BACKLOG_EPIC_STRUCTURE = {
@@ -31,24 +36,26 @@ def parse_backlog_all() -> Tuple[Dict[str, Dict], Dict[str, Dict]]:
     """백로그에서 Story와 Task 모두 파싱. 키로 접근 가능한 dict 반환."""
     if not BACKLOG_FILE.exists():
         return {}, {}
-    with open(BACKLOG_FILE, "r", encoding="utf-8") as f:
-        content = f.read()
+    doc = backlog.load(str(BACKLOG_FILE))
 
-    # Story 파싱
     stories: Dict[str, Dict] = {}
-    for m in re.finditer(r"### Story (GAM-\d+):\s*(.+)", content):
-        key, title = m.group(1), m.group(2).strip()
-        stories[key] = {"key": key, "title": title, "type": "Story"}
+    for story in doc.stories:
+        if STORY_KEY_RE.fullmatch(story.id):
+            stories[story.id] = {"key": story.id, "title": story.title, "type": "Story"}
 
-    # Task 파싱 (모든 체크리스트)
+    # Task (체크되지 않은 항목)
     tasks: Dict[str, Dict] = {}
-    for m in re.finditer(r"-\s*\[\s*\]\s+(GAM-\d+(?:-\d+)?)\s*:\s*([^\n]+)", content):
-        key, description = m.group(1), m.group(2).strip()
-        tasks[key] = {"key": key, "description": description, "type": "Task"}
+    for task in doc.tasks:
+        if not task.checked and TASK_KEY_RE.fullmatch(task.id):
+            tasks[task.id] = {"key": task.id, "description": task.title, "type": "Task"}
 
     return stories, tasks
 
 
+def _backlog_text(item: Dict) -> str:
+    return item.get("title") or item.get("description", "")
+
+
 def find_correct_epic_for_story(story_key: str) -> str | None:
     """백로그 Story 키로 올바른 Epic 찾기."""
     for epic, children in BACKLOG_EPIC_STRUCTURE.items():
@@ -77,6 +84,7 @@ def main() -> None:
 
     stories, tasks = parse_backlog_all()
     all_backlog_items = {**stories, **tasks}
+    backlog_index = TitleIndex((k, _backlog_text(item)) for k, item in all_backlog_items.items())
 
     with open(CODE_VERIFICATION_FILE, "r", encoding="utf-8") as f:
         code_verification = json.load(f)
@@ -121,14 +129,12 @@ def main() -> None:
                 entry["needs_summary_fix"] = True
                 summary_fixes.append(jira_key)
         else:
-            # summary가 정상 제목인 경우 → 작업 내용으로 백로그 키 추론
-            for bl_key, bl_item in all_backlog_items.items():
-                bl_text = bl_item.get("title") or bl_item.get("description", "")
-                if bl_text and (bl_text in jira_summary or jira_summary in bl_text):
-                    entry["backlog_key"] = bl_key
-                    entry["backlog_title"] = bl_text
-                    entry["summary_correct"] = jira_summary
-                    break
+            # summary가 정상 제목인 경우 → 작업 내용으로 백로그 키 추론 (서로 포함 관계인 첫 항목)
+            bl_key = backlog_index.first_match(jira_summary, within=True)
+            if bl_key:
+                entry["backlog_key"] = bl_key
+                entry["backlog_title"] = _backlog_text(all_backlog_items[bl_key])
+                entry["summary_correct"] = jira_summary
 
         # 백로그 키를 찾았으면 올바른 Epic 계산
         if entry["backlog_key"]:
@@ -9,10 +9,9 @@ import base64
 import json
 import os
 import sys
-import time
 from pathlib import Path
 
-import requests
+from jiralib import workflow
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 MISMATCH_FILE = PROJECT_ROOT / ".github" / "jira-mismatch-issues.json"
@@ -29,20 +28,7 @@ def load_jira_env(paths: list) -> None:
                         os.environ[k.strip()] = v.strip().strip("'\"")
 
 
-def get_transitions(jira_url: str, headers: dict, issue_key: str) -> list:
-    try:
-        r = requests.get(
-            f"{jira_url}/rest/api/3/issue/{issue_key}/transitions",
-            headers=headers,
-            timeout=10,
-        )
-        return r.json().get("transitions", []) if r.status_code == 200 else []
-    except Exception:
-        return []
-
-
-def transition_to_done(jira_url: str, headers: dict, issue_key: str) -> bool:
-    transitions = get_transitions(jira_url, headers, issue_key)
+def find_done_transition_id(transitions: list) -> str | None:
     done_names = ["done", "완료", "complete", "closed", "종료", "resolved", "해결됨"]
     tid = None
     for t in transitions:
@@ -52,14 +38,7 @@ def transition_to_done(jira_url: str, headers: dict, issue_key: str) -> bool:
             break
     if not tid and transitions:
         tid = transitions[0].get("id")
-    if not tid:
-        return False
-    r = requests.post(
-        f"{jira_url}/rest/api/3/issue/{issue_key}/transitions",
-        headers=headers,
-        json={"transition": {"id": tid}},
-    )
-    return r.status_code == 204
+    return tid
 
 
 def main() -> None:
@@ -69,6 +48,12 @@ def main() -> None:
         action="store_true",
         help="실제 전환 없이 대상만 출력",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=workflow.DEFAULT_CONCURRENCY,
+        help="동시 전환 수 (기본 %(default)s)",
+    )
     args = parser.parse_args()
 
     load_jira_env(["docs/jira/jira.env", "jira.env"])
@@ -111,16 +96,21 @@ def main() -> None:
         "Content-Type": "application/json",
     }
 
-    success, fail = 0, 0
-    for issue in mismatch_issues:
-        key = issue["key"]
-        if transition_to_done(jira_url, headers, key):
-            print(f"  ✓ {key} 완료")
-            success += 1
+    def report(result: dict) -> None:
+        if result["ok"]:
+            print(f"  ✓ {result['key']} → 완료")
         else:
-            print(f"  ✗ {key} 전환 실패")
-            fail += 1
-        time.sleep(0.4)
+            print(f"  ✗ {result['key']} 전환 실패 ({result['error']})")
+
+    results = workflow.transition_many(
+        jira_url,
+        headers,
+        [(issue["key"], find_done_transition_id) for issue in mismatch_issues],
+        concurrency=args.concurrency,
+        on_result=report,
+    )
+    success = sum(1 for r in results if r["ok"])
+    fail = len(results) - success
 
     print(f"\n완료: 성공 {success}개, 실패 {fail}개.")
 
@@ -8,8 +8,7 @@ import os
 import sys
 import argparse
 import base64
-import time
-import requests
+from jiralib.issues import fetch_issue_statuses
 from typing import List, Tuple
 
 # 백엔드 1주차: 에픽·스토리만 (JIRA에 키가 존재하는 항목)
@@ -25,27 +24,6 @@ def is_done(status_name: str) -> bool:
     return any(d in s for d in DONE_NAMES)
 
 
-def fetch_issue(jira_url: str, headers: dict, key: str) -> Tuple[str, str, str]:
-    """(key, summary, status_name) 반환. 없으면 (key, '', '')"""
-    try:
-        r = requests.get(
-            f"{jira_url}/rest/api/3/issue/{key}",
-            headers=headers,
-            params={"fields": "key,summary,status"},
-        )
-        if r.status_code != 200:
-            return (key, "", "")
-        d = r.json()
-        key = d.get("key", key)
-        fields = d.get("fields", {})
-        summary = (fields.get("summary") or "").strip()
-        status = fields.get("status") or {}
-        status_name = (status.get("name") or "").strip()
-        return (key, summary, status_name)
-    except Exception:
-        return (key, "", "")
-
-
 def main():
     parser = argparse.ArgumentParser(description="백엔드 1주차 JIRA 완료/미완료 확인")
     parser.add_argument("--jira-url", default=os.getenv("JIRA_URL"))
@@ -68,9 +46,10 @@ def main():
     print("백엔드 1주차(Week 1) JIRA 상태 조회 중...")
     done_list: List[Tuple[str, str, str]] = []
     not_done_list: List[Tuple[str, str, str]] = []
+    statuses = fetch_issue_statuses(jira_url, headers, BACKEND_WEEK1_KEYS)
     for key in BACKEND_WEEK1_KEYS:
-        k, summary, status_name = fetch_issue(jira_url, headers, key)
-        time.sleep(0.25)
+        info = statuses.get(key, {})
+        k, summary, status_name = key, info.get("summary", ""), info.get("status", "")
         if not status_name:
             not_done_list.append((k, summary or "(조회 실패)", status_name or "?"))
             continue
@@ -9,7 +9,7 @@ import json
 import sys
 import argparse
 import base64
-import requests
+from jiralib import http
 from typing import List, Set
 from pathlib import Path
 
@@ -49,7 +49,7 @@ class JiraCleanupOldIssues:
             }
             
             try:
-                response = requests.get(url, headers=self.headers, params=params)
+                response = http.get(url, headers=self.headers, params=params)
                 
                 if response.status_code != 200:
                     print(f"✗ 이슈 조회 실패: {response.status_code} {response.text}")
@@ -89,7 +89,7 @@ class JiraCleanupOldIssues:
         """이슈 삭제"""
         try:
             # 먼저 이슈 정보 조회
-            response = requests.get(
+            response = http.get(
                 f"{self.jira_url}/rest/api/3/issue/{issue_key}",
                 headers=self.headers
             )
@@ -103,7 +103,7 @@ class JiraCleanupOldIssues:
             issue_type = issue_data['fields']['issuetype']['name']
             
             # 이슈 삭제
-            response = requests.delete(
+            response = http.delete(
                 f"{self.jira_url}/rest/api/3/issue/{issue_key}",
                 headers=self.headers,
                 params={"deleteSubtasks": "true"}  # 하위 작업도 함께 삭제
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JIRA 스크립트 통합 진입점. 여러 명령을 `+` 로 이어 한 프로세스에서 실행한다.
+
+명령마다 인터프리터를 새로 띄우지 않으므로 jira.env·인증 정보, HTTP 커넥션 풀, 레이트 리미터,
+매핑/백로그 파싱 결과, 코드 인덱스, 전환 캐시를 명령 사이에 그대로 공유한다 (jiralib.session).
+
+사용법:
+    python3 .github/scripts/jira-cli.py <명령> [인자...] [+ <명령> [인자...]]...
+    python3 .github/scripts/jira-cli.py refresh + verify + report --output reports/report-latest.md
+    python3 .github/scripts/jira-cli.py --list
+
+명령은 별칭(--list) 또는 .github/scripts/jira-<명령>.py 파일 이름. 인자는 해당 스크립트에 그대로 전달된다.
+한 명령이 0 이 아닌 코드로 끝나면 나머지는 실행하지 않는다 (--keep-going 이면 계속).
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+from jiralib import session
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+SCRIPTS_DIR = Path(__file__).resolve().parent
+REPORTS_DIR = PROJECT_ROOT / "reports" / "backup"
+
+COMMANDS = {
+    "import": SCRIPTS_DIR / "jira-backlog-importer.py",
+    "refresh": SCRIPTS_DIR / "jira-refresh-issues.py",
+    "verify": SCRIPTS_DIR / "jira-verify-code-strict.py",
+    "verify-completion": SCRIPTS_DIR / "jira-verify-code-completion.py",
+    "transition": SCRIPTS_DIR / "jira-transition-issues.py",
+    "set-dates": SCRIPTS_DIR / "jira-set-dates.py",
+    "assign": SCRIPTS_DIR / "jira-set-assignees.py",
+    "fix-summaries": SCRIPTS_DIR / "jira-fix-summaries.py",
+    "update-from-commit": SCRIPTS_DIR / "jira-update-from-commit.py",
+    "report": REPORTS_DIR / "jira-generate-report.py",
+    "report-if-needed": REPORTS_DIR / "jira-report-if-needed.py",
+}
+SEPARATOR = "+"
+
+
+def resolve_command(name: str) -> Path:
+    """별칭 -> 스크립트, 없으면 jira-<name>.py."""
+    if name in COMMANDS:
+        return COMMANDS[name]
+    path = SCRIPTS_DIR / f"jira-{name}.py"
+    if path.is_file() and path != Path(__file__).resolve():
+        return path
+    raise KeyError(name)
+
+
+def split_chain(args: list) -> list:
+    """['a', '-x', '+', 'b'] -> [['a', '-x'], ['b']] (빈 단계는 버림)."""
+    chain, current = [], []
+    for arg in args:
+        if arg == SEPARATOR:
+            if current:
+                chain.append(current)
+            current = []
+        else:
+            current.append(arg)
+    if current:
+        chain.append(current)
+    return chain
+
+
+def print_commands() -> None:
+    print("별칭:")
+    for name, path in COMMANDS.items():
+        print(f"  {name:<20} {path.relative_to(PROJECT_ROOT)}")
+    print("\n그 외 (jira-<명령>.py):")
+    for path in sorted(SCRIPTS_DIR.glob("jira-*.py")):
+        name = path.stem[len("jira-"):]
+        if path != Path(__file__).resolve() and path not in COMMANDS.values():
+            print(f"  {name}")
+
+
+def main() -> int:
+    args = sys.argv[1:]
+    keep_going = False
+    while args and args[0].startswith("--"):
+        option = args.pop(0)
+        if option == "--list":
+            print_commands()
+            return 0
+        if option == "--keep-going":
+            keep_going = True
+        else:
+            print(f"알 수 없는 옵션: {option}", file=sys.stderr)
+            return 2
+
+    chain = split_chain(args)
+    if not chain:
+        print(__doc__.strip(), file=sys.stderr)
+        return 2
+    try:
+        steps = [(resolve_command(name), name, rest) for name, *rest in chain]
+    except KeyError as e:
+        print(f"알 수 없는 명령: {e.args[0]} (--list 로 목록 확인)", file=sys.stderr)
+        return 2
+
+    # 스크립트들은 프로젝트 루트 기준 상대 경로를 기본값으로 쓴다
+    os.chdir(PROJECT_ROOT)
+    session.load_env()
+
+    failed = 0
+    started = time.perf_counter()
+    for path, name, rest in steps:
+        print(f"▶ {name} {' '.join(rest)}".rstrip(), file=sys.stderr)
+        step_started = time.perf_counter()
+        try:
+            code = session.run_script(str(path), rest)
+        except Exception as e:
+            print(f"✗ {name} 오류: {e}", file=sys.stderr)
+            code = 1
+        elapsed = time.perf_counter() - step_started
+        sys.stdout.flush()
+        if code == 0:
+            print(f"✓ {name} ({elapsed:.1f}초)", file=sys.stderr)
+            continue
+        print(f"✗ {name} 종료 코드 {code} ({elapsed:.1f}초)", file=sys.stderr)
+        failed = failed or code
+        if not keep_going:
+            break
+    print(f"전체 {time.perf_counter() - started:.1f}초", file=sys.stderr)
+    return failed
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,28 +8,15 @@ import re
 import sys
 import argparse
 import base64
-import requests
-from typing import List, Optional
+from jiralib import http, workflow
+from typing import Optional
 
-def get_available_transitions(jira_url: str, headers: dict, issue_key: str) -> List[dict]:
-    """이슈의 가능한 상태 전환 목록 조회"""
-    try:
-        url = f"{jira_url}/rest/api/3/issue/{issue_key}/transitions"
-        response = requests.get(url, headers=headers)
-        
-        if response.status_code == 200:
-            data = response.json()
-            return data.get('transitions', [])
-        else:
-            return []
-    except:
-        return []
 
 def transition_issue(jira_url: str, headers: dict, issue_key: str, transition_name: str) -> bool:
     """이슈 상태 전환"""
     try:
         # 먼저 가능한 전환 목록 조회
-        transitions = get_available_transitions(jira_url, headers, issue_key)
+        transitions = workflow.get_transitions(jira_url, headers, issue_key)
         
         # 취소 관련 상태 찾기 (한국어/영어 모두 확인)
         cancel_transitions = ['취소', 'Cancel', 'Done', '완료', 'Closed', '종료', 'Resolved']
@@ -50,18 +37,8 @@ def transition_issue(jira_url: str, headers: dict, issue_key: str, transition_na
             return False
         
         # 상태 전환 실행
-        url = f"{jira_url}/rest/api/3/issue/{issue_key}/transitions"
-        payload = {
-            "transition": {"id": transition_id}
-        }
-        
-        response = requests.post(url, headers=headers, json=payload)
-        
-        if response.status_code == 204:
-            return True
-        else:
-            return False
-            
+        return workflow.post_transition(jira_url, headers, issue_key, transition_id)
+
     except Exception as e:
         return False
 
@@ -105,7 +82,7 @@ def close_old_issues(jira_url: str, jira_email: str, jira_api_token: str,
             payload["nextPageToken"] = next_page_token
         
         try:
-            response = requests.post(url, headers=headers, json=payload)
+            response = http.post(url, headers=headers, json=payload)
             
             if response.status_code != 200:
                 print(f"✗ 이슈 조회 실패: {response.status_code} {response.text}")
@@ -120,7 +97,7 @@ def close_old_issues(jira_url: str, jira_email: str, jira_api_token: str,
             # 각 이슈의 상세 정보 조회
             for issue_id in batch_issue_ids:
                 issue_url = f"{jira_url}/rest/api/3/issue/{issue_id}"
-                issue_response = requests.get(issue_url, headers=headers, params={"fields": "key,summary,issuetype,status"})
+                issue_response = http.get(issue_url, headers=headers, params={"fields": "key,summary,issuetype,status"})
                 
                 if issue_response.status_code == 200:
                     issue_data = issue_response.json()
@@ -179,13 +156,15 @@ def close_old_issues(jira_url: str, jira_email: str, jira_api_token: str,
     
     # 상태 변경 실행
     print("\n이슈 상태 변경 중...")
-    print("(처리 중... API rate limit을 피하기 위해 각 요청 사이에 지연 시간이 있습니다)")
+    print("(처리 중... 요청 속도는 공용 레이트 리미터가 JIRA 응답에 맞춰 조절합니다)")
     closed_count = 0
     failed_count = 0
     skipped_count = 0
-    
-    import time
-    
+
+    # 조회 단계에서 얻은 유형·상태로 전환 캐시 사용 (이슈당 POST 1회)
+    for issue in issues_to_close:
+        workflow.remember(issue['key'], issue['type'], issue['status'])
+
     for idx, issue in enumerate(issues_to_close, 1):
         issue_key = issue['key']
         
@@ -220,7 +199,7 @@ def close_old_issues(jira_url: str, jira_email: str, jira_api_token: str,
                     }
                 }
                 
-                comment_response = requests.post(comment_url, headers=headers, json=comment_payload)
+                comment_response = http.post(comment_url, headers=headers, json=comment_payload)
                 
                 if comment_response.status_code == 201:
                     if idx % 10 == 0:
@@ -229,14 +208,10 @@ def close_old_issues(jira_url: str, jira_email: str, jira_api_token: str,
                 else:
                     print(f"  ✗ 처리 실패: {issue_key} - 상태 변경 및 댓글 추가 모두 실패")
                     failed_count += 1
-            
-            # API rate limit 방지를 위한 지연 (요청당 0.5초)
-            time.sleep(0.5)
-                
+
         except Exception as e:
             print(f"  ✗ 처리 오류: {issue_key} - {str(e)}")
             failed_count += 1
-            time.sleep(0.5)
     
     print("\n" + "=" * 60)
     print("처리 완료!")
@@ -10,8 +10,7 @@ import sys
 import json
 import argparse
 import base64
-import time
-import requests
+from jiralib import http, workflow
 from pathlib import Path
 from typing import Set, List, Dict
 
@@ -37,17 +36,9 @@ def load_canonical_keys(mapping_file: str, backend_backlog_path: str) -> Set[str
     return canonical
 
 
-def get_available_transitions(jira_url: str, headers: dict, issue_key: str) -> List[dict]:
-    try:
-        r = requests.get(f"{jira_url}/rest/api/3/issue/{issue_key}/transitions", headers=headers)
-        return r.json().get('transitions', []) if r.status_code == 200 else []
-    except Exception:
-        return []
-
-
 def transition_to_cancel(jira_url: str, headers: dict, issue_key: str) -> bool:
     """이슈를 취소/완료/종료 등으로 전환."""
-    transitions = get_available_transitions(jira_url, headers, issue_key)
+    transitions = workflow.get_transitions(jira_url, headers, issue_key)
     cancel_names = ['취소', 'Cancel', 'Done', '완료', 'Closed', '종료', 'Resolved', '해결됨']
     tid = None
     for t in transitions:
@@ -59,12 +50,7 @@ def transition_to_cancel(jira_url: str, headers: dict, issue_key: str) -> bool:
         tid = transitions[0].get('id')
     if not tid:
         return False
-    r = requests.post(
-        f"{jira_url}/rest/api/3/issue/{issue_key}/transitions",
-        headers=headers,
-        json={"transition": {"id": tid}}
-    )
-    return r.status_code == 204
+    return workflow.post_transition(jira_url, headers, issue_key, tid)
 
 
 def fetch_all_issue_keys(jira_url: str, headers: dict, project_key: str) -> List[Dict]:
@@ -77,7 +63,7 @@ def fetch_all_issue_keys(jira_url: str, headers: dict, project_key: str) -> List
         payload = {"jql": f"project = {project_key} ORDER BY key ASC", "maxResults": max_results}
         if next_token:
             payload["nextPageToken"] = next_token
-        r = requests.post(url, headers=headers, json=payload)
+        r = http.post(url, headers=headers, json=payload)
         if r.status_code != 200:
             break
         data = r.json()
@@ -89,7 +75,7 @@ def fetch_all_issue_keys(jira_url: str, headers: dict, project_key: str) -> List
             status_obj = fields.get('status')
             status = status_obj.get('name', '') if isinstance(status_obj, dict) else str(status_obj or '')
             if not key and issue_id:
-                dr = requests.get(
+                dr = http.get(
                     f"{jira_url}/rest/api/3/issue/{issue_id}",
                     headers=headers,
                     params={"fields": "key,status"},
@@ -100,11 +86,9 @@ def fetch_all_issue_keys(jira_url: str, headers: dict, project_key: str) -> List
                     st = (d.get('fields') or {}).get('status')
                     status = st.get('name', '') if isinstance(st, dict) else ''
             out.append({"key": key, "status": status})
-            time.sleep(0.2)
         next_token = data.get('nextPageToken')
         if not next_token or data.get('isLast'):
             break
-        time.sleep(0.3)
     return out
 
 
@@ -157,6 +141,7 @@ def run(
         return
 
     print("\n취소 상태로 전환 중...")
+    workflow.prime(jira_url, headers, [issue['key'] for issue in unmapped])
     ok, fail = 0, 0
     for i, issue in enumerate(unmapped, 1):
         if transition_to_cancel(jira_url, headers, issue['key']):
@@ -166,7 +151,6 @@ def run(
         else:
             fail += 1
             print(f"  ✗ 전환 실패: {issue['key']}")
-        time.sleep(0.3)
     print(f"\n완료: 성공 {ok}개, 실패 {fail}개.")
 
 
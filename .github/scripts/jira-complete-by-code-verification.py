@@ -8,10 +8,9 @@ import base64
 import json
 import os
 import sys
-import time
 from pathlib import Path
 
-import requests
+from jiralib import workflow
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 MAPPING_FILE = PROJECT_ROOT / ".github" / "jira-to-backlog-mapping.json"
@@ -28,21 +27,9 @@ def load_jira_env(paths: list) -> None:
                         os.environ[k.strip()] = v.strip().strip("'\"")
 
 
-def get_transitions(jira_url: str, headers: dict, issue_key: str) -> list:
-    try:
-        r = requests.get(
-            f"{jira_url}/rest/api/3/issue/{issue_key}/transitions",
-            headers=headers,
-            timeout=10,
-        )
-        return r.json().get("transitions", []) if r.status_code == 200 else []
-    except Exception:
-        return []
-
-
 def transition_to_done(jira_url: str, headers: dict, issue_key: str) -> bool:
     """이슈를 Done 상태로 전환."""
-    transitions = get_transitions(jira_url, headers, issue_key)
+    transitions = workflow.get_transitions(jira_url, headers, issue_key)
     done_names = ["done", "완료", "complete", "closed", "종료", "resolved", "해결됨"]
     tid = None
     for t in transitions:
@@ -54,13 +41,7 @@ def transition_to_done(jira_url: str, headers: dict, issue_key: str) -> bool:
         tid = transitions[0].get("id")
     if not tid:
         return False
-    r = requests.post(
-        f"{jira_url}/rest/api/3/issue/{issue_key}/transitions",
-        headers=headers,
-        json={"transition": {"id": tid}},
-        timeout=10,
-    )
-    return r.status_code == 204
+    return workflow.post_transition(jira_url, headers, issue_key, tid)
 
 
 def main() -> None:
@@ -111,6 +92,8 @@ def main() -> None:
         "Content-Type": "application/json",
     }
 
+    workflow.prime(jira_url, headers, [jira_key for jira_key, _ in to_complete])
+
     success, fail = 0, 0
     for jira_key, info in to_complete:
         if transition_to_done(jira_url, headers, jira_key):
@@ -119,7 +102,6 @@ def main() -> None:
         else:
             print(f"  ✗ {jira_key} 전환 실패")
             fail += 1
-        time.sleep(0.4)
 
     print(f"\n완료: 성공 {success}개, 실패 {fail}개")
 
@@ -9,11 +9,10 @@ import json
 import os
 import re
 import sys
-import time
 from pathlib import Path
 from typing import Any, Dict, List, Set
 
-import requests
+from jiralib.issues import fetch_issue_statuses
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 REPORT_FILE = PROJECT_ROOT / "reports" / "report-latest.md"
@@ -78,20 +77,6 @@ def parse_report_backend_sections(path: Path) -> tuple[List[Dict], List[Dict]]:
     return done_list, todo_list
 
 
-def get_issue_status(jira_url: str, headers: dict, issue_key: str) -> str | None:
-    try:
-        r = requests.get(
-            f"{jira_url}/rest/api/3/issue/{issue_key}?fields=status",
-            headers=headers,
-            timeout=10,
-        )
-        if r.status_code != 200:
-            return None
-        return r.json().get("fields", {}).get("status", {}).get("name")
-    except Exception:
-        return None
-
-
 def is_done_status(status_name: str | None) -> bool:
     if not status_name:
         return False
@@ -150,17 +135,21 @@ def main() -> None:
             return True
         return False
 
-    # 1) Report 완료인데 코드 미검증
+    # 1) Report 완료인데 코드 미검증 (JIRA 상태는 대상 키를 한 번에 조회)
+    unverified = [item for item in report_done if not code_verified(item["key"])]
+    statuses = (
+        fetch_issue_statuses(jira_url, headers, [item["key"] for item in unverified])
+        if use_jira
+        else {}
+    )
     report_done_but_no_code: List[Dict] = []
-    for item in report_done:
+    for item in unverified:
         key = item["key"]
-        if not code_verified(key):
-            entry = {"key": key, "title": item["title"], "code_verified": False}
-            if use_jira:
-                time.sleep(0.2)
-                status = get_issue_status(jira_url, headers, key)
-                entry["jira_status"] = status or "(조회실패)"
-            report_done_but_no_code.append(entry)
+        entry = {"key": key, "title": item["title"], "code_verified": False}
+        if use_jira:
+            status = statuses.get(key, {}).get("status")
+            entry["jira_status"] = status or "(조회실패)"
+        report_done_but_no_code.append(entry)
 
     # 2) 코드 검증 완료인데 Report에는 남은 작업
     code_done_but_report_todo: List[Dict] = []
@@ -7,7 +7,7 @@ import re
 import sys
 import argparse
 import base64
-import requests
+from jiralib import http
 from typing import List
 
 def delete_old_issues(jira_url: str, jira_email: str, jira_api_token: str, 
@@ -49,7 +49,7 @@ def delete_old_issues(jira_url: str, jira_email: str, jira_api_token: str,
             payload["nextPageToken"] = next_page_token
         
         try:
-            response = requests.post(url, headers=headers, json=payload)
+            response = http.post(url, headers=headers, json=payload)
             
             if response.status_code != 200:
                 print(f"✗ 이슈 조회 실패: {response.status_code} {response.text}")
@@ -64,7 +64,7 @@ def delete_old_issues(jira_url: str, jira_email: str, jira_api_token: str,
             # 각 이슈의 상세 정보 조회
             for issue_id in batch_issue_ids:
                 issue_url = f"{jira_url}/rest/api/3/issue/{issue_id}"
-                issue_response = requests.get(issue_url, headers=headers, params={"fields": "key,summary,issuetype"})
+                issue_response = http.get(issue_url, headers=headers, params={"fields": "key,summary,issuetype"})
                 
                 if issue_response.status_code == 200:
                     issue_data = issue_response.json()
@@ -129,7 +129,7 @@ def delete_old_issues(jira_url: str, jira_email: str, jira_api_token: str,
             url = f"{jira_url}/rest/api/3/issue/{issue_key}"
             params = {"deleteSubtasks": "true"}
             
-            response = requests.delete(url, headers=headers, params=params)
+            response = http.delete(url, headers=headers, params=params)
             
             if response.status_code == 204:
                 print(f"  ✓ 삭제 성공: {issue_key} [{issue['type']}] {issue['summary'][:50]}")
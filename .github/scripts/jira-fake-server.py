@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+오프라인 JIRA REST 대역 서버 실행 (jiralib.fakejira).
+
+실제 JIRA 없이 스크립트를 돌려 보거나 벤치마크할 때 쓴다. 이슈는 스냅샷에서 읽거나 합성한다.
+다른 터미널에서 출력된 JIRA_URL 등을 지정하고 스크립트를 실행하면 된다.
+
+사용법:
+    python3 .github/scripts/jira-fake-server.py
+    python3 .github/scripts/jira-fake-server.py --port 8089 --issues 1000 --latency 0.05 --throttle-rate 0.02
+    JIRA_URL=http://127.0.0.1:8089 JIRA_EMAIL=fake@example.com JIRA_API_TOKEN=fake \\
+        python3 .github/scripts/jira-refresh-issues.py
+
+    curl -s http://127.0.0.1:8089/_fake/stats          # 엔드포인트별 호출 수
+    curl -s -X POST -d '{"latency": 0.2}' http://127.0.0.1:8089/_fake/config
+"""
+import argparse
+import json
+import signal
+import sys
+from pathlib import Path
+
+from jiralib.fakejira import FakeJira, FakeJiraServer
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+SNAPSHOT_FILE = PROJECT_ROOT / ".github" / "jira-backend-issues.json"
+
+
+def synthetic_issues(count: int, project: str) -> list:
+    """에픽 1 : 스토리 5 : 작업 20 비율의 합성 이슈 count 개."""
+    issues, epic, story = [], None, None
+    for n in range(1, count + 1):
+        key = f"{project}-{n}"
+        position = (n - 1) % 26
+        if position == 0:
+            kind, parent, epic = "에픽", None, key
+        elif position % 5 == 1:
+            kind, parent, story = "스토리", epic, key
+        else:
+            kind, parent = "작업", story
+        status = ("해야 할 일", "진행 중", "완료")[n % 3]
+        issues.append({"key": key, "summary": f"합성 {kind} {n}", "type": kind, "status": status, "parent": parent})
+    return issues
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 JIRA REST 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089, help="0 이면 빈 포트")
+    parser.add_argument("--project", default="GAM", help="이슈 키 접두사")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--snapshot", type=Path, help=f"이슈 스냅샷 JSON (기본 {SNAPSHOT_FILE}, 있으면)")
+    source.add_argument("--issues", type=int, help="합성 이슈 수 (에픽/스토리/작업 계층)")
+    parser.add_argument("--empty", action="store_true", help="이슈 없이 시작")
+    parser.add_argument("--latency", type=float, default=0.0, help="요청마다 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="지연에 더할 0~N초 무작위 값")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="429 응답 비율 (0~1)")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="429 의 Retry-After(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="오류 응답 비율 (0~1)")
+    parser.add_argument("--error-status", type=int, default=500, help="오류 응답 상태 코드")
+    parser.add_argument("--seed", type=int, help="장애 주입 난수 시드")
+    args = parser.parse_args()
+
+    jira = FakeJira(
+        project=args.project,
+        latency=args.latency,
+        jitter=args.jitter,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+    )
+    if args.issues:
+        jira.load(synthetic_issues(args.issues, args.project))
+    elif not args.empty:
+        snapshot = args.snapshot or SNAPSHOT_FILE
+        if snapshot.exists():
+            with open(snapshot, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            jira.load(raw if isinstance(raw, list) else list(raw.values()))
+        elif args.snapshot:
+            print(f"❌ 오류: {snapshot} 파일이 없습니다", file=sys.stderr)
+            sys.exit(1)
+
+    server = FakeJiraServer(jira, args.host, args.port)
+    print(f"🧪 가짜 JIRA 서버: {server.url} (이슈 {len(jira.issues)}개)", flush=True)
+    print(f"   JIRA_URL={server.url} JIRA_EMAIL=fake@example.com JIRA_API_TOKEN=fake", flush=True)
+    # 백그라운드 실행이면 SIGINT 가 무시되므로 SIGTERM 도 같은 종료 경로로
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(f"\n호출 통계: {json.dumps(jira.stats(), ensure_ascii=False)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,10 +8,9 @@ import base64
 import json
 import os
 import sys
-import time
 from pathlib import Path
 
-import requests
+from jiralib.issues import fetch_issue_statuses
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 VERIFICATION_FILE = PROJECT_ROOT / ".github" / "code-completion-verification.json"
@@ -29,20 +28,6 @@ def load_jira_env(paths: list) -> None:
                         os.environ[k.strip()] = v.strip().strip("'\"")
 
 
-def get_issue_status(jira_url: str, headers: dict, issue_key: str):
-    try:
-        r = requests.get(
-            f"{jira_url}/rest/api/3/issue/{issue_key}?fields=status",
-            headers=headers,
-            timeout=10,
-        )
-        if r.status_code != 200:
-            return None
-        return r.json().get("fields", {}).get("status", {}).get("name")
-    except Exception:
-        return None
-
-
 def is_todo_status(status_name) -> bool:
     """해야 할 일/To Do 상태 판단."""
     if not status_name:
@@ -78,13 +63,18 @@ def main() -> None:
         "Content-Type": "application/json",
     }
 
+    tasks_completed = verification.get("tasks_completed", verification.get("completed", []))
+    stories_completed = verification.get("stories_completed", [])
+    # Task/Story 상태를 한 번에 일괄 조회
+    statuses = fetch_issue_statuses(
+        jira_url, headers, [x["key"] for x in tasks_completed + stories_completed]
+    )
+
     mismatch_issues = []
     # Task 불일치 (기존: completed 또는 tasks_completed)
-    tasks_completed = verification.get("tasks_completed", verification.get("completed", []))
     for item in tasks_completed:
         key = item["key"]
-        time.sleep(0.2)
-        status = get_issue_status(jira_url, headers, key)
+        status = statuses.get(key, {}).get("status")
         if is_todo_status(status):
             mismatch_issues.append(
                 {
@@ -98,10 +88,9 @@ def main() -> None:
             print(f"불일치(Task): {key} (코드 완료, JIRA: {status})")
 
     # Story 불일치: 코드 기준 Story 완료인데 JIRA는 해야 할 일
-    for story in verification.get("stories_completed", []):
+    for story in stories_completed:
         key = story["key"]
-        time.sleep(0.2)
-        status = get_issue_status(jira_url, headers, key)
+        status = statuses.get(key, {}).get("status")
         if is_todo_status(status):
             mismatch_issues.append(
                 {
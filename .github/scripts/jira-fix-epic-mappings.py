@@ -8,10 +8,9 @@ import base64
 import json
 import os
 import sys
-import time
 from pathlib import Path
 
-import requests
+from jiralib import http
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 MAPPING_FILE = PROJECT_ROOT / ".github" / "jira-to-backlog-mapping.json"
@@ -35,7 +34,7 @@ def link_to_epic(jira_url: str, headers: dict, issue_key: str, epic_key: str) ->
     """이슈를 에픽에 연결. parent 필드 또는 Epic Link custom field 사용."""
     # 1) parent 필드
     try:
-        r = requests.put(
+        r = http.put(
             f"{jira_url}/rest/api/3/issue/{issue_key}",
             headers=headers,
             json={"fields": {"parent": {"key": epic_key}}},
@@ -48,7 +47,7 @@ def link_to_epic(jira_url: str, headers: dict, issue_key: str, epic_key: str) ->
     # 2) Epic Link custom field
     for field_id in EPIC_LINK_FIELD_IDS:
         try:
-            r = requests.put(
+            r = http.put(
                 f"{jira_url}/rest/api/3/issue/{issue_key}",
                 headers=headers,
                 json={"fields": {field_id: epic_key}},
@@ -119,7 +118,6 @@ def main() -> None:
         else:
             print(f"  ✗ {jira_key} Epic 연결 실패")
             fail += 1
-        time.sleep(0.3)
 
     print(f"\n완료: 성공 {success}개, 실패 {fail}개")
 
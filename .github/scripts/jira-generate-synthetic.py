@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+합성 프로젝트 생성 (jiralib.synthetic): 백로그 문서 + Kotlin 소스 트리 + JIRA 스냅샷/매핑.
+
+백로그 파서·코드 검증·가짜 JIRA 서버를 실제보다 큰 규모(작업 10만 건 정도까지)로 재 볼 때 쓴다.
+출력 디렉터리는 프로젝트 루트와 같은 구조라서 스크립트 사본을 두거나 가짜 서버에 스냅샷을 넘기면 된다.
+    <output>/docs/jira/JIRA_BACKLOG.md, FRONT_JIRA_BACKLOG.md
+    <output>/src/main/kotlin/com/goalmond/api/synthetic/...
+    <output>/.github/jira-backend-issues.json, jira-mapping.json
+
+사용법:
+    python3 .github/scripts/jira-generate-synthetic.py --tasks 100000 --output /tmp/synthetic
+    python3 .github/scripts/jira-generate-synthetic.py --tasks 1000 --output /tmp/s --implemented 0.8 --seed 7
+    python3 .github/scripts/jira-fake-server.py --snapshot /tmp/synthetic/.github/jira-backend-issues.json
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from jiralib.synthetic import SyntheticProject
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+MAX_TASKS = 100_000
+
+
+def ratio(value: str) -> float:
+    number = float(value)
+    if not 0.0 <= number <= 1.0:
+        raise argparse.ArgumentTypeError("0~1 사이 값이어야 합니다")
+    return number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 백로그·소스·JIRA 스냅샷 생성")
+    parser.add_argument("--tasks", type=int, default=1000, help=f"작업 수 (최대 {MAX_TASKS})")
+    parser.add_argument("--output", type=Path, required=True, help="출력 디렉터리 (프로젝트 루트 구조)")
+    parser.add_argument("--prefix", default="GAM", help="이슈 키 접두사")
+    parser.add_argument("--stories-per-epic", type=int, default=5)
+    parser.add_argument("--tasks-per-story", type=int, default=4)
+    parser.add_argument("--weeks", type=int, default=6, help="주차 수 (에픽을 고르게 배분)")
+    parser.add_argument("--implemented", type=ratio, default=0.5, help="클래스 파일을 만들 작업 비율")
+    parser.add_argument("--done", type=ratio, default=0.5, help="스냅샷에서 완료 상태인 작업 비율")
+    parser.add_argument("--plain", type=ratio, default=0.2, help="클래스 없는 일반 작업 비율")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-sources", action="store_true", help="Kotlin 소스 생략")
+    parser.add_argument("--no-jira", action="store_true", help="스냅샷·매핑 생략")
+    args = parser.parse_args()
+
+    if not 1 <= args.tasks <= MAX_TASKS:
+        parser.error(f"--tasks 는 1~{MAX_TASKS} 이어야 합니다")
+    if args.stories_per_epic < 1 or args.tasks_per_story < 1 or args.weeks < 1:
+        parser.error("--stories-per-epic, --tasks-per-story, --weeks 는 1 이상이어야 합니다")
+    output = args.output.resolve()
+    if output == PROJECT_ROOT:  # 실제 백로그·매핑·스냅샷을 덮어쓰게 됨
+        print(f"❌ 오류: 프로젝트 루트({PROJECT_ROOT}) 에는 쓸 수 없습니다", file=sys.stderr)
+        sys.exit(1)
+
+    started = time.perf_counter()
+    project = SyntheticProject(
+        tasks=args.tasks,
+        prefix=args.prefix,
+        stories_per_epic=args.stories_per_epic,
+        tasks_per_story=args.tasks_per_story,
+        weeks=args.weeks,
+        implemented=args.implemented,
+        done=args.done,
+        plain=args.plain,
+        seed=args.seed,
+    )
+    stats = project.write(output, sources=not args.no_sources, jira=not args.no_jira)
+    print(f"✅ {output}")
+    print(f"   에픽 {len(project.epics)}, 작업 {stats['tasks']}, 백로그 {stats['backlog_bytes'] / 1024 / 1024:.1f}MB")
+    print(f"   Kotlin 파일 {stats['sources']}, 스냅샷 이슈 {stats['issues']}")
+    print(f"   {time.perf_counter() - started:.1f}초")
+
+
+if __name__ == "__main__":
+    main()
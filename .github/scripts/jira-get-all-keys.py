@@ -10,7 +10,8 @@ import sys
 import json
 import base64
 import re
-import requests
+from jiralib import http
+from jiralib.titleindex import TitleIndex
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
@@ -71,7 +72,7 @@ def fetch_jira_issues():
         "Accept": "application/json",
     }
     try:
-        r = requests.get(
+        r = http.get(
             f"{jira_url}/rest/api/3/search",
             headers=headers,
             params={
@@ -104,6 +105,11 @@ def main():
     if issues and BACKLOG_FILE.exists():
         with open(BACKLOG_FILE, "r", encoding="utf-8") as f:
             backlog_text = f.read()
+        summary_index = TitleIndex(
+            ((issue.get("key"), (issue.get("fields") or {}).get("summary") or "")
+             for issue in issues if issue.get("key")),
+            normalize=normalize_summary,
+        )
         # 백로그에서 Story/Task 헤더로 키와 제목 추출
         for m in re.finditer(
             r"###\s+(?:Story|Task)\s+(GAM-\d+(?:-\d+)?)\s*:\s*([^\n]+)",
@@ -112,19 +118,10 @@ def main():
             backlog_key, title = m.group(1), m.group(2).strip()
             if backlog_key in backlog_to_jira:
                 continue
-            norm_title = normalize_summary(title)
-            for issue in issues:
-                jira_key = issue.get("key")
-                summary = (issue.get("fields") or {}).get("summary") or ""
-                if not jira_key or not summary:
-                    continue
-                if normalize_summary(summary) == norm_title:
-                    backlog_to_jira[backlog_key] = jira_key
-                    break
-                # 부분 일치: 백로그 제목이 JIRA 요약에 포함
-                if norm_title and norm_title in normalize_summary(summary):
-                    backlog_to_jira[backlog_key] = jira_key
-                    break
+            # 요약이 같거나 백로그 제목을 포함하는 첫 이슈
+            jira_key = summary_index.first_match(title)
+            if jira_key:
+                backlog_to_jira[backlog_key] = jira_key
     else:
         if not issues:
             print("JIRA API 조회 생략 또는 실패. 파일 기반 매핑만 사용합니다.", file=sys.stderr)
@@ -10,8 +10,7 @@ import sys
 import json
 import argparse
 import base64
-import time
-import requests
+from jiralib import http
 from typing import Dict, List, Set
 
 # 백엔드 에픽 ID -> 하위 스토리 목록 (JIRA_BACKLOG.md Epic/Story 구조 기준)
@@ -115,7 +114,7 @@ def link_via_epic_link_field(
     """Epic Link custom field 또는 parent 필드로 자식 이슈를 에픽에 연결."""
     # 1) parent 필드 (JIRA Cloud Next-Gen 등)
     try:
-        r = requests.put(
+        r = http.put(
             f"{jira_url}/rest/api/3/issue/{child_key}",
             headers=headers,
             json={"fields": {"parent": {"key": epic_key}}},
@@ -127,7 +126,7 @@ def link_via_epic_link_field(
     # 2) Epic Link custom field
     for field_id in EPIC_LINK_FIELD_IDS:
         try:
-            r = requests.put(
+            r = http.put(
                 f"{jira_url}/rest/api/3/issue/{child_key}",
                 headers=headers,
                 json={"fields": {field_id: epic_key}},
@@ -142,7 +141,7 @@ def link_via_epic_link_field(
 def get_issue_link_types(jira_url: str, headers: dict) -> List[dict]:
     """사용 가능한 이슈 링크 타입 목록 조회."""
     try:
-        r = requests.get(
+        r = http.get(
             f"{jira_url}/rest/api/3/issueLinkType",
             headers=headers,
         )
@@ -164,7 +163,7 @@ def link_via_issue_link(
             "inwardIssue": {"key": child_key},
             "outwardIssue": {"key": epic_key},
         }
-        r = requests.post(
+        r = http.post(
             f"{jira_url}/rest/api/3/issueLink",
             headers=headers,
             json=payload,
@@ -177,7 +176,7 @@ def link_via_issue_link(
             "inwardIssue": {"key": epic_key},
             "outwardIssue": {"key": child_key},
         }
-        r = requests.post(
+        r = http.post(
             f"{jira_url}/rest/api/3/issueLink",
             headers=headers,
             json=payload,
@@ -190,7 +189,7 @@ def link_via_issue_link(
 def get_current_epic_link(jira_url: str, headers: dict, issue_key: str) -> str:
     """이슈에 설정된 Epic Link(에픽 키) 조회. 없으면 빈 문자열."""
     try:
-        r = requests.get(
+        r = http.get(
             f"{jira_url}/rest/api/3/issue/{issue_key}?fields=parent",
             headers=headers,
         )
@@ -267,7 +266,6 @@ def main():
         jira_child_keys = expand_backlog_children_to_jira_keys(child_keys, jira_to_backlog)
         print(f"\n에픽 {epic_key}")
         for child_key in sorted(jira_child_keys):
-            time.sleep(0.2)
             current = get_current_epic_link(jira_url, headers, child_key)
             if current == epic_key:
                 print(f"  ⊘ {child_key} 이미 {epic_key} 연결됨")
@@ -280,25 +278,21 @@ def main():
             if linked:
                 print(f"  ✓ {child_key} -> {epic_key} (Epic Link 필드)")
                 ok += 1
-                time.sleep(0.3)
                 continue
 
             for link_name in candidate_link_types:
                 if link_via_issue_link(jira_url, headers, child_key, epic_key, link_name):
                     print(f"  ✓ {child_key} -> {epic_key} (Issue Link: {link_name})")
                     ok += 1
-                    time.sleep(0.3)
                     break
             else:
                 print(f"  ✗ {child_key} -> {epic_key} 연동 실패 (수동 연결 필요)")
                 fail += 1
-            time.sleep(0.35)
 
     # 프론트엔드 Task -> Story 부모 연결
     if FRONTEND_TASK_TO_STORY and not args.epic:
         print("\n[프론트엔드 Task -> Story 부모 연결]")
         for task_key, story_key in sorted(FRONTEND_TASK_TO_STORY.items()):
-            time.sleep(0.2)
             current = get_current_epic_link(jira_url, headers, task_key)
             if current == story_key:
                 print(f"  ⊘ {task_key} 이미 {story_key} 연결됨")
@@ -308,18 +302,15 @@ def main():
             if linked:
                 print(f"  ✓ {task_key} -> {story_key} (Parent)")
                 ok += 1
-                time.sleep(0.3)
             else:
                 for link_name in candidate_link_types:
                     if link_via_issue_link(jira_url, headers, task_key, story_key, link_name):
                         print(f"  ✓ {task_key} -> {story_key} (Issue Link: {link_name})")
                         ok += 1
-                        time.sleep(0.3)
                         break
                 else:
                     print(f"  ✗ {task_key} -> {story_key} 연동 실패")
                     fail += 1
-            time.sleep(0.35)
 
     print(f"\n완료: 성공 {ok}개, 스킵 {skip}개, 실패 {fail}개.")
 
@@ -11,10 +11,10 @@ import base64
 import json
 import os
 import sys
-import time
 from pathlib import Path
 
-import requests
+from jiralib import workflow
+from jiralib.hierarchy import IssueGraph
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 JIRA_ISSUES_FILE = PROJECT_ROOT / ".github" / "jira-backend-issues.json"
@@ -46,34 +46,6 @@ def is_todo_status(status: str) -> bool:
     return any(todo.lower() in s or s in todo.lower() for todo in TODO_NAMES)
 
 
-def compute_descendants(issues: list, root_keys: set) -> set:
-    """root_keys에 속한 이슈와 그 직·간접 하위(자식) JIRA 키 집합."""
-    key_to_parent = {i["key"]: i.get("parent") for i in issues}
-    result = set(root_keys)
-    changed = True
-    while changed:
-        changed = False
-        for key, parent in key_to_parent.items():
-            if key in result:
-                continue
-            if parent in result:
-                result.add(key)
-                changed = True
-    return result
-
-
-def get_transitions(jira_url: str, headers: dict, issue_key: str) -> list:
-    try:
-        r = requests.get(
-            f"{jira_url}/rest/api/3/issue/{issue_key}/transitions",
-            headers=headers,
-            timeout=10,
-        )
-        return r.json().get("transitions", []) if r.status_code == 200 else []
-    except Exception:
-        return []
-
-
 def find_todo_transition_id(transitions: list) -> str | None:
     for t in transitions:
         name = (t.get("name") or "").strip().lower()
@@ -84,25 +56,17 @@ def find_todo_transition_id(transitions: list) -> str | None:
     return None
 
 
-def transition_to_todo(jira_url: str, headers: dict, issue_key: str) -> bool:
-    transitions = get_transitions(jira_url, headers, issue_key)
-    tid = find_todo_transition_id(transitions)
-    if not tid:
-        return False
-    r = requests.post(
-        f"{jira_url}/rest/api/3/issue/{issue_key}/transitions",
-        headers=headers,
-        json={"transition": {"id": tid}},
-        timeout=10,
-    )
-    return r.status_code == 204
-
-
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="GAM-1/GAM-2 외 에픽 하위 이슈를 '해야 할 일'로 전환"
     )
     parser.add_argument("--dry-run", action="store_true", help="API 호출 없이 대상만 출력")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=workflow.DEFAULT_CONCURRENCY,
+        help="동시 전환 수 (기본 %(default)s)",
+    )
     args = parser.parse_args()
 
     load_jira_env(["docs/jira/jira.env", "jira.env"])
@@ -115,8 +79,9 @@ def main() -> None:
         raw = json.load(f)
     issues = raw if isinstance(raw, list) else list(raw.values()) if isinstance(raw, dict) else []
 
-    keep_set = compute_descendants(issues, KEEP_EPICS)
-    other_descendants = compute_descendants(issues, OTHER_EPICS)
+    graph = IssueGraph(issues)
+    keep_set = graph.descendants(KEEP_EPICS)
+    other_descendants = graph.descendants(OTHER_EPICS)
 
     # GAM-1/GAM-2 하위가 아닌 것 중, GAM-3~6 하위만 대상 (이미 other_descendants가 GAM-3~6 및 그 하위)
     to_transition = [
@@ -165,22 +130,30 @@ def main() -> None:
         "Accept": "application/json",
     }
 
-    success, fail = 0, 0
-    for i in to_transition:
-        key = i["key"]
-        if transition_to_todo(jira_url, headers, key):
-            print(f"  ✓ {key} → 해야 할 일")
-            success += 1
+    def report(result: dict) -> None:
+        if result["ok"]:
+            print(f"  ✓ {result['key']} → 해야 할 일")
         else:
-            print(f"  ✗ {key} 전환 실패")
-            fail += 1
-        time.sleep(0.35)
+            print(f"  ✗ {result['key']} 전환 실패 ({result['error']})")
+
+    results = workflow.transition_many(
+        jira_url,
+        headers,
+        [(i["key"], find_todo_transition_id) for i in to_transition],
+        concurrency=args.concurrency,
+        on_result=report,
+    )
+    success = sum(1 for r in results if r["ok"])
+    fail = len(results) - success
 
     REPORT_FILE.parent.mkdir(parents=True, exist_ok=True)
     with open(REPORT_FILE, "w", encoding="utf-8") as f:
         f.write("# GAM-1/GAM-2 외 에픽 하위 → 해야 할 일 전환 결과\n\n")
         f.write(f"- 성공: {success}개\n")
         f.write(f"- 실패: {fail}개\n")
+        for r in results:
+            if not r["ok"]:
+                f.write(f"  - {r['key']}: {r['error']}\n")
     print(f"\n완료: 성공 {success}개, 실패 {fail}개")
     print(f"보고서: {REPORT_FILE}")
 
@@ -2,111 +2,53 @@
 # -*- coding: utf-8 -*-
 """
 JIRA 최신 이슈 데이터 새로고침
+
+.github/.cache/jira-issues.sqlite 에 이슈를 보관하고 마지막 동기화 이후 변경분만 받아
+.github/jira-backend-issues.json 을 다시 쓴다. 전체 재동기화는 --full.
 """
-import os
 import sys
 import json
-import base64
-import requests
+import argparse
+from jiralib import session
+from jiralib.store import IssueStore
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 OUTPUT_FILE = PROJECT_ROOT / ".github" / "jira-backend-issues.json"
+PROJECT_KEY = "GAM"
 
-def load_jira_env():
-    """jira.env 파일 로드"""
-    for env_path in [
-        PROJECT_ROOT / "docs" / "jira" / "jira.env",
-        PROJECT_ROOT / "jira.env"
-    ]:
-        if env_path.exists():
-            with open(env_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and "=" in line and not line.startswith("#"):
-                        k, _, v = line.partition("=")
-                        os.environ[k.strip()] = v.strip().strip('"\'')
-
-def fetch_all_issues():
-    """JIRA API로 모든 GAM 이슈 조회"""
-    jira_url = (os.getenv("JIRA_URL") or "").rstrip("/")
-    jira_email = os.getenv("JIRA_EMAIL") or ""
-    jira_token = os.getenv("JIRA_API_TOKEN") or ""
+def fetch_all_issues(full: bool = False):
+    """로컬 이슈 저장소를 JIRA와 동기화한 뒤 모든 GAM 이슈 반환 (변경분만 조회)"""
+    jira_url, jira_email, jira_token = session.credentials()
     
     if not all([jira_url, jira_email, jira_token]):
         print("❌ JIRA 인증 정보 없음", file=sys.stderr)
         sys.exit(1)
     
-    auth = base64.b64encode(f"{jira_email}:{jira_token}".encode()).decode()
-    headers = {
-        "Authorization": f"Basic {auth}",
-        "Content-Type": "application/json",
-        "Accept": "application/json",
-    }
-    
-    all_issues = []
-    start_at = 0
-    max_results = 100
+    headers = session.auth_headers()
     
-    while True:
-        try:
-            r = requests.get(
-                f"{jira_url}/rest/api/2/search",
-                headers=headers,
-                params={
-                    "jql": "project = GAM ORDER BY created ASC",
-                    "fields": "summary,issuetype,status,parent",
-                    "startAt": start_at,
-                    "maxResults": max_results,
-                },
-                timeout=30,
-            )
-            
-            if r.status_code != 200:
-                print(f"❌ JIRA API 오류: {r.status_code}", file=sys.stderr)
-                print(r.text[:500], file=sys.stderr)
-                sys.exit(1)
-            
-            data = r.json()
-            issues = data.get("issues", [])
-            
-            if not issues:
-                break
-            
-            for issue in issues:
-                key = issue["key"]
-                fields = issue.get("fields", {})
-                summary = fields.get("summary", "")
-                issuetype = fields.get("issuetype", {}).get("name", "")
-                status = fields.get("status", {}).get("name", "")
-                parent = fields.get("parent", {})
-                parent_key = parent.get("key") if parent else None
-                
-                all_issues.append({
-                    "key": key,
-                    "summary": summary,
-                    "type": issuetype,
-                    "status": status,
-                    "parent": parent_key
-                })
-            
-            print(f"조회 중: {len(all_issues)}개", end="\r")
-            
-            if len(issues) < max_results:
-                break
-            
-            start_at += max_results
-        
-        except Exception as e:
-            print(f"\n❌ 오류: {e}", file=sys.stderr)
-            sys.exit(1)
+    store = IssueStore()
+    try:
+        stats = store.sync(jira_url, headers, PROJECT_KEY, full=full)
+    except Exception as e:
+        print(f"❌ JIRA 동기화 오류: {e}", file=sys.stderr)
+        sys.exit(1)
+    all_issues = store.find(project=PROJECT_KEY)
+    store.close()
     
-    print(f"\n✅ 총 {len(all_issues)}개 이슈 조회 완료")
+    print(
+        f"✅ 총 {len(all_issues)}개 이슈 (변경 {stats['updated']}개, 삭제 {stats['deleted']}개, "
+        f"API 요청 {stats['requests']}회)"
+    )
     return all_issues
 
 def main():
-    load_jira_env()
-    issues = fetch_all_issues()
+    parser = argparse.ArgumentParser(description="JIRA 이슈 스냅샷 새로고침 (로컬 저장소 증분 동기화)")
+    parser.add_argument("--full", action="store_true", help="증분 대신 프로젝트 전체 재동기화")
+    args = parser.parse_args()
+
+    session.load_env()
+    issues = fetch_all_issues(full=args.full)
     
     # JSON 저장
     with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
@@ -9,10 +9,9 @@ import base64
 import json
 import os
 import sys
-import time
 from pathlib import Path
 
-import requests
+from jiralib import desired
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 MAPPING_FILE = PROJECT_ROOT / ".github" / "jira-task-to-epic-mapping.json"
@@ -33,20 +32,6 @@ def load_jira_env(paths: list) -> None:
                         os.environ[k.strip()] = v.strip().strip("'\"")
 
 
-def set_parent(jira_url: str, headers: dict, issue_key: str, parent_key: str) -> bool:
-    try:
-        r = requests.put(
-            f"{jira_url}/rest/api/3/issue/{issue_key}",
-            headers=headers,
-            json={"fields": {"parent": {"key": parent_key}}},
-            timeout=10,
-        )
-        return r.status_code == 204
-    except Exception as e:
-        print(f"  오류 {issue_key}: {e}")
-        return False
-
-
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="작업 이슈의 parent를 스토리에서 에픽으로 변경"
@@ -108,16 +93,25 @@ def main() -> None:
         "Accept": "application/json",
     }
 
-    success, fail = 0, 0
-    for task_key, epic_key in to_reparent:
-        if set_parent(jira_url, headers, task_key, epic_key):
-            print(f"  ✓ {task_key} → Epic {epic_key}")
-            success += 1
+    # 스냅샷이 오래됐을 수 있으므로 현재 parent 를 일괄 조회해 다른 작업만 변경 (재실행 시 검색 요청만)
+    wanted = {task_key: {"parent": epic_key} for task_key, epic_key in to_reparent}
+    current = desired.fetch_current(jira_url, headers, wanted, ["parent"])
+    changes, unchanged, missing = desired.plan(current, wanted)
+    if unchanged:
+        print(f"  ⊘ 이미 에픽 직속: {len(unchanged)}개 스킵")
+    for task_key in missing:
+        print(f"  ✗ {task_key} 이슈 조회 실패")
+
+    def report(result: dict) -> None:
+        if result["ok"]:
+            print(f"  ✓ {result['key']} → Epic {result['fields']['parent']}")
         else:
-            print(f"  ✗ {task_key} 실패")
-            fail += 1
-        time.sleep(0.35)
-    print(f"\n완료: 성공 {success}개, 실패 {fail}개")
+            print(f"  ✗ {result['key']} 실패 ({result['error']})")
+
+    results = desired.apply_changes(jira_url, headers, changes, on_result=report)
+    success = sum(1 for r in results if r["ok"])
+    fail = len(results) - success + len(missing)
+    print(f"\n완료: 성공 {success}개, 스킵 {len(unchanged)}개, 실패 {fail}개")
 
 
 if __name__ == "__main__":
@@ -9,10 +9,9 @@ import base64
 import json
 import os
 import sys
-import time
 from pathlib import Path
 
-import requests
+from jiralib import workflow
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 STRICT_VERIFICATION_FILE = PROJECT_ROOT / ".github" / "strict-code-completion-verification.json"
@@ -36,18 +35,6 @@ def load_jira_env(paths: list) -> None:
                         os.environ[k.strip()] = v.strip().strip("'\"")
 
 
-def get_transitions(jira_url: str, headers: dict, issue_key: str) -> list:
-    try:
-        r = requests.get(
-            f"{jira_url}/rest/api/3/issue/{issue_key}/transitions",
-            headers=headers,
-            timeout=10,
-        )
-        return r.json().get("transitions", []) if r.status_code == 200 else []
-    except Exception:
-        return []
-
-
 def find_todo_transition_id(transitions: list) -> str | None:
     for t in transitions:
         name = (t.get("name") or "").strip().lower()
@@ -58,25 +45,17 @@ def find_todo_transition_id(transitions: list) -> str | None:
     return None
 
 
-def transition_to_todo(jira_url: str, headers: dict, issue_key: str) -> bool:
-    transitions = get_transitions(jira_url, headers, issue_key)
-    tid = find_todo_transition_id(transitions)
-    if not tid:
-        return False
-    r = requests.post(
-        f"{jira_url}/rest/api/3/issue/{issue_key}/transitions",
-        headers=headers,
-        json={"transition": {"id": tid}},
-        timeout=10,
-    )
-    return r.status_code == 204
-
-
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="코드 미구현 Task를 JIRA에서 '해야 할 일'로 되돌림"
     )
     parser.add_argument("--dry-run", action="store_true", help="전환 없이 대상만 출력")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=workflow.DEFAULT_CONCURRENCY,
+        help="동시 전환 수 (기본 %(default)s)",
+    )
     args = parser.parse_args()
 
     load_jira_env(["docs/jira/jira.env", "jira.env"])
@@ -119,16 +98,21 @@ def main() -> None:
         "Accept": "application/json",
     }
 
-    success, fail = 0, 0
-    for c in candidates:
-        key = c["key"]
-        if transition_to_todo(jira_url, headers, key):
-            print(f"  ✓ {key} → To Do")
-            success += 1
+    def report(result: dict) -> None:
+        if result["ok"]:
+            print(f"  ✓ {result['key']} → To Do")
         else:
-            print(f"  ✗ {key} 전환 실패")
-            fail += 1
-        time.sleep(0.35)
+            print(f"  ✗ {result['key']} 전환 실패 ({result['error']})")
+
+    results = workflow.transition_many(
+        jira_url,
+        headers,
+        [(c["key"], find_todo_transition_id) for c in candidates],
+        concurrency=args.concurrency,
+        on_result=report,
+    )
+    success = sum(1 for r in results if r["ok"])
+    fail = len(results) - success
 
     print(f"\n완료: 성공 {success}개, 실패 {fail}개")
 
@@ -139,8 +123,9 @@ def main() -> None:
         f.write(f"- **성공**: {success}개\n")
         f.write(f"- **실패**: {fail}개\n\n")
         f.write("## 되돌린 이슈\n\n")
-        for c in candidates:
-            f.write(f"- {c['key']} ({c.get('parent')}): {c.get('summary', '')}\n")
+        for c, r in zip(candidates, results):
+            mark = "" if r["ok"] else f" — ✗ {r['error']}"
+            f.write(f"- {c['key']} ({c.get('parent')}): {c.get('summary', '')}{mark}\n")
     print(f"보고서: {REPORT_FILE}")
 
 
@@ -8,9 +8,7 @@ import os
 import sys
 import argparse
 import base64
-import time
-import requests
-from typing import List
+from jiralib import workflow
 
 
 # 프론트 1주차 JIRA 키 (jira-mapping.json 기준: GAMF-1, GAMF-11~18, GAMF-11-1~GAMF-18-3)
@@ -28,17 +26,9 @@ FRONT_WEEK1_JIRA_KEYS = [
 ]
 
 
-def get_available_transitions(jira_url: str, headers: dict, issue_key: str) -> List[dict]:
-    try:
-        r = requests.get(f"{jira_url}/rest/api/3/issue/{issue_key}/transitions", headers=headers)
-        return r.json().get("transitions", []) if r.status_code == 200 else []
-    except Exception:
-        return []
-
-
 def transition_to_todo(jira_url: str, headers: dict, issue_key: str) -> bool:
     """이슈를 해야 할 일(To Do) 또는 Reopen 등 열림 상태로 전환."""
-    transitions = get_available_transitions(jira_url, headers, issue_key)
+    transitions = workflow.get_transitions(jira_url, headers, issue_key)
     todo_names = ["to do", "해야 할 일", "reopen", "open", "backlog", "되돌리기"]
     tid = None
     for t in transitions:
@@ -50,12 +40,7 @@ def transition_to_todo(jira_url: str, headers: dict, issue_key: str) -> bool:
         tid = transitions[0].get("id")
     if not tid:
         return False
-    r = requests.post(
-        f"{jira_url}/rest/api/3/issue/{issue_key}/transitions",
-        headers=headers,
-        json={"transition": {"id": tid}},
-    )
-    return r.status_code == 204
+    return workflow.post_transition(jira_url, headers, issue_key, tid)
 
 
 def main():
@@ -84,6 +69,8 @@ def main():
             print(f"  [DRY RUN] {k}")
         return
 
+    workflow.prime(jira_url, headers, FRONT_WEEK1_JIRA_KEYS)
+
     ok, fail = 0, 0
     for k in FRONT_WEEK1_JIRA_KEYS:
         if transition_to_todo(jira_url, headers, k):
@@ -92,7 +79,6 @@ def main():
         else:
             print(f"  ✗ {k} 전환 실패")
             fail += 1
-        time.sleep(0.35)
     print(f"\n완료: 성공 {ok}개, 실패 {fail}개.")
 
 
@@ -8,10 +8,10 @@ import base64
 import json
 import os
 import sys
-import time
 from pathlib import Path
 
-import requests
+from jiralib import workflow
+from jiralib.hierarchy import IssueGraph
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 JIRA_ISSUES_FILE = PROJECT_ROOT / ".github" / "jira-backend-issues.json"
@@ -43,22 +43,6 @@ def is_done_status(status: str) -> bool:
     return (status or "").strip().lower() in {s.lower() for s in DONE_STATUSES}
 
 
-def compute_week2_descendants(issues: list) -> set:
-    """GAM-2와 그 하위(직·간접 자식) JIRA 키 집합."""
-    key_to_parent = {i["key"]: i.get("parent") for i in issues}
-    allowed = {WEEK2_EPIC_KEY}
-    changed = True
-    while changed:
-        changed = False
-        for key, parent in key_to_parent.items():
-            if key in allowed:
-                continue
-            if parent in allowed:
-                allowed.add(key)
-                changed = True
-    return allowed
-
-
 def get_revert_candidates(issues: list, allowed_done: set) -> list:
     """완료 상태이면서 allowed_done에 없는 이슈 목록."""
     return [
@@ -69,18 +53,6 @@ def get_revert_candidates(issues: list, allowed_done: set) -> list:
     ]
 
 
-def get_transitions(jira_url: str, headers: dict, issue_key: str) -> list:
-    try:
-        r = requests.get(
-            f"{jira_url}/rest/api/3/issue/{issue_key}/transitions",
-            headers=headers,
-            timeout=10,
-        )
-        return r.json().get("transitions", []) if r.status_code == 200 else []
-    except Exception:
-        return []
-
-
 def find_todo_transition_id(transitions: list) -> str | None:
     for t in transitions:
         name = (t.get("name") or "").strip().lower()
@@ -92,17 +64,11 @@ def find_todo_transition_id(transitions: list) -> str | None:
 
 
 def transition_to_todo(jira_url: str, headers: dict, issue_key: str) -> bool:
-    transitions = get_transitions(jira_url, headers, issue_key)
+    transitions = workflow.get_transitions(jira_url, headers, issue_key)
     tid = find_todo_transition_id(transitions)
     if not tid:
         return False
-    r = requests.post(
-        f"{jira_url}/rest/api/3/issue/{issue_key}/transitions",
-        headers=headers,
-        json={"transition": {"id": tid}},
-        timeout=10,
-    )
-    return r.status_code == 204
+    return workflow.post_transition(jira_url, headers, issue_key, tid)
 
 
 def main() -> None:
@@ -123,7 +89,7 @@ def main() -> None:
     if not isinstance(issues, list):
         issues = list(issues.values()) if isinstance(issues, dict) else []
 
-    allowed_done = compute_week2_descendants(issues)
+    allowed_done = IssueGraph(issues).descendants({WEEK2_EPIC_KEY})
     candidates = get_revert_candidates(issues, allowed_done)
 
     payload = {
@@ -166,6 +132,8 @@ def main() -> None:
         "Accept": "application/json",
     }
 
+    workflow.prime(jira_url, headers, [c["key"] for c in candidates])
+
     success, fail = 0, 0
     for c in candidates:
         key = c["key"]
@@ -175,7 +143,6 @@ def main() -> None:
         else:
             print(f"  ✗ {key} 전환 실패")
             fail += 1
-        time.sleep(0.35)
 
     print(f"\n완료: 성공 {success}개, 실패 {fail}개")
 
@@ -3,12 +3,9 @@
 """
 JIRA 이슈에 담당자 설정 스크립트
 """
-import os
 import sys
 import json
-import base64
-import requests
-import time
+from jiralib import desired, http, session
 import argparse
 
 class JiraAssigneeUpdater:
@@ -16,21 +13,14 @@ class JiraAssigneeUpdater:
         self.jira_url = jira_url.rstrip('/')
         self.jira_email = jira_email
         self.jira_api_token = jira_api_token
-        
-        auth_string = f"{jira_email}:{jira_api_token}"
-        self.auth_header = base64.b64encode(auth_string.encode()).decode()
-        self.headers = {
-            "Authorization": f"Basic {self.auth_header}",
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        }
+        self.headers = session.auth_headers(jira_email, jira_api_token)
     
     def find_user_by_name(self, display_name: str):
         """이름으로 사용자 검색"""
         try:
             url = f"{self.jira_url}/rest/api/3/user/search"
             params = {"query": display_name}
-            r = requests.get(url, headers=self.headers, params=params, timeout=10)
+            r = http.get(url, headers=self.headers, params=params, timeout=10)
             if r.status_code == 200:
                 users = r.json()
                 for user in users:
@@ -45,36 +35,6 @@ class JiraAssigneeUpdater:
             print(f"  ✗ 사용자 검색 실패 ({display_name}): {e}")
             return None
     
-    def set_assignee(self, issue_key: str, account_id: str) -> bool:
-        """이슈에 담당자 설정"""
-        url = f"{self.jira_url}/rest/api/3/issue/{issue_key}/assignee"
-        payload = {"accountId": account_id}
-        try:
-            r = requests.put(url, headers=self.headers, json=payload, timeout=10)
-            if r.status_code == 204:
-                return True
-            else:
-                print(f"  ✗ {issue_key}: 담당자 설정 실패 (status: {r.status_code})")
-                return False
-        except Exception as e:
-            print(f"  ✗ {issue_key}: 담당자 설정 실패 - {e}")
-            return False
-    
-    def get_current_assignee(self, issue_key: str):
-        """현재 담당자 조회"""
-        url = f"{self.jira_url}/rest/api/3/issue/{issue_key}"
-        params = {"fields": "assignee"}
-        try:
-            r = requests.get(url, headers=self.headers, params=params, timeout=10)
-            if r.status_code == 200:
-                data = r.json()
-                assignee = data.get('fields', {}).get('assignee')
-                if assignee:
-                    return assignee.get('displayName'), assignee.get('accountId')
-            return None, None
-        except Exception:
-            return None, None
-    
     def run(self, backend_assignee: str, frontend_assignee: str, dry_run: bool = False):
         """담당자 일괄 설정"""
         # 사용자 계정 ID 조회
@@ -103,61 +63,38 @@ class JiraAssigneeUpdater:
         for i in range(142, 229):
             frontend_issues.append(f"GAM-{i}")
         
-        updated = 0
-        skipped = 0
-        failed = 0
+        # 원하는 담당자: 현재 값을 일괄 조회해 다른 이슈만 변경 (이슈별 GET 없음)
+        wanted = {key: {"assignee": backend_account_id} for key in backend_issues}
+        wanted.update({key: {"assignee": frontend_account_id} for key in frontend_issues})
+        names = {backend_account_id: backend_assignee, frontend_account_id: frontend_assignee}
+        current = desired.fetch_current(self.jira_url, self.headers, wanted, ["assignee"])
+        changes, unchanged, missing = desired.plan(current, wanted)
         
-        # 백엔드 이슈 처리
-        print(f"백엔드 이슈 처리 중 ({len(backend_issues)}개)...")
-        for issue_key in backend_issues:
-            current_name, current_id = self.get_current_assignee(issue_key)
-            
-            if current_id == backend_account_id:
-                print(f"  ⊘ {issue_key}: 이미 {backend_assignee}에게 할당됨, 스킵")
-                skipped += 1
-                time.sleep(0.1)
-                continue
-            
-            if dry_run:
-                print(f"  [DRY RUN] {issue_key}: {current_name or '미할당'} → {backend_assignee}")
-                updated += 1
-                continue
-            
-            success = self.set_assignee(issue_key, backend_account_id)
-            if success:
-                print(f"  ✓ {issue_key}: {backend_assignee}에게 할당 완료")
-                updated += 1
-            else:
-                failed += 1
-            
-            time.sleep(0.3)  # API rate limit 고려
+        print(f"이슈 {len(wanted)}개 (백엔드 {len(backend_issues)}, 프론트엔드 {len(frontend_issues)}) 중 "
+              f"변경 {len(changes)}개")
+        for issue_key in unchanged:
+            print(f"  ⊘ {issue_key}: 이미 {names[wanted[issue_key]['assignee']]}에게 할당됨, 스킵")
+        for issue_key in missing:
+            print(f"  ✗ {issue_key}: 이슈 조회 실패, 스킵")
+        
+        if dry_run:
+            for change in changes:
+                before = change["before"].get("assignee")
+                print(f"  [DRY RUN] {change['key']}: {names.get(before, before) or '미할당'} → "
+                      f"{names[change['fields']['assignee']]}")
+            print(f"\n총 {len(changes)}개 이슈 담당자 설정 예정, {len(unchanged)}개 스킵.")
+            return
         
-        # 프론트엔드 이슈 처리
-        print(f"\n프론트엔드 이슈 처리 중 ({len(frontend_issues)}개)...")
-        for issue_key in frontend_issues:
-            current_name, current_id = self.get_current_assignee(issue_key)
-            
-            if current_id == frontend_account_id:
-                print(f"  ⊘ {issue_key}: 이미 {frontend_assignee}에게 할당됨, 스킵")
-                skipped += 1
-                time.sleep(0.1)
-                continue
-            
-            if dry_run:
-                print(f"  [DRY RUN] {issue_key}: {current_name or '미할당'} → {frontend_assignee}")
-                updated += 1
-                continue
-            
-            success = self.set_assignee(issue_key, frontend_account_id)
-            if success:
-                print(f"  ✓ {issue_key}: {frontend_assignee}에게 할당 완료")
-                updated += 1
+        def report(result: dict) -> None:
+            if result["ok"]:
+                print(f"  ✓ {result['key']}: {names[result['fields']['assignee']]}에게 할당 완료")
             else:
-                failed += 1
-            
-            time.sleep(0.3)  # API rate limit 고려
+                print(f"  ✗ {result['key']}: {result['error']}")
         
-        print(f"\n총 {updated}개 이슈 담당자 설정, {skipped}개 스킵, {failed}개 실패.")
+        results = desired.apply_changes(self.jira_url, self.headers, changes, on_result=report)
+        updated = sum(1 for r in results if r["ok"])
+        failed = len(results) - updated + len(missing)
+        print(f"\n총 {updated}개 이슈 담당자 설정, {len(unchanged)}개 스킵, {failed}개 실패.")
 
 
 def main():
@@ -167,25 +104,9 @@ def main():
     parser.add_argument('--dry-run', action='store_true', help='실제 변경 없이 미리보기만')
     args = parser.parse_args()
     
-    jira_url = os.getenv('JIRA_URL')
-    jira_email = os.getenv('JIRA_EMAIL')
-    jira_api_token = os.getenv('JIRA_API_TOKEN')
-    
     # 환경 변수가 없으면 docs/jira/jira.env 파일 읽기
-    if not all([jira_url, jira_email, jira_api_token]):
-        env_file = 'docs/jira/jira.env'
-        if os.path.exists(env_file):
-            with open(env_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if '=' in line and not line.startswith('#'):
-                        key, value = line.split('=', 1)
-                        if key == 'JIRA_URL':
-                            jira_url = value
-                        elif key == 'JIRA_EMAIL':
-                            jira_email = value
-                        elif key == 'JIRA_API_TOKEN':
-                            jira_api_token = value
+    session.load_env()
+    jira_url, jira_email, jira_api_token = session.credentials()
     
     if not all([jira_url, jira_email, jira_api_token]):
         print("오류: JIRA_URL, JIRA_EMAIL, JIRA_API_TOKEN 환경 변수 또는 인자가 필요합니다.")
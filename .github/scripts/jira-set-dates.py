@@ -5,12 +5,9 @@ JIRA 이슈에 작업 일정(시작일/종료일) 설정 스크립트
 백로그 문서의 Epic/Story/Task 구조와 주차 정보를 파싱하여 날짜를 계산하고 JIRA API로 설정
 """
 import re
-import json
 import os
 import argparse
-import base64
-import requests
-import time
+from jiralib import backlog, desired, session
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
@@ -51,72 +48,54 @@ def week_range(start_date: datetime, week_index: int, days_per_week: int = 4) ->
     return (week_start, week_end)
 
 
+def _explicit_date(sprint: str) -> Optional[str]:
+    """Sprint 텍스트의 "기한: YYYY-MM-DD" (없으면 None)."""
+    date_match = re.search(r'기한:\s*(\d{4}-\d{2}-\d{2})', sprint)
+    return date_match.group(1) if date_match else None
+
+
 def parse_backlog_structure(backlog_path: str, is_frontend: bool) -> List[Dict]:
     """
     백로그 문서를 파싱하여 (id, week_number, type, explicit_date) 목록 반환.
     type: 'epic' | 'story' | 'task'
     explicit_date: 명시적으로 지정된 날짜 (YYYY-MM-DD) 또는 None
     """
-    with open(backlog_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    doc = backlog.load(backlog_path)
 
     items = []
-    # Epic 패턴 (GAM-1 또는 GAMF-1 형식)
-    epic_pattern = r'\*\*Epic ID\*\*:\s*(\S+).*?\*\*Target Sprint\*\*:\s*(.+?)(?:\n|$)'
-    for m in re.finditer(epic_pattern, content, re.DOTALL):
-        epic_id = m.group(1).strip()
-        sprint = m.group(2).strip()
-        
-        # "기한: YYYY-MM-DD" 형식이 있는지 먼저 확인
-        explicit_date = None
-        date_match = re.search(r'기한:\s*(\d{4}-\d{2}-\d{2})', sprint)
-        if date_match:
-            explicit_date = date_match.group(1)
-        
-        week = parse_week_number(sprint)
-        if week or explicit_date:
-            items.append({'id': epic_id, 'week': week, 'type': 'epic', 'explicit_date': explicit_date})
-
-    # Story 패턴: ### Story GAM-11: ... **Sprint**: Week 1
-    story_pattern = r'### Story (\S+):\s*(.+?)(?=### Story \S+:|## Epic \d+:|$)'
-    for m in re.finditer(story_pattern, content, re.DOTALL):
-        story_id = m.group(1).strip()
-        story_text = m.group(2)
-        sprint_match = re.search(r'\*\*Sprint\*\*:\s*(.+?)(?:\n|$)', story_text)
-        sprint = sprint_match.group(1).strip() if sprint_match else ""
-        
-        # "기한: YYYY-MM-DD" 형식이 있는지 먼저 확인
-        explicit_date = None
-        date_match = re.search(r'기한:\s*(\d{4}-\d{2}-\d{2})', sprint)
-        if date_match:
-            explicit_date = date_match.group(1)
-        
+    # Epic (GAM-1 또는 GAMF-1 형식): **Target Sprint**
+    for epic in doc.epics:
+        sprint = epic.fields.get('Target Sprint')
+        if not epic.id or sprint is None:
+            continue
+        explicit_date = _explicit_date(sprint)
         week = parse_week_number(sprint)
         if week or explicit_date:
-            items.append({'id': story_id, 'week': week, 'type': 'story', 'explicit_date': explicit_date})
+            items.append({'id': epic.id, 'week': week, 'type': 'epic', 'explicit_date': explicit_date})
 
-    # Task 패턴: - [ ] GAM-11-1: ...
-    # Task는 부모 Story의 주차를 사용하므로 Story 목록을 먼저 만들어서 story_id -> (week, explicit_date) 매핑
+    # Story: ### Story GAM-11: ... **Sprint**: Week 1
     story_info = {}
-    for it in items:
-        if it['type'] == 'story':
-            story_info[it['id']] = {'week': it.get('week'), 'explicit_date': it.get('explicit_date')}
-
-    task_pattern = r'- \[ \] (\S+):\s*'
-    for m in re.finditer(task_pattern, content):
-        task_id = m.group(1).strip()
-        # GAM-11-1 -> story_id = GAM-11
-        parts = task_id.split('-')
-        if len(parts) >= 2 and re.match(r'^[\w]+-\d+-\d+$', task_id):
-            story_id = '-'.join(parts[:-1])  # GAM-11
-            info = story_info.get(story_id)
-            if info and (info['week'] or info['explicit_date']):
-                items.append({
-                    'id': task_id, 
-                    'week': info['week'], 
-                    'type': 'task',
-                    'explicit_date': info['explicit_date']
-                })
+    for story in doc.stories:
+        sprint = story.fields.get('Sprint', '')
+        explicit_date = _explicit_date(sprint)
+        week = parse_week_number(sprint)
+        if week or explicit_date:
+            items.append({'id': story.id, 'week': week, 'type': 'story', 'explicit_date': explicit_date})
+            story_info[story.id] = {'week': week, 'explicit_date': explicit_date}
+
+    # Task: - [ ] GAM-11-1: ... 는 부모 Story(키에서 유도)의 주차를 사용
+    for task in doc.tasks:
+        if task.checked or not re.match(r'^[\w]+-\d+-\d+$', task.id):
+            continue
+        story_id = task.id.rsplit('-', 1)[0]  # GAM-11-1 -> GAM-11
+        info = story_info.get(story_id)
+        if info:
+            items.append({
+                'id': task.id,
+                'week': info['week'],
+                'type': 'task',
+                'explicit_date': info['explicit_date']
+            })
 
     return items
 
@@ -145,20 +124,12 @@ class JiraSetDates:
         self.backend_weeks = backend_weeks
         self.frontend_weeks = frontend_weeks
 
-        auth_string = f"{jira_email}:{jira_api_token}"
-        self.auth_header = base64.b64encode(auth_string.encode()).decode()
-        self.headers = {
-            "Authorization": f"Basic {self.auth_header}",
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        }
+        self.headers = session.auth_headers(jira_email, jira_api_token)
         self.mapping: Dict[str, str] = {}
         self.calendar = build_week_calendar(start_date, backend_weeks, frontend_weeks)
 
     def load_mapping(self) -> None:
-        with open(self.mapping_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        for k, v in data.items():
+        for k, v in session.load_mapping(self.mapping_file).items():
             if not k.startswith('_') and isinstance(v, str):
                 self.mapping[k] = v
 
@@ -179,34 +150,6 @@ class JiraSetDates:
         j = min(i + step, len(days)) - 1
         return (days[i].strftime('%Y-%m-%d'), days[j].strftime('%Y-%m-%d'))
 
-    def get_issue_duedate(self, issue_key: str) -> Optional[str]:
-        """이슈의 현재 duedate 조회 (중복 설정 방지용)."""
-        url = f"{self.jira_url}/rest/api/3/issue/{issue_key}"
-        try:
-            r = requests.get(url, headers=self.headers, params={"fields": "duedate"})
-            if r.status_code != 200:
-                return None
-            data = r.json()
-            return (data.get("fields") or {}).get("duedate")
-        except Exception:
-            return None
-
-    def set_issue_dates(self, issue_key: str, start_date: str, due_date: str) -> bool:
-        """JIRA 이슈에 시작일/종료일 설정."""
-        url = f"{self.jira_url}/rest/api/3/issue/{issue_key}"
-        payload = {"fields": {"duedate": due_date}}
-        # Start date: customfield_10015 등 프로젝트별로 다를 수 있음
-        try:
-            r = requests.put(url, headers=self.headers, json=payload)
-            if r.status_code == 204:
-                return True
-            # duedate만 실패할 수 있으므로 400이면 로그만
-            if r.status_code != 204:
-                return False
-        except Exception:
-            return False
-        return True
-
     def run(self, backlog_backend: str, backlog_frontend: str, dry_run: bool = False,
             skip_if_set: bool = False) -> None:
         self.load_mapping()
@@ -243,8 +186,9 @@ class JiraSetDates:
         frontend_dates = assign_dates(frontend_items, True)
         all_dates = backend_dates + frontend_dates
 
-        updated = 0
-        skipped = 0
+        # 원하는 duedate (같은 JIRA 키가 여러 번 나오면 나중 값)
+        wanted: Dict[str, Dict[str, str]] = {}
+        labels: Dict[str, str] = {}  # JIRA 키 -> 백로그 ID (출력용)
         for backlog_id, start_d, end_d in all_dates:
             jira_key = self.mapping.get(backlog_id)
             # 매핑에 없으면 백엔드(GAM-*)는 이슈 키가 백로그 ID와 동일
@@ -252,29 +196,45 @@ class JiraSetDates:
                 jira_key = backlog_id
             if not jira_key:
                 continue
-            if dry_run:
-                print(f"[DRY RUN] {backlog_id} -> {jira_key}: {start_d} ~ {end_d}")
-                updated += 1
-                continue
+            wanted[jira_key] = {'duedate': end_d}
+            labels[jira_key] = backlog_id
+
+        # 현재 duedate 를 일괄 조회해 달라진 이슈만 PUT (이슈별 GET 없음, 재실행 시 검색 요청만)
+        current = desired.fetch_current(self.jira_url, self.headers, wanted, ['duedate'])
+        changes, unchanged, missing = desired.plan(current, wanted)
+        skipped = len(unchanged)
+        for key in unchanged:
+            print(f"  ⊘ {labels[key]} -> {key}: 동일한 duedate({wanted[key]['duedate']}), 스킵")
+        for key in missing:
+            print(f"  ✗ {labels[key]} -> {key}: 이슈 조회 실패, 스킵")
+        if skip_if_set:
             # 중복 일정 방지: 이미 duedate가 설정된 경우 스킵
-            current_due = self.get_issue_duedate(jira_key)
-            if current_due is not None:
-                if skip_if_set:
-                    print(f"  ⊘ {backlog_id} -> {jira_key}: 이미 설정됨(duedate={current_due}), 스킵")
-                    skipped += 1
-                    time.sleep(0.2)
-                    continue
-                if current_due == end_d:
-                    print(f"  ⊘ {backlog_id} -> {jira_key}: 동일한 duedate({end_d}), 스킵")
+            kept = []
+            for change in changes:
+                if change['before'].get('duedate') is not None:
+                    print(f"  ⊘ {labels[change['key']]} -> {change['key']}: "
+                          f"이미 설정됨(duedate={change['before']['duedate']}), 스킵")
                     skipped += 1
-                    time.sleep(0.2)
-                    continue
-            if self.set_issue_dates(jira_key, start_d, end_d):
-                print(f"  ✓ {backlog_id} -> {jira_key}: duedate={end_d}")
-                updated += 1
+                else:
+                    kept.append(change)
+            changes = kept
+
+        if dry_run:
+            for change in changes:
+                print(f"[DRY RUN] {labels[change['key']]} -> {change['key']}: "
+                      f"{change['before'].get('duedate')} -> {change['fields']['duedate']}")
+            print(f"\n[DRY RUN] {len(changes)}개 이슈 날짜 변경 예정, {skipped}개 스킵(중복 방지).")
+            return
+
+        def report(result: Dict) -> None:
+            label = labels[result['key']]
+            if result['ok']:
+                print(f"  ✓ {label} -> {result['key']}: duedate={result['fields']['duedate']}")
             else:
-                print(f"  ✗ {backlog_id} -> {jira_key}: 설정 실패")
-            time.sleep(0.3)
+                print(f"  ✗ {label} -> {result['key']}: 설정 실패")
+
+        results = desired.apply_changes(self.jira_url, self.headers, changes, on_result=report)
+        updated = sum(1 for r in results if r['ok'])
         print(f"\n총 {updated}개 이슈 날짜 설정, {skipped}개 스킵(중복 방지).")
 
 
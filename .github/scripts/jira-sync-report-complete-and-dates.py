@@ -7,8 +7,7 @@ import os
 import sys
 import argparse
 import base64
-import time
-import requests
+from jiralib import http, workflow
 from typing import List, Tuple
 
 # 완료 처리할 이슈 (리포트상 이미 완료로 반영된 스토리)
@@ -42,7 +41,7 @@ def load_jira_env(paths: List[str]) -> None:
 
 def get_issue_status(jira_url: str, headers: dict, issue_key: str) -> str:
     try:
-        r = requests.get(
+        r = http.get(
             f"{jira_url}/rest/api/3/issue/{issue_key}?fields=status",
             headers=headers,
         )
@@ -53,19 +52,8 @@ def get_issue_status(jira_url: str, headers: dict, issue_key: str) -> str:
         return ""
 
 
-def get_transitions(jira_url: str, headers: dict, issue_key: str) -> list:
-    try:
-        r = requests.get(
-            f"{jira_url}/rest/api/3/issue/{issue_key}/transitions",
-            headers=headers,
-        )
-        return r.json().get("transitions", []) if r.status_code == 200 else []
-    except Exception:
-        return []
-
-
 def transition_to_done(jira_url: str, headers: dict, issue_key: str) -> bool:
-    transitions = get_transitions(jira_url, headers, issue_key)
+    transitions = workflow.get_transitions(jira_url, headers, issue_key)
     done_names = ["done", "완료", "complete", "closed", "종료", "resolved", "해결됨"]
     tid = None
     for t in transitions:
@@ -77,12 +65,7 @@ def transition_to_done(jira_url: str, headers: dict, issue_key: str) -> bool:
         tid = transitions[0].get("id")
     if not tid:
         return False
-    r = requests.post(
-        f"{jira_url}/rest/api/3/issue/{issue_key}/transitions",
-        headers=headers,
-        json={"transition": {"id": tid}},
-    )
-    return r.status_code == 204
+    return workflow.post_transition(jira_url, headers, issue_key, tid)
 
 
 def is_done_status(status_name: str) -> bool:
@@ -95,7 +78,7 @@ def set_duedate(jira_url: str, headers: dict, issue_key: str, duedate: str) -> b
     url = f"{jira_url}/rest/api/3/issue/{issue_key}"
     payload = {"fields": {"duedate": duedate}}
     try:
-        r = requests.put(url, headers=headers, json=payload)
+        r = http.put(url, headers=headers, json=payload)
         return r.status_code == 204
     except Exception:
         return False
@@ -138,9 +121,9 @@ def main():
 
     # 1) GAM-7,8,9,10 중 To Do 등 → 완료 전환
     print("1) 완료 처리 (GAM-7, 8, 9, 10)")
+    workflow.prime(jira_url, headers, TO_DONE_KEYS)
     for key in TO_DONE_KEYS:
         status = get_issue_status(jira_url, headers, key)
-        time.sleep(0.2)
         if not status:
             print(f"  ✗ {key} 조회 실패")
             continue
@@ -151,7 +134,6 @@ def main():
                 print(f"  ✓ {key} 완료")
             else:
                 print(f"  ✗ {key} 전환 실패")
-        time.sleep(0.35)
 
     # 2) 기한(duedate) 설정
     print("\n2) 기한(duedate) 설정")
@@ -160,7 +142,6 @@ def main():
             print(f"  ✓ {key} duedate={duedate}")
         else:
             print(f"  ✗ {key} duedate 설정 실패")
-        time.sleep(0.3)
 
     print("\n완료.")
 
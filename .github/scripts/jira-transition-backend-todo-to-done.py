@@ -8,8 +8,7 @@ import os
 import sys
 import argparse
 import base64
-import time
-import requests
+from jiralib import http, workflow
 from typing import List
 
 # 코드 검증 완료된 백엔드 이슈 (JIRA 키 = 백로그 키; GAM-55, 70, 71 제외)
@@ -40,7 +39,7 @@ def load_jira_env(paths: List[str]) -> None:
 def get_issue_status(jira_url: str, headers: dict, issue_key: str) -> str:
     """이슈 현재 상태 이름 반환. 실패 시 빈 문자열."""
     try:
-        r = requests.get(
+        r = http.get(
             f"{jira_url}/rest/api/3/issue/{issue_key}?fields=status",
             headers=headers,
         )
@@ -51,19 +50,8 @@ def get_issue_status(jira_url: str, headers: dict, issue_key: str) -> str:
         return ""
 
 
-def get_transitions(jira_url: str, headers: dict, issue_key: str) -> list:
-    try:
-        r = requests.get(
-            f"{jira_url}/rest/api/3/issue/{issue_key}/transitions",
-            headers=headers,
-        )
-        return r.json().get("transitions", []) if r.status_code == 200 else []
-    except Exception:
-        return []
-
-
 def transition_to_done(jira_url: str, headers: dict, issue_key: str) -> bool:
-    transitions = get_transitions(jira_url, headers, issue_key)
+    transitions = workflow.get_transitions(jira_url, headers, issue_key)
     done_names = ["done", "완료", "complete", "closed", "종료", "resolved", "해결됨"]
     tid = None
     for t in transitions:
@@ -75,12 +63,7 @@ def transition_to_done(jira_url: str, headers: dict, issue_key: str) -> bool:
         tid = transitions[0].get("id")
     if not tid:
         return False
-    r = requests.post(
-        f"{jira_url}/rest/api/3/issue/{issue_key}/transitions",
-        headers=headers,
-        json={"transition": {"id": tid}},
-    )
-    return r.status_code == 204
+    return workflow.post_transition(jira_url, headers, issue_key, tid)
 
 
 def is_done_status(status_name: str) -> bool:
@@ -125,7 +108,6 @@ def main():
 
     for key in sorted(jira_keys_to_check):
         status = get_issue_status(jira_url, headers, key)
-        time.sleep(0.2)
         if not status:
             not_found_or_error.append(key)
             continue
@@ -151,6 +133,8 @@ def main():
             print(f"  [DRY RUN] {k} → 완료")
         return
 
+    workflow.prime(jira_url, headers, to_transition)
+
     ok, fail = 0, 0
     for k in to_transition:
         if transition_to_done(jira_url, headers, k):
@@ -159,7 +143,6 @@ def main():
         else:
             print(f"  ✗ {k} 전환 실패")
             fail += 1
-        time.sleep(0.35)
     print(f"\n완료: 성공 {ok}개, 실패 {fail}개.")
 
 
@@ -14,8 +14,8 @@ import os
 import sys
 import argparse
 import base64
-import time
-import requests
+from jiralib import workflow
+from jiralib.issues import fetch_issue_statuses
 from pathlib import Path
 from typing import Dict, List
 
@@ -31,7 +31,7 @@ BACKEND_EPIC_CHILDREN: Dict[str, List[str]] = {
 
 
 def build_epic_to_children(project_root: Path) -> Dict[str, List[str]]:
-    """jira-task-to-epic-mapping.json에서 에픽별 하위(Task) 목록 구성. 없으면 Story 폴백."""
+    """jira-task-to-epic-mapping.json에서 에픽별 하위(Task) 목록 구성 (매핑의 모든 에픽). 없으면 Story 폴백."""
     mapping_path = project_root / ".github" / "jira-task-to-epic-mapping.json"
     if not mapping_path.exists():
         return BACKEND_EPIC_CHILDREN
@@ -45,10 +45,11 @@ def build_epic_to_children(project_root: Path) -> Dict[str, List[str]]:
         if epic_key not in epic_to_tasks:
             epic_to_tasks[epic_key] = []
         epic_to_tasks[epic_key].append(task_key)
-    # 에픽 1~6에 대해 매핑에 없는 에픽은 Story 폴백
-    result: Dict[str, List[str]] = {}
-    for epic_key in BACKEND_EPIC_CHILDREN:
-        result[epic_key] = sorted(epic_to_tasks[epic_key]) if epic_key in epic_to_tasks else BACKEND_EPIC_CHILDREN[epic_key]
+    # 매핑은 백엔드 백로그(JIRA_BACKLOG.md)에서 만들므로 매핑의 에픽 전부가 대상.
+    # 에픽 1~6 중 매핑에 없는 에픽은 Story 폴백
+    result: Dict[str, List[str]] = {epic_key: sorted(keys) for epic_key, keys in epic_to_tasks.items()}
+    for epic_key, story_keys in BACKEND_EPIC_CHILDREN.items():
+        result.setdefault(epic_key, story_keys)
     return result
 
 
@@ -67,32 +68,8 @@ def load_jira_env(paths: List[str]) -> None:
                     os.environ[k] = v
 
 
-def get_issue_status(jira_url: str, headers: dict, issue_key: str) -> str:
-    try:
-        r = requests.get(
-            f"{jira_url}/rest/api/3/issue/{issue_key}?fields=status",
-            headers=headers,
-        )
-        if r.status_code != 200:
-            return ""
-        return ((r.json().get("fields") or {}).get("status") or {}).get("name") or ""
-    except Exception:
-        return ""
-
-
-def get_transitions(jira_url: str, headers: dict, issue_key: str) -> list:
-    try:
-        r = requests.get(
-            f"{jira_url}/rest/api/3/issue/{issue_key}/transitions",
-            headers=headers,
-        )
-        return r.json().get("transitions", []) if r.status_code == 200 else []
-    except Exception:
-        return []
-
-
 def transition_to_done(jira_url: str, headers: dict, issue_key: str) -> bool:
-    transitions = get_transitions(jira_url, headers, issue_key)
+    transitions = workflow.get_transitions(jira_url, headers, issue_key)
     done_names = ["done", "완료", "complete", "closed", "종료", "resolved", "해결됨"]
     tid = None
     for t in transitions:
@@ -104,12 +81,7 @@ def transition_to_done(jira_url: str, headers: dict, issue_key: str) -> bool:
         tid = transitions[0].get("id")
     if not tid:
         return False
-    r = requests.post(
-        f"{jira_url}/rest/api/3/issue/{issue_key}/transitions",
-        headers=headers,
-        json={"transition": {"id": tid}},
-    )
-    return r.status_code == 204
+    return workflow.post_transition(jira_url, headers, issue_key, tid)
 
 
 def is_done_status(status_name: str) -> bool:
@@ -154,17 +126,26 @@ def main():
     already_done: List[str] = []
     children_not_all_done: List[str] = []
 
+    # 에픽과 하위 이슈 상태를 한 번에 일괄 조회
+    all_keys = set(epic_to_children)
+    for child_keys in epic_to_children.values():
+        all_keys.update(child_keys)
+    statuses = fetch_issue_statuses(jira_url, headers, all_keys)
+    for key, info in statuses.items():
+        workflow.remember(key, info["issuetype"], info["status"])
+
+    def status_of(key: str) -> str:
+        return statuses.get(key, {}).get("status", "")
+
     for epic_key, child_keys in epic_to_children.items():
-        time.sleep(0.2)
-        epic_status = get_issue_status(jira_url, headers, epic_key)
+        epic_status = status_of(epic_key)
         if is_done_status(epic_status):
             already_done.append(epic_key)
             continue
         # 100% 기준: 하위 항목 전원 Done일 때만 에픽 Done. 하나라도 미완료면 스킵.
         all_children_done = True
         for ck in sorted(child_keys):
-            time.sleep(0.2)
-            st = get_issue_status(jira_url, headers, ck)
+            st = status_of(ck)
             if not is_done_status(st):
                 all_children_done = False
                 break
@@ -192,7 +173,6 @@ def main():
             print(f"  ✓ {epic_key} 완료")
         else:
             print(f"  ✗ {epic_key} 전환 실패")
-        time.sleep(0.35)
     print("\n완료.")
 
 
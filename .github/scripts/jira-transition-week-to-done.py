@@ -9,9 +9,8 @@ import sys
 import json
 import argparse
 import base64
-import time
-import requests
-from typing import Set, List
+from jiralib import workflow
+from typing import Set
 
 
 # 백엔드 Week 1 (JIRA_BACKLOG): Epic 1, Story 11,12,13 + Tasks
@@ -49,16 +48,8 @@ def load_mapping(mapping_file: str) -> dict:
     return m
 
 
-def get_transitions(jira_url: str, headers: dict, issue_key: str) -> list:
-    try:
-        r = requests.get(f"{jira_url}/rest/api/3/issue/{issue_key}/transitions", headers=headers)
-        return r.json().get("transitions", []) if r.status_code == 200 else []
-    except Exception:
-        return []
-
-
 def transition_to_done(jira_url: str, headers: dict, issue_key: str) -> bool:
-    transitions = get_transitions(jira_url, headers, issue_key)
+    transitions = workflow.get_transitions(jira_url, headers, issue_key)
     done_names = ["done", "완료", "complete", "closed", "종료", "resolved", "해결됨"]
     tid = None
     for t in transitions:
@@ -70,12 +61,7 @@ def transition_to_done(jira_url: str, headers: dict, issue_key: str) -> bool:
         tid = transitions[0].get("id")
     if not tid:
         return False
-    r = requests.post(
-        f"{jira_url}/rest/api/3/issue/{issue_key}/transitions",
-        headers=headers,
-        json={"transition": {"id": tid}},
-    )
-    return r.status_code == 204
+    return workflow.post_transition(jira_url, headers, issue_key, tid)
 
 
 def main():
@@ -120,6 +106,8 @@ def main():
             print(f"  [DRY RUN] {k}")
         return
 
+    workflow.prime(jira_url, headers, ordered)
+
     ok, fail = 0, 0
     for k in ordered:
         if transition_to_done(jira_url, headers, k):
@@ -128,7 +116,6 @@ def main():
         else:
             print(f"  ✗ {k} 전환 실패")
             fail += 1
-        time.sleep(0.35)
     print(f"\n완료: 성공 {ok}개, 실패 {fail}개.")
 
 
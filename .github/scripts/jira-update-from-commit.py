@@ -7,10 +7,8 @@ GitHub Actions CI/CD에서 push 시 자동 실행용.
 import os
 import re
 import sys
-import base64
-import requests
-import time
-from typing import List, Set
+from jiralib import session, workflow
+from typing import Set
 
 
 def extract_issue_keys_from_message(message: str, pattern: str = r'GAM-\d+') -> Set[str]:
@@ -20,23 +18,10 @@ def extract_issue_keys_from_message(message: str, pattern: str = r'GAM-\d+') ->
     return set(re.findall(pattern, message, re.IGNORECASE))
 
 
-def get_available_transitions(jira_url: str, headers: dict, issue_key: str) -> List[dict]:
-    """이슈의 가능한 상태 전환 목록 조회"""
-    try:
-        url = f"{jira_url}/rest/api/3/issue/{issue_key}/transitions"
-        response = requests.get(url, headers=headers)
-        if response.status_code == 200:
-            data = response.json()
-            return data.get('transitions', [])
-        return []
-    except Exception:
-        return []
-
-
 def transition_to_done(jira_url: str, headers: dict, issue_key: str) -> bool:
     """이슈를 Done(완료) 상태로 전환"""
     try:
-        transitions = get_available_transitions(jira_url, headers, issue_key)
+        transitions = workflow.get_transitions(jira_url, headers, issue_key)
         done_names = ['done', '완료', 'complete', 'closed', '종료', 'resolved', '해결됨']
         transition_id = None
         for trans in transitions:
@@ -48,17 +33,13 @@ def transition_to_done(jira_url: str, headers: dict, issue_key: str) -> bool:
             transition_id = transitions[0].get('id')
         if not transition_id:
             return False
-        url = f"{jira_url}/rest/api/3/issue/{issue_key}/transitions"
-        response = requests.post(url, headers=headers, json={"transition": {"id": transition_id}})
-        return response.status_code == 204
+        return workflow.post_transition(jira_url, headers, issue_key, transition_id)
     except Exception:
         return False
 
 
 def main():
-    jira_url = os.getenv('JIRA_URL', '').rstrip('/')
-    jira_email = os.getenv('JIRA_EMAIL', '')
-    jira_api_token = os.getenv('JIRA_API_TOKEN', '')
+    jira_url, jira_email, jira_api_token = session.credentials()
     commit_message = os.getenv('COMMIT_MESSAGE', '')
     commit_messages = os.getenv('COMMIT_MESSAGES', '')  # newline-separated multiple
     issue_pattern = os.getenv('JIRA_ISSUE_PATTERN', r'GAM-\d+')
@@ -81,13 +62,9 @@ def main():
         print("커밋 메시지에서 JIRA 이슈 키를 찾지 못했습니다.")
         sys.exit(0)
 
-    auth_string = f"{jira_email}:{jira_api_token}"
-    auth_header = base64.b64encode(auth_string.encode()).decode()
-    headers = {
-        "Authorization": f"Basic {auth_header}",
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
+    headers = session.auth_headers(jira_email, jira_api_token)
+
+    workflow.prime(jira_url, headers, keys)
 
     ok = 0
     for issue_key in sorted(keys):
@@ -96,7 +73,6 @@ def main():
             ok += 1
         else:
             print(f"JIRA {issue_key} -> 완료 처리 실패 또는 이미 완료")
-        time.sleep(0.3)
     print(f"처리: {ok}/{len(keys)} 이슈 완료 상태로 업데이트됨.")
 
 
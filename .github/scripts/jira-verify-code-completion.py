@@ -5,15 +5,17 @@ JIRA 완료 상태 vs 실제 코드 검증
 완료 처리된 Task에 해당하는 파일/코드가 실제로 존재하는지 검증
 """
 import json
-import os
 import re
 from pathlib import Path
 from typing import Optional
 
+from jiralib.srcindex import SourceIndex
+
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 JIRA_FILE = PROJECT_ROOT / ".github" / "jira-backend-issues.json"
 OUTPUT_JSON = PROJECT_ROOT / ".github" / "code-completion-verification.json"
 OUTPUT_MD = PROJECT_ROOT / "reports" / "jira-code-verification.md"
+CODE_EXTENSIONS = (".kt", ".yml", ".yaml", ".md", ".sql", ".kts")
 
 # Task key -> 예상 파일/패턴 (여러 개 가능)
 # summary에서 추출하기 어려운 것은 명시적 매핑
@@ -119,41 +121,37 @@ def find_any_file(patterns: list) -> bool:
     """패턴 중 하나라도 파일명으로 존재하면 True. .kt/.md/.yml 등은 파일명 완전 일치만 인정."""
     if not patterns:
         return False
+    files_by_name = code_index().files_by_name
     for pattern in patterns:
         exact_match = pattern.endswith(".kt") or pattern.endswith(".md") or pattern.endswith(".yml") or pattern.endswith(".sql")
-        for root, dirs, files in os.walk(PROJECT_ROOT):
-            if "node_modules" in root or ".git" in root or "build" in root:
-                continue
-            for f in files:
-                if exact_match:
-                    if f == pattern:
-                        return True
-                else:
-                    if pattern in f or f == pattern:
-                        return True
+        if pattern in files_by_name:
+            return True
+        if not exact_match and any(pattern in f for f in files_by_name):
+            return True
     return False
 
 
+def _excluded_dir(root: str) -> bool:
+    # 경로 어딘가에 포함되면 제외 (.github, buildSrc 등도 해당) - 기존 검색 범위 유지
+    return "node_modules" in root or ".git" in root or "build" in root
+
+
+_code_index: Optional[SourceIndex] = None
+
+
+def code_index() -> SourceIndex:
+    """프로젝트 파일명·소스/설정 파일 인덱스 (최초 호출 시 한 번만 순회, .gitignore 반영)."""
+    global _code_index
+    if _code_index is None:
+        _code_index = SourceIndex(PROJECT_ROOT, CODE_EXTENSIONS, exclude=_excluded_dir, cache_name="code-index")
+    return _code_index
+
+
 def search_in_code(patterns: list) -> bool:
     """소스/설정 파일 내용에 패턴이 하나라도 있으면 True"""
     if not patterns:
         return False
-    ext = (".kt", ".yml", ".yaml", ".md", ".sql", ".kts")
-    for root, dirs, files in os.walk(PROJECT_ROOT):
-        if "node_modules" in root or ".git" in root or "build" in root:
-            continue
-        for f in files:
-            if not any(f.endswith(e) for e in ext):
-                continue
-            path = Path(root) / f
-            try:
-                text = path.read_text(encoding="utf-8", errors="ignore")
-                for pat in patterns:
-                    if pat in text:
-                        return True
-            except Exception:
-                pass
-    return False
+    return code_index().contains_any(patterns)
 
 
 def verify_task(task_key: str, summary: str, expected: list) -> tuple[bool, str]:
@@ -194,6 +192,9 @@ def main():
     
     done_tasks = [i for i in issues if i["type"] == "작업" and i["status"] == "완료"]
     
+    # 전체 매핑 키워드를 파일당 한 번의 순회로 미리 검색
+    code_index().scan_keywords(p for patterns in TASK_TO_FILES.values() for p in patterns)
+    
     results = []
     by_epic = {}
     
@@ -325,6 +326,8 @@ def main():
     print(f"완료 Task: {total_done}개")
     print(f"실제 구현: {total_impl}개 ({100 * total_impl // max(total_done, 1)}%)")
     print(f"미구현: {total_done - total_impl}개")
+    index_stats = code_index().stats
+    print(f"코드 인덱스: 파일 {index_stats['files']}개 중 {index_stats['rescanned']}개 재분석")
     print(f"\nJSON: {OUTPUT_JSON}")
     print(f"리포트: {OUTPUT_MD}")
 
@@ -6,11 +6,12 @@ JIRA 완료 상태 vs 실제 코드 검증 (엄격 모드)
 - 키워드 검색: src/ 폴더만 (docs/, reports/, .github/ 제외)
 """
 import json
-import os
 import re
 from pathlib import Path
 from typing import Optional
 
+from jiralib.srcindex import SourceIndex
+
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 SRC_ROOT = PROJECT_ROOT / "src"
 JIRA_FILE = PROJECT_ROOT / ".github" / "jira-backend-issues.json"
@@ -114,56 +115,32 @@ TASK_TO_FILES = {
 }
 
 
+_src_index: Optional[SourceIndex] = None
+
+
+def src_index() -> SourceIndex:
+    """src/ 인덱스 (최초 호출 시 한 번만 순회)."""
+    global _src_index
+    if _src_index is None:
+        _src_index = SourceIndex(SRC_ROOT, cache_name="src-index")
+    return _src_index
+
+
 def verify_class_file(class_name: str, file_extension: str = ".kt") -> bool:
     """src/ 폴더에서 정확한 파일명 검색 후 클래스/인터페이스 정의 확인."""
-    if not SRC_ROOT.exists():
-        return False
-    filename = class_name + file_extension
-    for root, _dirs, files in os.walk(SRC_ROOT):
-        if filename in files:
-            path = Path(root) / filename
-            try:
-                content = path.read_text(encoding="utf-8", errors="ignore")
-                # data class X / class X / interface X
-                if re.search(
-                    rf"\b(data\s+)?class\s+{re.escape(class_name)}\b|\binterface\s+{re.escape(class_name)}\b",
-                    content,
-                ):
-                    return True
-            except Exception:
-                pass
-    return False
+    return src_index().has_class_file(class_name, file_extension)
 
 
 def verify_dto(dto_name: str) -> bool:
     """DTO: src/ 내 해당 이름 또는 XxxResponse/XxxRequest 클래스 존재."""
-    if verify_class_file(dto_name):
-        return True
-    if verify_class_file(dto_name + "Response"):
-        return True
-    if verify_class_file(dto_name + "Request"):
-        return True
-    return False
+    return any(verify_class_file(dto_name + suffix) for suffix in ("", "Response", "Request"))
 
 
 def search_in_src_only(patterns: list) -> bool:
     """src/ 폴더만 검색 (docs/, reports/, .github/ 제외). .kt, .yml, .kts (resources)."""
     if not patterns:
         return False
-    exts = (".kt", ".yml", ".yaml", ".kts")
-    for root, _dirs, files in os.walk(SRC_ROOT):
-        for f in files:
-            if not any(f.endswith(e) for e in exts):
-                continue
-            path = Path(root) / f
-            try:
-                text = path.read_text(encoding="utf-8", errors="ignore")
-                for pat in patterns:
-                    if pat in text:
-                        return True
-            except Exception:
-                pass
-    return False
+    return src_index().contains_any(patterns)
 
 
 def find_file_root(relative_path: str) -> bool:
@@ -247,6 +224,9 @@ def main():
         tasks_to_verify = [i for i in issues if i["type"] == "작업" and i["status"] == "완료"]
         out_path = OUTPUT_JSON
 
+    # 전체 매핑 키워드를 한 번에 검색해 두고 작업별로는 결과만 조회
+    src_index().scan_keywords(p for patterns in TASK_TO_FILES.values() for p in patterns)
+
     results = []
     by_epic = {}
 
@@ -354,6 +334,8 @@ def main():
     print(f"검증 Task: {total_tasks}개")
     print(f"실제 구현 (엄격): {total_impl}개 ({100 * total_impl // max(total_tasks, 1)}%)")
     print(f"미구현: {total_tasks - total_impl}개")
+    index_stats = src_index().stats
+    print(f"코드 인덱스: 파일 {index_stats['files']}개 중 {index_stats['rescanned']}개 재분석")
     print(f"\nJSON: {out_path}")
 
 
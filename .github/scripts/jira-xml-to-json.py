@@ -2,96 +2,156 @@
 # -*- coding: utf-8 -*-
 """
 JIRA XML 내보내기 파일을 JSON으로 변환
+
+XML 은 iterparse 로 <item> 단위로 읽고 읽은 item 은 바로 트리에서 떼어내므로
+댓글·변경 이력이 포함된 수백 MB 전체 프로젝트 내보내기도 메모리 사용량이 일정하다.
+결과도 이슈 단위로 바로 파일에 쓴다 (--ndjson 이면 한 줄에 이슈 하나).
+
+사용법:
+    python3 jira-xml-to-json.py
+    python3 jira-xml-to-json.py --xml export.xml --ndjson --output issues.ndjson
 """
+import argparse
 import json
+import os
 import sys
 import xml.etree.ElementTree as ET
 from pathlib import Path
+from typing import Dict, Iterator, Optional
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 XML_FILE = PROJECT_ROOT / "docs" / "jira" / "Jira_backend_issues.xml"
 OUTPUT_FILE = PROJECT_ROOT / ".github" / "jira-backend-issues.json"
 
 
+def _text(item: ET.Element, tag: str) -> Optional[str]:
+    elem = item.find(tag)
+    return elem.text.strip() if elem is not None and elem.text else None
+
+
+def _issue_from_item(item: ET.Element) -> Optional[Dict]:
+    key = _text(item, "key")
+    if key is None:
+        return None
+    return {
+        "key": key,
+        "summary": _text(item, "summary") or "",
+        "type": _text(item, "type") or "",
+        "status": _text(item, "status") or "",
+        "parent": _text(item, "parent"),
+    }
+
+
+def iter_jira_xml(xml_path: Path) -> Iterator[Dict]:
+    """JIRA XML 파일을 스트리밍 파싱해 이슈를 하나씩 반환 (RSS 의 channel/item 또는 임의 위치의 item)."""
+    stack = []
+    for event, elem in ET.iterparse(str(xml_path), events=("start", "end")):
+        if event == "start":
+            stack.append(elem)
+            continue
+        stack.pop()
+        if elem.tag != "item":
+            continue
+        issue = _issue_from_item(elem)
+        # 읽은 item 은 비우고 부모에서도 떼어내 누적되지 않게 함
+        elem.clear()
+        if stack:
+            stack[-1].remove(elem)
+        if issue:
+            yield issue
+
+
 def parse_jira_xml(xml_path: Path) -> list:
     """JIRA XML 파일 파싱"""
-    tree = ET.parse(xml_path)
-    root = tree.getroot()
-    
-    issues = []
-    
-    # RSS 형식이면 channel/item, 아니면 직접 item 찾기
-    items = root.findall(".//item")
-    
-    for item in items:
-        key_elem = item.find("key")
-        summary_elem = item.find("summary")
-        type_elem = item.find("type")
-        status_elem = item.find("status")
-        parent_elem = item.find("parent")
-        
-        if key_elem is None or key_elem.text is None:
-            continue
-        
-        key = key_elem.text.strip()
-        summary = summary_elem.text.strip() if summary_elem is not None and summary_elem.text else ""
-        issue_type = type_elem.text.strip() if type_elem is not None and type_elem.text else ""
-        status = status_elem.text.strip() if status_elem is not None and status_elem.text else ""
-        parent = parent_elem.text.strip() if parent_elem is not None and parent_elem.text else None
-        
-        issues.append({
-            "key": key,
-            "summary": summary,
-            "type": issue_type,
-            "status": status,
-            "parent": parent
-        })
-    
-    return issues
+    return list(iter_jira_xml(xml_path))
+
+
+class IssueWriter:
+    """이슈를 받는 대로 JSON 배열(json.dump indent=2 와 같은 형식) 또는 NDJSON 으로 기록. 임시 파일에 쓴 뒤 교체."""
+
+    def __init__(self, path: Path, ndjson: bool = False):
+        self.path = path
+        self.ndjson = ndjson
+        self.count = 0
+        self._tmp = f"{path}.{os.getpid()}.tmp"
+        self._f = open(self._tmp, "w", encoding="utf-8")
+
+    def write(self, issue: Dict) -> None:
+        if self.ndjson:
+            self._f.write(json.dumps(issue, ensure_ascii=False) + "\n")
+        else:
+            body = json.dumps(issue, ensure_ascii=False, indent=2).replace("\n", "\n  ")
+            self._f.write(("[\n  " if self.count == 0 else ",\n  ") + body)
+        self.count += 1
+
+    def close(self) -> None:
+        if not self.ndjson:
+            self._f.write("\n]" if self.count else "[]")
+        self._f.close()
+        os.replace(self._tmp, self.path)
+
+    def discard(self) -> None:
+        self._f.close()
+        os.remove(self._tmp)
 
 
 def main():
-    if not XML_FILE.exists():
-        print(f"❌ 오류: {XML_FILE} 파일이 없습니다", file=sys.stderr)
+    parser = argparse.ArgumentParser(description="JIRA XML 내보내기 파일을 JSON으로 변환")
+    parser.add_argument("--xml", type=Path, default=XML_FILE, help="JIRA XML 내보내기 파일")
+    parser.add_argument("--output", type=Path, help=f"출력 파일 (기본 {OUTPUT_FILE}, --ndjson 이면 확장자 .ndjson)")
+    parser.add_argument("--ndjson", action="store_true", help="한 줄에 이슈 하나씩 NDJSON 으로 저장")
+    args = parser.parse_args()
+    output = args.output or (OUTPUT_FILE.with_suffix(".ndjson") if args.ndjson else OUTPUT_FILE)
+
+    if not args.xml.exists():
+        print(f"❌ 오류: {args.xml} 파일이 없습니다", file=sys.stderr)
         sys.exit(1)
     
-    print(f"📖 XML 파일 읽기: {XML_FILE}")
-    issues = parse_jira_xml(XML_FILE)
+    print(f"📖 XML 파일 읽기: {args.xml}")
+
+    # 한 번 순회하며 저장과 통계를 함께 처리 (이슈 목록을 메모리에 들지 않음)
+    check_tasks = ["GAM-31", "GAM-32", "GAM-33", "GAM-41", "GAM-51", "GAM-61", "GAM-62"]
+    checked = []
+    by_type = {}
+    task_count = 0
+    task_nums = []
+    writer = IssueWriter(output, ndjson=args.ndjson)
+    try:
+        for issue in iter_jira_xml(args.xml):
+            writer.write(issue)
+            itype = issue["type"]
+            by_type[itype] = by_type.get(itype, 0) + 1
+            if issue["key"] in check_tasks:
+                checked.append(issue)
+            if itype == "작업":
+                task_count += 1
+                if "-" in issue["key"]:
+                    task_nums.append(int(issue["key"].split("-")[1]))
+    except BaseException:
+        writer.discard()
+        raise
+    writer.close()
     
-    print(f"✅ {len(issues)}개 이슈 파싱 완료")
+    print(f"✅ {writer.count}개 이슈 파싱 완료")
     
     # 타입별 통계
-    by_type = {}
-    for issue in issues:
-        itype = issue["type"]
-        by_type[itype] = by_type.get(itype, 0) + 1
-    
     print("\n=== 이슈 타입별 통계 ===")
     for itype, count in sorted(by_type.items()):
         print(f"  {itype}: {count}개")
     
-    # JSON 저장
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        json.dump(issues, f, ensure_ascii=False, indent=2)
-    
-    print(f"\n✅ JSON 저장: {OUTPUT_FILE}")
+    print(f"\n✅ {'NDJSON' if args.ndjson else 'JSON'} 저장: {output}")
     
     # 7개 Task Parent 확인
-    check_tasks = ["GAM-31", "GAM-32", "GAM-33", "GAM-41", "GAM-51", "GAM-61", "GAM-62"]
     print("\n=== 7개 Task Parent 확인 ===")
-    for issue in issues:
-        if issue["key"] in check_tasks:
-            print(f"  {issue['key']}: parent={issue['parent']}, summary={issue['summary'][:50]}")
+    for issue in checked:
+        print(f"  {issue['key']}: parent={issue['parent']}, summary={issue['summary'][:50]}")
     
     # Task 범위 확인
-    tasks = [i for i in issues if i["type"] == "작업"]
-    if tasks:
-        task_nums = [int(t["key"].split("-")[1]) for t in tasks if "-" in t["key"]]
-        if task_nums:
-            print(f"\n=== Task 키 범위 ===")
-            print(f"  최소: GAM-{min(task_nums)}")
-            print(f"  최대: GAM-{max(task_nums)}")
-            print(f"  총 개수: {len(tasks)}개")
+    if task_count and task_nums:
+        print(f"\n=== Task 키 범위 ===")
+        print(f"  최소: GAM-{min(task_nums)}")
+        print(f"  최대: GAM-{max(task_nums)}")
+        print(f"  총 개수: {task_count}개")
 
 
 if __name__ == "__main__":
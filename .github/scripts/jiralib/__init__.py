@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+"""
+.github/scripts 공용 라이브러리.
+
+스크립트 파일명이 하이픈(jira-*.py)이라 서로 import 할 수 없으므로,
+여러 스크립트가 공유하는 JIRA 연동 코드는 이 패키지에 둔다.
+스크립트는 `python3 .github/scripts/xxx.py`로 실행되며 스크립트 디렉터리가
+sys.path에 포함되므로 `from jiralib import http` 형태로 사용한다.
+"""
@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+"""
+JIRA 백로그 문서(JIRA_BACKLOG.md 등) 단일 패스 토크나이저 + 공용 트리.
+
+스크립트마다 DOTALL 선행 탐색 정규식으로 같은 문서를 여러 번 훑던 것을 대체한다.
+구조 줄만 잡는 토큰 정규식으로 문서를 한 번 훑어 Epic → Story → Task 트리를 만들고
+각 노드에 원문 위치(줄 번호, 문자 오프셋)를 기록한다. 여러 줄 값은 토큰 사이 구간을 그대로 잘라 쓴다.
+
+문서 형식:
+    ## Epic N: 제목
+    **Epic ID**: GAM-1            ← 첫 Story 전의 `**필드**: 값` 은 Epic 필드
+    ### Story GAM-11: 제목
+    **Sprint**: Week 1            ← Story 필드 (값이 여러 줄이면 다음 필드/제목/--- 전까지)
+    **Tasks**:
+    - [ ] GAM-11-1: 설명          ← Tasks 블록의 체크박스 줄 (이어지는 줄은 빈 줄 전까지 설명에 포함)
+코드 펜스(```) 안의 줄은 구조로 해석하지 않는다.
+
+파싱 결과는 .github/.cache/jira-backlog-<이름>-<경로 해시>.json 에 문서 내용의 SHA-256 과 함께 저장하고,
+load() 는 내용 해시가 같으면 정규식 없이 캐시에서 트리를 복원한다 (보고서 한 번 실행에 여러 번 읽히는 문서용).
+
+환경 변수:
+    JIRA_BACKLOG_CACHE_DIR  파싱 캐시 디렉터리 (기본 .github/.cache, 빈 값이면 비활성)
+"""
+import hashlib
+import json
+import os
+import re
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+CACHE_DIR = os.getenv("JIRA_BACKLOG_CACHE_DIR", str(PROJECT_ROOT / ".github" / ".cache"))
+CACHE_VERSION = 1
+
+# 구조 줄(줄 머리의 코드 펜스·제목·필드·체크박스 Task·구분선)만 찾는 토큰 정규식.
+# 나머지 줄(본문)은 토큰 사이 구간을 잘라 값으로 쓰므로 파이썬 루프는 구조 줄 수에만 비례한다.
+TOKEN_RE = re.compile(
+    r"^[ \t]*(?:"
+    r"(?P<fence>```)"
+    r"|(?P<heading>#[^\n]*)"
+    r"|\*\*(?P<field>[^*\n]+)\*\*:[ \t]*"
+    r"|(?P<rule>---)[ \t]*\r?$"
+    r"|-[ \t]*\[(?P<mark>[ xX])\][ \t]+(?P<task>\S+?)[ \t]*:[ \t]*"
+    r")",
+    re.MULTILINE,
+)
+EPIC_HEADING_RE = re.compile(r"## Epic \d+:\s*(.*)")
+STORY_HEADING_RE = re.compile(r"### Story (\S+?):\s*(.*)")
+BLANK_LINE_RE = re.compile(r"\n[ \t]*\r?\n")
+POINTS_RE = re.compile(r"(\d+)\s*SP")
+FENCE_RE = re.compile(r"```[^\n]*\n(.*?)\n?```", re.DOTALL)
+
+
+@dataclass
+class Task:
+    id: str
+    title: str  # 체크박스 줄의 설명
+    description: str  # 이어지는 줄 포함
+    checked: bool
+    story_id: str
+    line: int  # 1부터
+    start: int  # 문서 내 문자 오프셋
+    end: int
+
+
+@dataclass
+class Story:
+    id: str
+    title: str
+    epic_id: str  # 소속 Epic 의 Epic ID (없으면 "")
+    line: int
+    start: int
+    end: int
+    fields: Dict[str, str] = field(default_factory=dict)  # 필드명 -> 같은 줄 값
+    blocks: Dict[str, str] = field(default_factory=dict)  # 필드명 -> 여러 줄 값 전체
+    tasks: List[Task] = field(default_factory=list)
+
+
+@dataclass
+class Epic:
+    id: str  # **Epic ID** 값 (없으면 "")
+    heading: str  # "## Epic N:" 뒤 제목
+    line: int
+    start: int
+    end: int
+    fields: Dict[str, str] = field(default_factory=dict)
+    blocks: Dict[str, str] = field(default_factory=dict)
+    stories: List[Story] = field(default_factory=list)
+
+    @property
+    def name(self) -> str:
+        return self.fields.get("Epic Name", "")
+
+
+@dataclass
+class Backlog:
+    text: str
+    epics: List[Epic] = field(default_factory=list)
+    stories: List[Story] = field(default_factory=list)  # 문서 순서, Epic 밖 Story 포함
+    tasks: List[Task] = field(default_factory=list)
+    _references: Dict[str, Set[str]] = field(default_factory=dict, repr=False)
+
+    def references(self, prefix: str) -> Set[str]:
+        """문서 어디에든 등장하는 `{prefix}-N`, `{prefix}-N-M` 키 (prefix 별로 처음 요청 시 계산)."""
+        if prefix not in self._references:
+            key_re = re.compile(rf"\b({re.escape(prefix)}-\d+(?:-\d+)?)\b")
+            self._references[prefix] = set(key_re.findall(self.text))
+        return self._references[prefix]
+
+    def source(self, node) -> str:
+        return self.text[node.start:node.end]
+
+    def story(self, story_id: str) -> Optional[Story]:
+        return next((s for s in self.stories if s.id == story_id), None)
+
+
+def parse_points(value: str) -> str:
+    """'24 SP' -> '24' (없으면 '')."""
+    m = POINTS_RE.search(value or "")
+    return m.group(1) if m else ""
+
+
+def fenced(value: str) -> str:
+    """블록 값 안 첫 코드 펜스 내용 (없으면 '')."""
+    m = FENCE_RE.search(value or "")
+    return m.group(1).strip() if m else ""
+
+
+def parse(text: str) -> Backlog:
+    """문서 전체를 한 번 훑어 트리 생성. 시간은 문서 길이에 비례."""
+    backlog = Backlog(text=text)
+    epic: Optional[Epic] = None
+    story: Optional[Story] = None
+    owner = None  # 필드를 받을 노드 (Story 가 있으면 Story, 아니면 Epic)
+    block: Optional[tuple] = None  # (필드명, 값 시작 오프셋)
+    task: Optional[tuple] = None  # (Task, 설명 시작 오프셋)
+    in_tasks = False
+    in_fence = False
+    line_no, line_pos = 1, 0
+
+    def line_of(pos: int) -> int:
+        nonlocal line_no, line_pos
+        line_no += text.count("\n", line_pos, pos)
+        line_pos = pos
+        return line_no
+
+    def line_end(pos: int) -> int:
+        end = text.find("\n", pos)
+        return len(text) if end == -1 else end
+
+    def close_task(pos: int) -> None:
+        # Task 설명은 다음 구조 줄 또는 빈 줄 전까지
+        nonlocal task
+        if task is not None:
+            node, desc_start = task
+            blank = BLANK_LINE_RE.search(text, line_end(desc_start), pos)
+            end = blank.start() + 1 if blank else pos
+            node.description = text[desc_start:end].strip()
+            node.end = end
+            task = None
+
+    def close_block(pos: int) -> None:
+        nonlocal block
+        if block is not None and owner is not None:
+            name, value_start = block
+            owner.blocks.setdefault(name, text[value_start:pos].strip())
+        block = None
+
+    for m in TOKEN_RE.finditer(text):
+        kind = m.lastgroup
+        pos = m.start()
+        if kind == "fence":
+            in_fence = not in_fence
+            if task is not None:
+                close_task(pos)
+            continue
+        if in_fence:
+            continue
+
+        if kind == "heading":
+            close_task(pos)
+            close_block(pos)
+            in_tasks = False
+            heading = m.group("heading").rstrip()
+            hm = EPIC_HEADING_RE.match(heading) if heading.startswith("## Epic ") else None
+            if hm:
+                if story:
+                    story.end = pos
+                if epic:
+                    epic.end = pos
+                epic = Epic(id="", heading=hm.group(1).strip(), line=line_of(pos), start=pos, end=len(text))
+                backlog.epics.append(epic)
+                story, owner = None, epic
+                continue
+            hm = STORY_HEADING_RE.match(heading) if heading.startswith("### Story ") else None
+            if hm:
+                if story:
+                    story.end = pos
+                story = Story(
+                    id=hm.group(1), title=hm.group(2).strip(), epic_id=epic.id if epic else "",
+                    line=line_of(pos), start=pos, end=len(text),
+                )
+                backlog.stories.append(story)
+                if epic:
+                    epic.stories.append(story)
+                owner = story
+            continue
+
+        if kind == "field":
+            if task is not None:
+                close_task(pos)
+            close_block(pos)
+            name = m.group("field").strip()
+            if owner is not None:
+                value = text[m.end():line_end(m.end())].strip()
+                owner.fields.setdefault(name, value)
+                if owner is epic and name == "Epic ID" and not epic.id:
+                    epic.id = value.split()[0] if value else ""
+            block = (name, m.end())
+            in_tasks = name == "Tasks"
+            continue
+
+        if kind == "rule":
+            close_task(pos)
+            close_block(pos)
+            in_tasks = False
+            continue
+
+        # 체크박스 Task (Tasks 블록 안에서만)
+        if in_tasks and story is not None:
+            close_task(pos)
+            node = Task(
+                id=m.group("task"), title=text[m.end():line_end(m.end())].strip(), description="",
+                checked=m.group("mark") != " ", story_id=story.id,
+                line=line_of(pos), start=pos, end=len(text),
+            )
+            story.tasks.append(node)
+            backlog.tasks.append(node)
+            task = (node, m.end())
+
+    close_task(len(text))
+    close_block(len(text))
+    return backlog
+
+
+def _id_prefixes(doc: Backlog) -> Set[str]:
+    nodes = [*doc.epics, *doc.stories, *doc.tasks]
+    return {n.id.split("-", 1)[0] for n in nodes if "-" in n.id}
+
+
+def _span(text: str, value: str, start: int) -> list:
+    # 블록 값·Task 설명은 본문의 부분 문자열이므로 캐시에는 [오프셋, 길이] 만 저장
+    pos = text.find(value, start)
+    return [pos, len(value)] if value and pos != -1 else [value]
+
+
+def _unspan(text: str, span: list) -> str:
+    return text[span[0]:span[0] + span[1]] if len(span) == 2 else span[0]
+
+
+def _dump(doc: Backlog, digest: str) -> dict:
+    text = doc.text
+
+    def node(n) -> dict:
+        # asdict 는 하위 Story/Task 까지 재귀 복사하므로 (노드 수 × 깊이) 얕은 복사로 필드만 옮긴다
+        d = {f.name: getattr(n, f.name) for f in fields(n)}
+        if isinstance(n, Task):
+            d["description"] = _span(text, n.description, n.start)
+            return d
+        d["blocks"] = {k: _span(text, v, n.start) for k, v in n.blocks.items()}
+        if isinstance(n, Story):
+            d["tasks"] = [node(t) for t in n.tasks]
+        else:
+            d["stories"] = [node(st) for st in n.stories]
+        return d
+
+    nested = {id(s) for e in doc.epics for s in e.stories}
+    return {
+        "version": CACHE_VERSION,
+        "sha256": digest,
+        "epics": [node(e) for e in doc.epics],
+        "orphan_stories": [node(s) for s in doc.stories if id(s) not in nested],
+        # 노드 키 접두사(GAM, GAMF 등)의 참조 키도 미리 저장
+        "references": {p: sorted(doc.references(p)) for p in _id_prefixes(doc)},
+    }
+
+
+def _restore(data: dict, text: str) -> Backlog:
+    doc = Backlog(text=text)
+
+    def blocks(d: dict) -> Dict[str, str]:
+        return {k: _unspan(text, v) for k, v in d["blocks"].items()}
+
+    def story_of(d: dict) -> Story:
+        tasks = [Task(**{**t, "description": _unspan(text, t["description"])}) for t in d["tasks"]]
+        story = Story(**{**d, "blocks": blocks(d), "tasks": tasks})
+        doc.stories.append(story)
+        doc.tasks.extend(story.tasks)
+        return story
+
+    # Epic 밖 Story 는 첫 Epic 이전에만 생기므로 앞에 둔다 (문서 순서 유지)
+    for d in data["orphan_stories"]:
+        story_of(d)
+    for d in data["epics"]:
+        doc.epics.append(Epic(**{**d, "blocks": blocks(d), "stories": [story_of(s) for s in d["stories"]]}))
+    doc._references = {p: set(keys) for p, keys in data.get("references", {}).items()}
+    return doc
+
+
+def _cache_file(path: str) -> Optional[str]:
+    if not CACHE_DIR:
+        return None
+    tag = hashlib.sha1(path.encode("utf-8")).hexdigest()[:10]
+    return os.path.join(CACHE_DIR, f"jira-backlog-{Path(path).stem}-{tag}.json")
+
+
+def _read_cache(cache_file: Optional[str], digest: str, text: str) -> Optional[Backlog]:
+    if not cache_file or not os.path.exists(cache_file):
+        return None
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != CACHE_VERSION or data.get("sha256") != digest:
+            return None
+        return _restore(data, text)
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+
+
+def _write_cache(cache_file: Optional[str], doc: Backlog, digest: str) -> None:
+    if not cache_file:
+        return
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        tmp = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(json.dumps(_dump(doc, digest), ensure_ascii=False))
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass
+
+
+_loaded: Dict[str, tuple] = {}  # 경로 -> ((mtime_ns, size), Backlog)
+
+
+def load(path: str) -> Backlog:
+    """
+    파일을 파싱. 같은 프로세스에서 변경 없는 파일을 다시 부르면 이전 트리를,
+    다른 프로세스라도 내용 해시가 같으면 디스크 캐시의 트리를 돌려준다.
+    """
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _loaded.get(path)
+    if cached and cached[0] == signature:
+        return cached[1]
+    with open(path, "rb") as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw).hexdigest()
+    # 해시는 원본 바이트로, 파싱은 텍스트 모드 open() 과 같은 줄바꿈(\n)으로
+    text = raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    cache_file = _cache_file(path)
+    doc = _read_cache(cache_file, digest, text)
+    if doc is None:
+        doc = parse(text)
+        _write_cache(cache_file, doc, digest)
+    _loaded[path] = (signature, doc)
+    return doc
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+HTTP 녹화/재생 (jiralib.http 가 요청마다 사용).
+
+운영 실행의 JIRA/GitHub 응답을 파일(카세트)에 녹화해 두고, 네트워크 없이 같은 응답으로 스크립트를 다시 돌린다.
+실제 데이터로 jira-generate-report.py 같은 스크립트의 CPU 쪽을 프로파일링하거나 실행당 요청 수를 셀 때 쓴다.
+- record: 실제로 보낸 요청과 응답(상태, 헤더, 본문, 소요 시간)을 모아 종료 시 원자적으로 기록
+- replay: (메서드, URL+쿼리, 본문 해시)가 같은 녹화 응답을 녹화 순서대로 돌려준다.
+  같은 요청을 녹화보다 많이 보내면 마지막 응답을 반복하고, 녹화에 없는 요청은 CassetteMiss (ConnectionError) 로 실패한다.
+  응답 시간은 녹화된 소요 시간 × JIRA_CASSETTE_SPEED 만큼 재현한다 (0 이면 지연 없음).
+요청 헤더(Authorization 등)와 Set-Cookie 는 저장하지 않는다. 경로가 .gz 로 끝나면 gzip 으로 읽고 쓴다.
+재생 시에도 스크립트는 JIRA_URL 등 환경 변수를 요구하므로 녹화 때와 같은 URL(인증 값은 아무거나)을 지정한다.
+
+환경 변수:
+    JIRA_CASSETTE        카세트 파일 경로 (빈 값이면 비활성)
+    JIRA_CASSETTE_MODE   record | replay (기본 replay)
+    JIRA_CASSETTE_SPEED  재생 지연 배율 (기본 1 = 녹화 시간 그대로, 0 = 지연 없음)
+
+사용법:
+    JIRA_CASSETTE=/tmp/report.json.gz JIRA_CASSETTE_MODE=record python3 reports/backup/jira-generate-report.py
+    JIRA_CASSETTE=/tmp/report.json.gz JIRA_CASSETTE_SPEED=0 python3 -m cProfile -s cumtime reports/backup/jira-generate-report.py
+"""
+import atexit
+import base64
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Deque, Dict, List, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+CASSETTE = os.getenv("JIRA_CASSETTE", "")
+MODE = os.getenv("JIRA_CASSETTE_MODE", "replay")
+SPEED = float(os.getenv("JIRA_CASSETTE_SPEED", "1"))
+CASSETTE_VERSION = 1
+# 녹화하지 않는 응답 헤더 (세션 쿠키, 재생 시 의미 없는 전송 헤더)
+SKIP_HEADERS = {"set-cookie", "content-encoding", "transfer-encoding", "connection", "keep-alive"}
+
+
+class CassetteMiss(requests.ConnectionError):
+    """재생 중 녹화에 없는 요청 (스크립트에서는 네트워크 오류와 같게 처리된다)."""
+
+
+def prepare(method: str, url: str, kwargs: dict) -> requests.PreparedRequest:
+    """세션이 보낼 것과 같은 최종 URL(쿼리 포함)·본문. 헤더는 매칭에 쓰지 않으므로 제외."""
+    return requests.Request(
+        method=method.upper(), url=url,
+        params=kwargs.get("params"), data=kwargs.get("data"), json=kwargs.get("json"),
+    ).prepare()
+
+
+def request_key(prepared: requests.PreparedRequest) -> str:
+    body = prepared.body or b""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    digest = hashlib.sha1(body).hexdigest()[:16] if body else ""
+    return f"{prepared.method} {prepared.url} {digest}"
+
+
+def _open(path: str, mode: str, compressed: bool):
+    if compressed:
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class Cassette:
+    """녹화 목록(record) 또는 요청 키별 응답 큐(replay). 스레드 안전."""
+
+    def __init__(self, path: str, mode: str = "replay", speed: float = 1.0):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"JIRA_CASSETTE_MODE 는 record 또는 replay: {mode!r}")
+        self.path = path
+        self.mode = mode
+        self.speed = speed
+        self.interactions: List[dict] = []
+        self._queues: Dict[str, Deque[dict]] = {}
+        self._last: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._started = time.time()
+        if mode == "replay":
+            self.load()
+        else:
+            atexit.register(self.save)
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    # ----- 파일 -----
+
+    def load(self) -> None:
+        with _open(self.path, "r", self.path.endswith(".gz")) as f:
+            data = json.load(f)
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"카세트 버전이 다릅니다: {self.path}")
+        self.interactions = data["interactions"]
+        for item in self.interactions:
+            self._queues.setdefault(item["key"], deque()).append(item)
+
+    def save(self) -> Optional[str]:
+        """녹화 내용을 원자적으로 기록 (녹화한 요청이 없으면 기록 안 함)."""
+        with self._lock:
+            interactions = list(self.interactions)
+        if not interactions:
+            return None
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with _open(tmp, "w", self.path.endswith(".gz")) as f:
+            json.dump({
+                "version": CASSETTE_VERSION,
+                "recorded_at": datetime.fromtimestamp(self._started).isoformat(timespec="seconds"),
+                "interactions": interactions,
+            }, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+        return self.path
+
+    # ----- 녹화 -----
+
+    def record(self, prepared: requests.PreparedRequest, response: requests.Response, elapsed: float) -> None:
+        content = response.content or b""
+        try:
+            body = {"body": content.decode("utf-8")}
+        except UnicodeDecodeError:
+            body = {"body_b64": base64.b64encode(content).decode("ascii")}
+        item = {
+            "key": request_key(prepared),
+            "method": prepared.method,
+            "url": prepared.url,
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() not in SKIP_HEADERS},
+            **body,
+            "elapsed": round(elapsed, 6),
+            "offset": round(time.time() - self._started, 6),
+        }
+        with self._lock:
+            self.interactions.append(item)
+
+    # ----- 재생 -----
+
+    def replay(self, prepared: requests.PreparedRequest) -> requests.Response:
+        """녹화 응답. 녹화된 소요 시간 × speed 만큼 대기한 뒤 반환."""
+        key = request_key(prepared)
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue:
+                item = queue.popleft()
+                self._last[key] = item
+            else:
+                item = self._last.get(key)
+        if item is None:
+            raise CassetteMiss(f"카세트에 없는 요청: {prepared.method} {prepared.url}")
+        if self.speed > 0 and item["elapsed"] > 0:
+            time.sleep(item["elapsed"] * self.speed)
+        return build_response(item, prepared)
+
+
+def build_response(item: dict, prepared: requests.PreparedRequest) -> requests.Response:
+    response = requests.Response()
+    response.status_code = item["status"]
+    response.reason = item.get("reason")
+    response.headers = CaseInsensitiveDict(item.get("headers", {}))
+    if "body_b64" in item:
+        response._content = base64.b64decode(item["body_b64"])
+    else:
+        response._content = item.get("body", "").encode("utf-8")
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.url = item["url"]
+    response.request = prepared
+    response.elapsed = timedelta(seconds=item["elapsed"])
+    return response
+
+
+_active: Optional[Cassette] = None
+_active_lock = threading.Lock()
+
+
+def active() -> Optional[Cassette]:
+    """환경 변수로 지정된 카세트 (처음 호출 시 열기, 지정이 없으면 None)."""
+    global _active
+    if not CASSETTE:
+        return None
+    if _active is None:
+        with _active_lock:
+            if _active is None:
+                _active = Cassette(CASSETTE, MODE, SPEED)
+    return _active
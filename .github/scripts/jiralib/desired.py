@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+원하는 필드 값(desired state)과 JIRA 현재 값을 비교해 달라진 필드만 쓰는 공용 엔진.
+
+일정·담당자·제목·parent 를 설정하는 스크립트들이 이슈마다 GET 후 PUT 하거나
+현재 값과 상관없이 무조건 PUT 하던 것을 대체한다.
+- 현재 값: 대상 키 전체를 jiralib.session.fetch_issues 로 일괄 조회
+  (100건당 검색 1회, 같은 프로세스에서 이미 조회한 이슈는 재사용)
+- 비교: 필드별로 비교용 값(assignee -> accountId, parent -> 키 등)으로 바꿔서 다른 필드만 남김
+- 쓰기: 달라진 이슈만 asyncio 로 동시에 PUT /issue/{key} (assignee 는 PUT /issue/{key}/assignee)
+→ 이미 원하는 상태면 재실행은 검색 요청만 한다.
+
+    desired = {"GAM-11": {"duedate": "2026-01-30"}, "GAM-12": {"assignee": account_id}}
+    changes, unchanged, missing = plan(fetch_current(jira_url, headers, desired, ["duedate", "assignee"]), desired)
+    results = apply_changes(jira_url, headers, changes)
+
+환경 변수:
+    JIRA_CONCURRENCY   apply_changes 기본 동시 실행 수 (jiralib.http 공용, 기본 8)
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from jiralib import http, session
+from jiralib.http import DEFAULT_CONCURRENCY
+
+
+def _key_of(value) -> Optional[str]:
+    return (value or {}).get("key")
+
+
+def _account_of(value) -> Optional[str]:
+    return (value or {}).get("accountId")
+
+
+def _text_of(value) -> Optional[str]:
+    return value.strip() if isinstance(value, str) else value
+
+
+# 필드 -> (JIRA 응답 값 -> 비교용 값, 비교용 값 -> 쓰기 값). 없는 필드는 그대로 비교·전송.
+CODECS: Dict[str, Tuple[Callable[[Any], Any], Callable[[Any], Any]]] = {
+    "summary": (_text_of, lambda v: v),
+    "parent": (_key_of, lambda v: {"key": v} if v else None),
+    "assignee": (_account_of, lambda v: {"accountId": v}),
+}
+
+
+def read_value(field: str, value: Any) -> Any:
+    """JIRA 응답 필드 값 -> 비교용 값."""
+    codec = CODECS.get(field)
+    return codec[0](value) if codec else value
+
+
+def write_value(field: str, value: Any) -> Any:
+    """비교용 값 -> PUT 본문 값."""
+    codec = CODECS.get(field)
+    return codec[1](value) if codec else value
+
+
+def fetch_current(
+    jira_url: str,
+    headers: dict,
+    keys: Iterable[str],
+    fields: Iterable[str],
+) -> Dict[str, Dict[str, Any]]:
+    """대상 키들의 현재 필드 값 (비교용). 조회되지 않은 키(없는 이슈 등)는 결과에 없다."""
+    fields = sorted(set(fields))
+    issues = session.fetch_issues(jira_url, headers, keys, fields)
+    return {
+        key: {f: read_value(f, (issue.get("fields") or {}).get(f)) for f in fields}
+        for key, issue in issues.items()
+    }
+
+
+def plan(
+    current: Dict[str, Dict[str, Any]],
+    desired: Dict[str, Dict[str, Any]],
+) -> Tuple[List[dict], List[str], List[str]]:
+    """
+    원하는 값과 현재 값 비교.
+    Returns: (changes, unchanged, missing)
+        changes: [{"key", "fields": {달라진 필드: 원하는 값}, "before": {필드: 현재 값}}] (desired 순서)
+        unchanged: 이미 원하는 상태인 키, missing: 현재 값을 조회하지 못한 키
+    """
+    changes: List[dict] = []
+    unchanged: List[str] = []
+    missing: List[str] = []
+    for key, wanted in desired.items():
+        now = current.get(key)
+        if now is None:
+            missing.append(key)
+            continue
+        diff = {f: v for f, v in wanted.items() if now.get(f) != _text_of(v)}
+        if diff:
+            changes.append({"key": key, "fields": diff, "before": {f: now.get(f) for f in diff}})
+        else:
+            unchanged.append(key)
+    return changes, unchanged, missing
+
+
+def apply_one(jira_url: str, headers: dict, change: dict) -> dict:
+    """
+    이슈 하나의 달라진 필드만 기록.
+    Returns: {"key", "ok", "fields", "before", "error"}
+    """
+    key = change["key"]
+    fields = dict(change["fields"])
+    result = {"key": key, "ok": False, "fields": change["fields"], "before": change.get("before", {}), "error": ""}
+    try:
+        # 담당자는 편집 권한 없이도 되는 전용 엔드포인트로 (기존 담당자 스크립트와 동일)
+        if "assignee" in fields:
+            r = http.put(
+                f"{jira_url}/rest/api/3/issue/{key}/assignee",
+                headers=headers,
+                json={"accountId": fields.pop("assignee")},
+                timeout=10,
+            )
+            if r.status_code != 204:
+                result["error"] = f"담당자 설정 실패 (status: {r.status_code})"
+                return result
+        if fields:
+            r = http.put(
+                f"{jira_url}/rest/api/3/issue/{key}",
+                headers=headers,
+                json={"fields": {f: write_value(f, v) for f, v in fields.items()}},
+                timeout=10,
+            )
+            if r.status_code != 204:
+                result["error"] = f"필드 수정 실패 (status: {r.status_code})"
+                return result
+        result["ok"] = True
+    except Exception as e:
+        result["error"] = str(e)
+    return result
+
+
+async def apply_all(
+    jira_url: str,
+    headers: dict,
+    changes: Iterable[dict],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    on_result: Optional[Callable[[dict], None]] = None,
+) -> List[dict]:
+    """변경 목록을 동시에 기록. 결과는 입력 순서, on_result 는 이슈가 끝날 때마다 호출."""
+    changes = list(changes)
+    concurrency = max(1, concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        async def run(change: dict) -> dict:
+            async with semaphore:
+                result = await loop.run_in_executor(executor, apply_one, jira_url, headers, change)
+            if on_result:
+                on_result(result)
+            return result
+
+        return await asyncio.gather(*(run(change) for change in changes))
+
+
+def apply_changes(
+    jira_url: str,
+    headers: dict,
+    changes: Iterable[dict],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    on_result: Optional[Callable[[dict], None]] = None,
+) -> List[dict]:
+    """apply_all 동기 래퍼."""
+    changes = list(changes)
+    if not changes:
+        return []
+    return asyncio.run(apply_all(jira_url.rstrip("/"), headers, changes, concurrency, on_result))
@@ -0,0 +1,675 @@
+# -*- coding: utf-8 -*-
+"""
+오프라인 JIRA REST 대역 서버 (벤치마크·로컬 검증용).
+
+스크립트가 실제로 쓰는 엔드포인트만 메모리 이슈 저장소로 흉내 낸다.
+- POST/GET /rest/api/3/search/jql   (nextPageToken/isLast, fields 없으면 id 만)
+- GET /rest/api/2/search, /rest/api/3/search   (startAt/total)
+- 이슈 생성·조회·수정·삭제, POST /rest/api/3/issue/bulk (최대 50건, 부분 실패 errors)
+  생성 본문의 update.issuelinks add 는 POST /issueLink 와 같은 링크로 저장
+- GET/POST /issue/{key}/transitions, PUT /assignee, POST /comment, GET /issue/createmeta
+- POST /rest/api/3/issueLink, GET /rest/api/3/issueLinkType, GET /rest/api/3/user/search
+JQL 은 스크립트가 쓰는 부분만 해석한다: project / key / issuetype / status / parent / created / updated 의
+=, !=, <, <=, >, >=, in, not in 을 AND 로 잇고 ORDER BY 한 필드. 모르는 절은 무시한다.
+`key in (...)` 에 없는 키가 있으면 실제 JIRA 처럼 400 을 돌려준다.
+
+장애 주입 (FakeJira 인자 또는 POST /_fake/config):
+    latency / jitter    요청마다 지연(초)
+    throttle_rate       429 + Retry-After 응답 비율 (0~1)
+    retry_after         Retry-After 헤더 값(초)
+    error_rate          error_status(기본 500) 응답 비율 (0~1)
+GET /_fake/stats 는 엔드포인트별 호출 수, POST /_fake/reset 은 카운터 초기화,
+GET /_fake/snapshot 은 jira-backend-issues.json 형식 이슈 목록, POST /_fake/clear 는 이슈 전체 삭제.
+팀 관리형 프로젝트처럼 CUSTOM_FIELDS 에 없는 customfield_* 설정은 400 으로 거부한다.
+
+    jira = FakeJira()
+    jira.load(json.load(open(".github/jira-backend-issues.json")))
+    with FakeJiraServer(jira) as server:    # server.url -> JIRA_URL
+        ...
+"""
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from jiralib import metrics
+
+ISSUE_TYPES = {"10079": "에픽", "10078": "스토리", "10076": "작업", "10077": "하위 작업"}
+STATUSES = {"해야 할 일": "new", "진행 중": "indeterminate", "완료": "done"}
+TRANSITIONS = {"11": "해야 할 일", "21": "진행 중", "31": "완료"}
+LINK_TYPES = [
+    {"id": "10000", "name": "Blocks", "inward": "is blocked by", "outward": "blocks"},
+    {"id": "10001", "name": "Cloners", "inward": "is cloned by", "outward": "clones"},
+    {"id": "10002", "name": "Duplicate", "inward": "is duplicated by", "outward": "duplicates"},
+    {"id": "10003", "name": "Relates", "inward": "relates to", "outward": "relates to"},
+]
+# 팀 관리형(Next-Gen) 프로젝트처럼 여기 없는 customfield_* 는 400 (Epic Link 10011/10014 등 없음)
+CUSTOM_FIELDS = {"customfield_10015": "date", "customfield_10016": "number"}  # 시작일, 스토리 포인트
+DEFAULT_USERS = [{"accountId": "fake-0001", "emailAddress": "dev@example.com", "displayName": "Fake Developer"}]
+BULK_LIMIT = 50
+SEARCH_LIMIT = 100  # search/jql maxResults 상한 (fields 지정 시)
+TIME_FORMAT = "%Y-%m-%dT%H:%M:%S.000%z"
+
+_CLAUSE_RE = re.compile(r"^(\w+)\s*(!=|<=|>=|=|<|>)\s*(.+)$")
+_IN_RE = re.compile(r"^(\w+)\s+(not\s+in|in)\s*\((.*)\)$", re.I)
+_KEY_RE = re.compile(r"^([A-Z][A-Z0-9_]*)-(\d+)$")
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+class JiraError(Exception):
+    """핸들러가 (상태 코드, 본문) 응답으로 바꾸는 오류."""
+
+    def __init__(self, status: int, *messages: str, errors: Optional[Dict[str, str]] = None):
+        super().__init__(status, messages)
+        self.status = status
+        self.body = {"errorMessages": list(messages), "errors": errors or {}}
+
+
+def _key_order(key: str) -> Tuple[str, int]:
+    m = _KEY_RE.match(key or "")
+    return (m.group(1), int(m.group(2))) if m else (key or "", 0)
+
+
+def _unquote(value: str) -> str:
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    return value
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime(TIME_FORMAT)
+
+
+def _adf_text(value) -> str:
+    """ADF 문서 -> 평문 (설명 필드 저장용)."""
+    if isinstance(value, str) or value is None:
+        return value or ""
+    if isinstance(value, dict):
+        if value.get("type") == "text":
+            return value.get("text", "")
+        return "\n".join(t for t in (_adf_text(c) for c in value.get("content", [])) if t)
+    if isinstance(value, list):
+        return "\n".join(_adf_text(c) for c in value)
+    return ""
+
+
+class FakeJira:
+    """메모리 이슈 저장소 + 장애 주입 설정. 모든 변경은 _lock 안에서."""
+
+    def __init__(
+        self,
+        project: str = "GAM",
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: float = 1.0,
+        error_rate: float = 0.0,
+        error_status: int = 500,
+        seed: Optional[int] = None,
+        users: Optional[List[dict]] = None,
+        custom_fields: Optional[Dict[str, str]] = None,
+    ):
+        self.project = project
+        self.latency = latency
+        self.jitter = jitter
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.users = list(users if users is not None else DEFAULT_USERS)
+        self.custom_fields = dict(CUSTOM_FIELDS if custom_fields is None else custom_fields)
+        self.issues: Dict[str, dict] = {}
+        self.links: List[dict] = []
+        self.comments: Dict[str, List[dict]] = {}
+        self.calls: Dict[str, int] = {}  # "METHOD 경로 템플릿" -> 호출 수
+        self.injected = {"throttled": 0, "errors": 0}
+        self._next_id = 10000
+        self._next_number: Dict[str, int] = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    # ----- 저장소 -----
+
+    def load(self, issues: Iterable[dict]) -> None:
+        """jira-backend-issues.json 형식 스냅샷({key, summary, type, status, parent}) 적재."""
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        with self._lock:
+            for i, item in enumerate(issues):
+                stamp = (base + timedelta(minutes=i)).strftime(TIME_FORMAT)
+                project, number = _key_order(item["key"])
+                self._store(item["key"], {
+                    "summary": item.get("summary") or "",
+                    "issuetype": self._issuetype({"name": item.get("type") or "작업"}),
+                    "status": self._status(item.get("status") or "해야 할 일"),
+                    "parent": {"key": item["parent"]} if item.get("parent") else None,
+                    "created": stamp,
+                    "updated": stamp,
+                })
+                self._next_number[project] = max(self._next_number.get(project, 1), number + 1)
+
+    def _store(self, key: str, fields: dict) -> dict:
+        self._next_id += 1
+        issue = {"id": str(self._next_id), "key": key, "fields": fields}
+        self.issues[key] = issue
+        return issue
+
+    @staticmethod
+    def _issuetype(value: dict) -> dict:
+        type_id = str(value.get("id") or "")
+        name = value.get("name") or ISSUE_TYPES.get(type_id) or "작업"
+        if not type_id:
+            type_id = next((k for k, v in ISSUE_TYPES.items() if v == name), "10076")
+        return {"id": type_id, "name": name, "subtask": name == "하위 작업"}
+
+    @staticmethod
+    def _status(name: str) -> dict:
+        return {"name": name, "statusCategory": {"key": STATUSES.get(name, "new")}}
+
+    def _get(self, key: str) -> dict:
+        issue = self.issues.get(key)
+        if issue is None:
+            raise JiraError(404, "Issue does not exist or you do not have permission to see it.")
+        return issue
+
+    def _check_custom(self, name: str, value) -> None:
+        kind = self.custom_fields.get(name)
+        if kind is None:
+            raise JiraError(400, errors={
+                name: f"Field '{name}' cannot be set. It is not on the appropriate screen, or unknown."
+            })
+        if value is None:
+            return
+        if kind == "date" and not (isinstance(value, str) and _DATE_RE.match(value)):
+            raise JiraError(400, errors={name: "Operation value must be a valid date (yyyy-MM-dd)."})
+        if kind == "number" and not isinstance(value, (int, float)):
+            raise JiraError(400, errors={name: "Operation value must be a number."})
+
+    def _apply_fields(self, issue: dict, fields: dict) -> None:
+        """필드 전체를 먼저 검증하고 (하나라도 틀리면 아무것도 바꾸지 않음) 반영."""
+        for name, value in fields.items():
+            if name.startswith("customfield_"):
+                self._check_custom(name, value)
+            elif name == "parent" and value and value.get("key") and value["key"] not in self.issues:
+                raise JiraError(400, errors={"parent": f"Issue '{value['key']}' does not exist."})
+        for name, value in fields.items():
+            if name == "issuetype":
+                value = self._issuetype(value or {})
+            elif name == "status":
+                continue  # 상태는 전환으로만 변경
+            elif name == "parent":
+                value = {"key": value["key"]} if value and value.get("key") else None
+            elif name == "description":
+                value = _adf_text(value)
+            issue["fields"][name] = value
+        issue["fields"]["updated"] = _now()
+
+    def link(self, name: str, inward: str, outward: str) -> None:
+        """Issue Link 저장. 없는 링크 유형·이슈는 JiraError(404)."""
+        if not any(t["name"] == name for t in LINK_TYPES):
+            raise JiraError(404, f"No issue link type with name '{name}' found.")
+        inward = self._get(inward)["key"]
+        outward = self._get(outward)["key"]
+        self.links.append({"type": name, "inward": inward, "outward": outward})
+
+    def _creation_links(self, payload: dict) -> List[Tuple[str, Optional[str], Optional[str]]]:
+        """생성 본문 update.issuelinks 의 add 를 (유형, inward, outward) 로. 새 이슈 쪽은 None."""
+        links = []
+        for op in ((payload.get("update") or {}).get("issuelinks") or []):
+            add = op.get("add") or {}
+            name = (add.get("type") or {}).get("name")
+            if not any(t["name"] == name for t in LINK_TYPES):
+                raise JiraError(400, errors={"issuelinks": f"No issue link type with name '{name}' found."})
+            inward = (add.get("inwardIssue") or {}).get("key")
+            outward = (add.get("outwardIssue") or {}).get("key")
+            other = inward or outward
+            if not other or other not in self.issues:
+                raise JiraError(400, errors={"issuelinks": f"Issue '{other}' does not exist."})
+            links.append((name, inward, outward))
+        return links
+
+    def create(self, payload: dict) -> dict:
+        """POST /issue 본문 -> {id, key, self}. 필수 필드가 없거나 링크 대상이 없으면 JiraError(400)."""
+        fields = dict((payload or {}).get("fields") or {})
+        links = self._creation_links(payload or {})
+        errors = {}
+        project = ((fields.pop("project", None) or {}).get("key")) or self.project
+        if not (fields.get("summary") or "").strip():
+            errors["summary"] = "You must specify a summary of the issue."
+        if not fields.get("issuetype"):
+            errors["issuetype"] = "Specify an issue type"
+        if errors:
+            raise JiraError(400, errors=errors)
+        number = self._next_number.get(project, 1)
+        self._next_number[project] = number + 1
+        stamp = _now()
+        issue = self._store(f"{project}-{number}", {
+            "summary": "", "status": self._status("해야 할 일"), "parent": None, "created": stamp, "updated": stamp,
+        })
+        try:
+            self._apply_fields(issue, fields)
+        except JiraError:
+            del self.issues[issue["key"]]
+            raise
+        for name, inward, outward in links:
+            self.link(name, inward or issue["key"], outward or issue["key"])
+        return {"id": issue["id"], "key": issue["key"], "self": f"/rest/api/3/issue/{issue['id']}"}
+
+    def snapshot(self) -> List[dict]:
+        """jira-backend-issues.json 형식 목록 (키 순서)."""
+        return [
+            {
+                "key": issue["key"],
+                "summary": issue["fields"].get("summary") or "",
+                "type": issue["fields"]["issuetype"]["name"],
+                "status": issue["fields"]["status"]["name"],
+                "parent": (issue["fields"].get("parent") or {}).get("key"),
+            }
+            for issue in sorted(self.issues.values(), key=lambda i: _key_order(i["key"]))
+        ]
+
+    def clear(self) -> None:
+        """이슈·링크·댓글을 모두 지우고 키 번호를 처음부터."""
+        self.issues.clear()
+        self.links.clear()
+        self.comments.clear()
+        self._next_number.clear()
+
+    def view(self, issue: dict, fields: Optional[List[str]], transitions: bool = False) -> dict:
+        """응답용 이슈 사본. fields 가 None 이면 전체, [] 이면 id 만 (search/jql 기본 동작)."""
+        out = {"id": issue["id"], "key": issue["key"], "self": f"/rest/api/3/issue/{issue['id']}"}
+        if fields is not None and not fields:
+            return {"id": issue["id"]}
+        src = issue["fields"]
+        if fields is None or "*all" in fields or "*navigable" in fields:
+            out["fields"] = {k: v for k, v in src.items() if v is not None}
+        else:
+            out["fields"] = {k: src[k] for k in fields if src.get(k) is not None}
+        if transitions:
+            out["transitions"] = self.transitions(issue)
+        return json.loads(json.dumps(out))  # 호출 쪽 수정이 저장소에 번지지 않도록
+
+    def transitions(self, issue: dict) -> List[dict]:
+        current = issue["fields"]["status"]["name"]
+        return [
+            {"id": tid, "name": name, "to": self._status(name)}
+            for tid, name in TRANSITIONS.items() if name != current
+        ]
+
+    # ----- JQL -----
+
+    def _value(self, issue: dict, field: str):
+        fields = issue["fields"]
+        if field in ("key", "issue", "issuekey", "id"):
+            return issue["key"]
+        if field == "project":
+            return _key_order(issue["key"])[0]
+        if field in ("issuetype", "type"):
+            return fields["issuetype"]["name"]
+        if field == "status":
+            return fields["status"]["name"]
+        if field == "parent":
+            return (fields.get("parent") or {}).get("key")
+        if field == "statuscategory":
+            return fields["status"]["statusCategory"]["key"]
+        return fields.get(field)
+
+    def _predicate(self, clause: str) -> Optional[Callable[[dict], bool]]:
+        m = _IN_RE.match(clause)
+        if m:
+            field, negate = m.group(1).lower(), m.group(2).lower() != "in"
+            values = {_unquote(v) for v in m.group(3).split(",") if v.strip()}
+            if field in ("key", "issue", "issuekey"):
+                missing = sorted(v for v in values if v not in self.issues)
+                if missing:
+                    raise JiraError(400, f"An issue with key '{missing[0]}' does not exist for field 'key'.")
+            return lambda issue: (self._value(issue, field) in values) != negate
+        m = _CLAUSE_RE.match(clause)
+        if not m:
+            return None
+        field, op, value = m.group(1).lower(), m.group(2), _unquote(m.group(3))
+        if field not in ("key", "issue", "issuekey", "project", "issuetype", "type", "status",
+                         "parent", "statuscategory", "created", "updated", "duedate"):
+            return None
+        if field in ("key", "issue", "issuekey"):
+            target = _key_order(value)
+            compare = {
+                "=": lambda k: k == target, "!=": lambda k: k != target,
+                "<": lambda k: k < target, "<=": lambda k: k <= target,
+                ">": lambda k: k > target, ">=": lambda k: k >= target,
+            }[op]
+            return lambda issue: compare(_key_order(issue["key"]))
+        if op in ("=", "!="):
+            negate = op == "!="
+            return lambda issue: (str(self._value(issue, field) or "").lower() == value.lower()) != negate
+        compare = {"<": str.__lt__, "<=": str.__le__, ">": str.__gt__, ">=": str.__ge__}[op]
+        return lambda issue: bool(self._value(issue, field)) and compare(str(self._value(issue, field)), value)
+
+    def search(self, jql: str) -> List[dict]:
+        """JQL 부분 집합으로 이슈 목록 (정렬 포함)."""
+        parts = re.split(r"\s+ORDER\s+BY\s+", (jql or "").strip(), maxsplit=1, flags=re.I)
+        where, order = parts[0], parts[1] if len(parts) > 1 else "key ASC"
+        if where.upper().startswith("ORDER BY"):
+            where, order = "", where[len("ORDER BY"):]
+        predicates = [
+            p for p in (self._predicate(c.strip()) for c in re.split(r"\s+AND\s+", where, flags=re.I) if c.strip())
+            if p is not None
+        ]
+        result = [issue for issue in self.issues.values() if all(p(issue) for p in predicates)]
+        field, _, direction = order.strip().partition(" ")
+        field = field.lower()
+        if field in ("key", "issuekey", "id"):
+            sort_key = lambda issue: _key_order(issue["key"])  # noqa: E731
+        else:
+            sort_key = lambda issue: (str(self._value(issue, field) or ""), _key_order(issue["key"]))  # noqa: E731
+        result.sort(key=sort_key, reverse=direction.strip().upper() == "DESC")
+        return result
+
+    # ----- 장애 주입 / 통계 -----
+
+    def configure(self, **options) -> None:
+        for name in ("latency", "jitter", "throttle_rate", "retry_after", "error_rate", "error_status"):
+            if name in options and options[name] is not None:
+                setattr(self, name, type(getattr(self, name))(options[name]))
+
+    def fault(self) -> Optional[int]:
+        """이번 요청에 주입할 상태 코드 (없으면 None)."""
+        with self._lock:
+            roll = self._random.random()
+            if roll < self.throttle_rate:
+                self.injected["throttled"] += 1
+                return 429
+            if roll < self.throttle_rate + self.error_rate:
+                self.injected["errors"] += 1
+                return self.error_status
+        return None
+
+    def delay(self) -> float:
+        if not (self.latency or self.jitter):
+            return 0.0
+        with self._lock:
+            return self.latency + self._random.uniform(0, self.jitter)
+
+    def count(self, method: str, path: str) -> None:
+        name = f"{method} {metrics.endpoint_of(path)[1]}"
+        with self._lock:
+            self.calls[name] = self.calls.get(name, 0) + 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "calls": dict(sorted(self.calls.items())),
+                "total": sum(self.calls.values()),
+                "injected": dict(self.injected),
+                "issues": len(self.issues),
+                "links": len(self.links),
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.calls.clear()
+            self.injected = {"throttled": 0, "errors": 0}
+
+
+def _fields_param(value) -> Optional[List[str]]:
+    """fields 파라미터 (목록 또는 쉼표 문자열) -> 목록. 없으면 None."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.split(",")
+    return [f.strip() for f in value if f and f.strip()]
+
+
+def _token(offset: int) -> str:
+    return f"fake-{offset}"
+
+
+def _offset(token: Optional[str]) -> int:
+    if not token:
+        return 0
+    try:
+        return int(str(token).rpartition("-")[2])
+    except ValueError:
+        raise JiraError(400, "Invalid nextPageToken")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive (requests.Session 커넥션 재사용)
+    disable_nagle_algorithm = True  # 헤더·본문을 따로 쓰므로 없으면 지연 ACK 와 겹쳐 응답마다 ~40ms
+    server_version = "FakeJira/1.0"
+    jira: FakeJira  # FakeJiraServer 가 서브클래스에 주입
+
+    def log_message(self, format, *args):  # noqa: A002 - 요청 로그는 생략
+        pass
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _send(self, status: int, body=None, headers: Optional[Dict[str, str]] = None) -> None:
+        data = b"" if body is None else json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        if data:
+            self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+
+    def _dispatch(self, method: str) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        parts = urlsplit(self.path)
+        path = parts.path.rstrip("/")
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        jira = self.jira
+        if path.startswith("/_fake/"):
+            self._control(method, path, raw)
+            return
+        jira.count(method, path)
+        delay = jira.delay()
+        if delay:
+            time.sleep(delay)
+        fault = jira.fault()
+        if fault == 429:
+            self._send(429, {"errorMessages": ["Rate limit exceeded."]}, {"Retry-After": f"{jira.retry_after:g}"})
+            return
+        if fault:
+            self._send(fault, {"errorMessages": ["Injected failure."]})
+            return
+        if not self.headers.get("Authorization"):
+            self._send(401, {"errorMessages": ["You are not authenticated."]})
+            return
+        try:
+            body = json.loads(raw) if raw else {}
+        except ValueError:
+            self._send(400, {"errorMessages": ["Invalid JSON body."]})
+            return
+        try:
+            with jira._lock:
+                status, result = self._route(method, path, query, body)
+        except JiraError as e:
+            self._send(e.status, e.body)
+            return
+        self._send(status, result)
+
+    def _control(self, method: str, path: str, raw: bytes) -> None:
+        jira = self.jira
+        if path == "/_fake/stats":
+            self._send(200, jira.stats())
+        elif path == "/_fake/reset" and method == "POST":
+            jira.reset_stats()
+            self._send(204)
+        elif path == "/_fake/snapshot":
+            with jira._lock:
+                self._send(200, jira.snapshot())
+        elif path == "/_fake/clear" and method == "POST":
+            with jira._lock:
+                jira.clear()
+            self._send(204)
+        elif path == "/_fake/config" and method == "POST":
+            jira.configure(**(json.loads(raw) if raw else {}))
+            self._send(204)
+        else:
+            self._send(404, {"errorMessages": [f"Unknown control endpoint {path}"]})
+
+    def _route(self, method: str, path: str, query: dict, body: dict) -> Tuple[int, object]:
+        """(상태 코드, 본문). 호출자가 jira._lock 을 잡은 상태."""
+        jira = self.jira
+        segments = path.split("/")[1:]  # rest, api, 3, ...
+        if segments[:2] != ["rest", "api"] or len(segments) < 4:
+            raise JiraError(404, f"No route for {method} {path}")
+        resource = segments[3:]
+
+        if resource == ["search", "jql"] and method in ("GET", "POST"):
+            params = body if method == "POST" else query
+            fields = _fields_param(params.get("fields"))
+            found = jira.search(params.get("jql") or "")
+            limit = max(1, min(int(params.get("maxResults") or 50), SEARCH_LIMIT if fields else 5000))
+            start = _offset(params.get("nextPageToken"))
+            page = found[start:start + limit]
+            result = {"issues": [jira.view(issue, fields or []) for issue in page], "isLast": start + limit >= len(found)}
+            if not result["isLast"]:
+                result["nextPageToken"] = _token(start + limit)
+            return 200, result
+
+        if resource == ["search"] and method in ("GET", "POST"):
+            params = body if method == "POST" else query
+            found = jira.search(params.get("jql") or "")
+            start = int(params.get("startAt") or 0)
+            limit = max(0, min(int(params.get("maxResults") or 50), SEARCH_LIMIT))
+            fields = _fields_param(params.get("fields"))
+            return 200, {
+                "startAt": start, "maxResults": limit, "total": len(found),
+                "issues": [jira.view(issue, fields) for issue in found[start:start + limit]],
+            }
+
+        if resource == ["issue"] and method == "POST":
+            return 201, jira.create(body)
+
+        if resource == ["issue", "bulk"] and method == "POST":
+            updates = body.get("issueUpdates") or []
+            if len(updates) > BULK_LIMIT:
+                raise JiraError(400, f"Bulk create is limited to {BULK_LIMIT} issues.")
+            created, errors = [], []
+            for i, update in enumerate(updates):
+                try:
+                    created.append(jira.create(update))
+                except JiraError as e:
+                    errors.append({"status": e.status, "failedElementNumber": i, "elementErrors": e.body})
+            return 201, {"issues": created, "errors": errors}
+
+        if resource == ["issue", "createmeta"] and method == "GET":
+            return 200, {"projects": [{
+                "key": query.get("projectKeys") or jira.project,
+                "issuetypes": [{"id": tid, "name": name, "fields": {}} for tid, name in ISSUE_TYPES.items()],
+            }]}
+
+        if resource == ["issueLinkType"] and method == "GET":
+            return 200, {"issueLinkTypes": LINK_TYPES}
+
+        if resource == ["issueLink"] and method == "POST":
+            jira.link(
+                (body.get("type") or {}).get("name"),
+                (body.get("inwardIssue") or {}).get("key"),
+                (body.get("outwardIssue") or {}).get("key"),
+            )
+            return 201, None
+
+        if resource == ["user", "search"] and method == "GET":
+            needle = (query.get("query") or "").lower()
+            return 200, [
+                u for u in jira.users
+                if needle in u.get("emailAddress", "").lower() or needle in u.get("displayName", "").lower()
+            ]
+
+        if len(resource) >= 2 and resource[0] == "issue":
+            issue = jira._get(resource[1])
+            action = resource[2:]
+            if not action:
+                if method == "GET":
+                    expand = (query.get("expand") or "").split(",")
+                    return 200, jira.view(issue, _fields_param(query.get("fields")), "transitions" in expand)
+                if method == "PUT":
+                    jira._apply_fields(issue, body.get("fields") or {})
+                    return 204, None
+                if method == "DELETE":
+                    children = [k for k, i in jira.issues.items() if (i["fields"].get("parent") or {}).get("key") == issue["key"]]
+                    if children and query.get("deleteSubtasks") != "true":
+                        raise JiraError(400, "Issue has subtasks; set deleteSubtasks=true to delete them.")
+                    for key in children + [issue["key"]]:
+                        jira.issues.pop(key, None)
+                    return 204, None
+            if action == ["transitions"]:
+                if method == "GET":
+                    return 200, {"transitions": jira.transitions(issue)}
+                if method == "POST":
+                    tid = str((body.get("transition") or {}).get("id") or "")
+                    if tid not in TRANSITIONS:
+                        raise JiraError(400, f"Transition id '{tid}' is not valid for this issue.")
+                    issue["fields"]["status"] = jira._status(TRANSITIONS[tid])
+                    issue["fields"]["updated"] = _now()
+                    return 204, None
+            if action == ["assignee"] and method == "PUT":
+                account = body.get("accountId")
+                user = next((u for u in jira.users if u["accountId"] == account), None)
+                if account and user is None:
+                    raise JiraError(400, errors={"accountId": "User does not exist."})
+                issue["fields"]["assignee"] = user
+                issue["fields"]["updated"] = _now()
+                return 204, None
+            if action == ["comment"] and method == "POST":
+                comments = jira.comments.setdefault(issue["key"], [])
+                comment = {"id": str(10000 + len(comments)), "body": body.get("body"), "created": _now()}
+                comments.append(comment)
+                return 201, comment
+
+        raise JiraError(404, f"No route for {method} {path}")
+
+
+class FakeJiraServer:
+    """FakeJira 를 ThreadingHTTPServer 로 띄운다. port=0 이면 빈 포트. with 블록 또는 start()/stop()."""
+
+    def __init__(self, jira: Optional[FakeJira] = None, host: str = "127.0.0.1", port: int = 0):
+        self.jira = jira or FakeJira()
+        handler = type("FakeJiraHandler", (_Handler,), {"jira": self.jira})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeJiraServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="fake-jira", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> "FakeJiraServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
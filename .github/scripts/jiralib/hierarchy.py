@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+이슈 계층 그래프 (이슈 스냅샷의 parent 필드 기반).
+
+스크립트마다 "이 에픽들의 직·간접 하위" 를 구하려고 전체 이슈를 변화가 없을 때까지
+반복 순회하던 것(O(이슈 수 × 깊이))을 대체한다.
+- 부모 -> 자식 인접 목록을 한 번 만들고 하위는 BFS/DFS 로 해당 서브트리만 방문
+- 노드별 서브트리(자신 포함 전체 하위) 집합을 메모해 여러 번 물어도 다시 순회하지 않음
+- 상위(부모 체인) 조회
+parent 순환이 있어도 방문 집합으로 끊는다.
+
+    graph = IssueGraph(issues)            # [{"key": "GAM-31", "parent": "GAM-3", ...}, ...]
+    targets = graph.descendants({"GAM-3", "GAM-4"})
+"""
+import json
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Set
+
+
+class IssueGraph:
+    """키 -> 부모, 부모 -> 자식 목록. 같은 키가 여러 번 나오면 마지막 항목의 parent 를 쓴다."""
+
+    def __init__(self, issues: Iterable[dict]):
+        self.parent: Dict[str, Optional[str]] = {}
+        for issue in issues:
+            self.parent[issue["key"]] = issue.get("parent")
+        self.children: Dict[str, List[str]] = {}
+        for key, parent in self.parent.items():
+            if parent:
+                self.children.setdefault(parent, []).append(key)
+        self._subtrees: Dict[str, FrozenSet[str]] = {}
+
+    @classmethod
+    def from_file(cls, path: str) -> "IssueGraph":
+        """jira-backend-issues.json 형식 스냅샷(목록 또는 키 -> 이슈 dict)에서 생성."""
+        with open(path, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+        issues = raw if isinstance(raw, list) else list(raw.values()) if isinstance(raw, dict) else []
+        return cls(issues)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.parent
+
+    def walk(self, key: str, depth_first: bool = False) -> Iterator[str]:
+        """key 의 하위를 BFS(기본) 또는 DFS(전위) 순서로 순회 (key 자신은 제외)."""
+        seen = {key}
+        pending = deque(self.children.get(key, ()))
+        pop = pending.pop if depth_first else pending.popleft
+        if depth_first:
+            pending.reverse()
+        while pending:
+            node = pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            yield node
+            children = self.children.get(node, ())
+            pending.extend(reversed(children) if depth_first else children)
+
+    def subtree(self, key: str) -> FrozenSet[str]:
+        """key 와 그 직·간접 하위 전체 (메모). 이미 구한 노드의 서브트리는 다시 펼치지 않는다."""
+        cached = self._subtrees.get(key)
+        if cached is not None:
+            return cached
+        result: Set[str] = {key}
+        stack = list(self.children.get(key, ()))
+        while stack:
+            node = stack.pop()
+            if node in result:
+                continue
+            known = self._subtrees.get(node)
+            if known is not None:
+                result |= known
+                continue
+            result.add(node)
+            stack.extend(self.children.get(node, ()))
+        closure = frozenset(result)
+        self._subtrees[key] = closure
+        return closure
+
+    def descendants(self, roots: Iterable[str]) -> Set[str]:
+        """roots 와 그 직·간접 하위 키 집합 (스냅샷에 없는 root 도 포함)."""
+        result: Set[str] = set()
+        for root in roots:
+            if root not in result:
+                result |= self.subtree(root)
+        return result
+
+    def ancestors(self, key: str) -> List[str]:
+        """부모부터 최상위까지의 키 목록."""
+        chain: List[str] = []
+        seen = {key}
+        parent = self.parent.get(key)
+        while parent and parent not in seen:
+            chain.append(parent)
+            seen.add(parent)
+            parent = self.parent.get(parent)
+        return chain
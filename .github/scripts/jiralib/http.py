@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""
+JIRA/GitHub REST 호출용 공용 HTTP 클라이언트.
+
+- 프로세스 당 requests.Session 하나를 공유해 keep-alive 커넥션을 재사용 (호출마다 TCP+TLS 핸드셰이크 제거)
+- 호스트별 커넥션 수 상한 (pool_block=True: 상한 초과 시 새 연결 대신 대기)
+- gzip 응답 압축 요청
+- timeout 미지정 호출에는 기본 timeout 적용
+- 호스트별 적응형 레이트 리미터(ratelimit.py) 적용, 429/503은 Retry-After 후 자동 재시도
+  (POST/PATCH 는 429 또는 Retry-After 가 붙은 503 만: 엣지/프록시 503 은 이미 처리된 요청일 수 있음)
+  (JIRA_RATE_LIMIT=0 으로 속도 제한을 꺼도 재시도는 유지, Retry-After 가 없으면 지수 백오프)
+- 요청마다 엔드포인트별 응답 시간·상태·재시도·바이트·대기 시간 기록 (metrics.py, 종료 시 요약 + .prom 파일)
+- JIRA_CASSETTE 지정 시 응답 녹화 또는 네트워크 없이 녹화 응답 재생 (cassette.py)
+
+사용: requests.get/post/put/delete 대신 http.get/post/put/delete (인자 동일)
+    from jiralib import http
+    r = http.get(f"{jira_url}/rest/api/3/issue/{key}", headers=headers, timeout=10)
+"""
+import os
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from jiralib import cassette, metrics
+from jiralib.ratelimit import THROTTLE_STATUSES, limiter_for, parse_retry_after
+
+# 호스트(커넥션 풀) 수, 호스트당 최대 커넥션 수. 환경 변수로 조정 가능.
+POOL_CONNECTIONS = int(os.getenv("JIRA_HTTP_POOL_CONNECTIONS", "4"))
+POOL_MAXSIZE = int(os.getenv("JIRA_HTTP_POOL_MAXSIZE", "8"))
+DEFAULT_TIMEOUT = float(os.getenv("JIRA_HTTP_TIMEOUT", "30"))
+# 동시 요청을 보내는 곳(이슈 생성·필드 쓰기·전환)의 기본 동시 실행 수
+DEFAULT_CONCURRENCY = int(os.getenv("JIRA_CONCURRENCY", "8"))
+# 429/503 응답 재시도 횟수 (재시도 대상은 _retryable 참고)
+MAX_THROTTLE_RETRIES = int(os.getenv("JIRA_HTTP_MAX_RETRIES", "5"))
+# 같은 요청을 다시 보내도 결과가 같은 메서드
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+# 리미터 없이(JIRA_RATE_LIMIT=0) Retry-After 없는 스로틀 응답을 받았을 때 대기 초: 1, 2, 4 ... 최대 30
+UNPACED_BACKOFF = 1.0
+UNPACED_BACKOFF_MAX = 30.0
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_writes = 0  # 보낸 쓰기 요청 수 (GET/HEAD/OPTIONS·검색 POST 제외)
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        pool_block=True,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    })
+    return session
+
+
+def get_session() -> requests.Session:
+    """공유 세션 반환 (최초 호출 시 생성). 스레드 안전."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def close() -> None:
+    """공유 세션의 커넥션 풀 정리. 다음 호출 시 새로 생성된다."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def writes() -> int:
+    """
+    이 프로세스가 지금까지 보낸 쓰기 요청(생성·수정·전환·삭제 등) 수.
+    값이 바뀌었으면 이전에 조회한 이슈가 낡았을 수 있다 (session.fetch_issues 캐시 무효화에 사용).
+    """
+    return _writes
+
+
+def _count_write(method: str, url: str) -> None:
+    global _writes
+    if method.upper() in ("GET", "HEAD", "OPTIONS") or "/search" in urlsplit(url).path:
+        return
+    with _session_lock:
+        _writes += 1
+
+
+def _retryable(method: str, response: requests.Response) -> bool:
+    """
+    스로틀 응답을 다시 보내도 안전한지.
+    429 는 JIRA가 요청을 처리하지 않았다는 뜻이라 항상 재시도한다.
+    503 은 엣지/프록시가 이슈 생성 뒤에 돌려줄 수도 있어서 멱등 메서드이거나
+    Retry-After 가 붙은 (JIRA 스로틀) 응답일 때만 재시도한다 (POST 중복 생성 방지).
+    """
+    if response.status_code == 429:
+        return True
+    if response.status_code == 503:
+        return method.upper() in IDEMPOTENT_METHODS or "Retry-After" in response.headers
+    return False
+
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    """requests.request와 동일한 시그니처. 공유 세션 + 레이트 리미터로 호출."""
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    _count_write(method, url)
+    tape = cassette.active()
+    prepared = cassette.prepare(method, url, kwargs) if tape else None
+    if tape and tape.replaying:
+        return _replay(tape, prepared, method, url)
+    session = get_session()
+    limiter = limiter_for(urlsplit(url).netloc)
+    attempt = 0
+    pause = 0.0  # 리미터가 없을 때 직전 스로틀 응답 뒤 대기한 초
+    while True:
+        slept = limiter.acquire() if limiter else pause
+        started = time.perf_counter()
+        try:
+            response = session.request(method, url, **kwargs)
+        except Exception:
+            metrics.record_error(method, url, time.perf_counter() - started, attempt > 0, slept)
+            raise
+        elapsed = time.perf_counter() - started
+        metrics.record(method, url, response, elapsed, attempt > 0, slept)
+        if tape:
+            tape.record(prepared, response, elapsed)
+        if limiter:
+            # 스로틀이면 리미터가 Retry-After 동안 호스트를 막아 두므로 다음 acquire()가 대기한다
+            throttled = limiter.observe(response.status_code, response.headers)
+        else:
+            throttled = response.status_code in THROTTLE_STATUSES
+        if not throttled or not _retryable(method, response) or attempt >= MAX_THROTTLE_RETRIES:
+            return response
+        if not limiter:
+            pause = parse_retry_after(response.headers.get("Retry-After"))
+            if pause is None:
+                pause = min(UNPACED_BACKOFF * 2 ** attempt, UNPACED_BACKOFF_MAX)
+            time.sleep(pause)
+        attempt += 1
+
+
+def _replay(tape: cassette.Cassette, prepared: requests.PreparedRequest, method: str, url: str) -> requests.Response:
+    """녹화 응답 반환. 녹화된 429/503 은 재시도까지 그대로 재현 (Retry-After 대기는 생략)."""
+    attempt = 0
+    while True:
+        started = time.perf_counter()
+        try:
+            response = tape.replay(prepared)
+        except Exception:
+            metrics.record_error(method, url, time.perf_counter() - started, attempt > 0)
+            raise
+        metrics.record(method, url, response, time.perf_counter() - started, attempt > 0)
+        if not _retryable(method, response) or attempt >= MAX_THROTTLE_RETRIES:
+            return response
+        attempt += 1
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    return request("POST", url, **kwargs)
+
+
+def put(url: str, **kwargs) -> requests.Response:
+    return request("PUT", url, **kwargs)
+
+
+def patch(url: str, **kwargs) -> requests.Response:
+    return request("PATCH", url, **kwargs)
+
+
+def delete(url: str, **kwargs) -> requests.Response:
+    return request("DELETE", url, **kwargs)
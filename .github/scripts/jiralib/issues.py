@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+여러 이슈 키의 상태(또는 지정 필드)를 한 번에 조회하는 공용 API.
+
+스크립트마다 GET /rest/api/3/issue/{key}?fields=status 를 키 하나씩 호출하던 것을
+`key in (...)` JQL 검색(POST /rest/api/3/search/jql)으로 묶어 조회한다.
+청크당 최대 CHUNK_SIZE 키, 응답은 nextPageToken 으로 이어 받는다.
+
+존재하지 않거나 권한이 없는 키가 섞이면 JIRA가 JQL 전체를 400으로 거부하므로,
+그 경우 청크를 반으로 나눠 다시 조회해 나머지 키는 결과에 남긴다.
+
+다른 프로젝트로 옮겨졌거나 키가 바뀐 이슈는 검색 결과에 새 키로 나오므로,
+검색으로 찾지 못한 키는 GET /rest/api/3/issue/{key} (옛 키도 따라감)로 한 건씩 다시 조회해
+요청한 키로 결과에 넣는다.
+"""
+from typing import Dict, Iterable, List, Optional
+
+from jiralib import http
+
+CHUNK_SIZE = 100
+MAX_RESULTS = 100
+FIELDS = ["summary", "status", "issuetype", "parent"]
+
+
+def issue_info(issue: dict) -> dict:
+    """검색 결과 이슈 한 건을 {key, summary, status, status_category, issuetype, parent}로 정리."""
+    fields = issue.get("fields") or {}
+    status = fields.get("status") or {}
+    category = status.get("statusCategory") or {}
+    parent = fields.get("parent") or {}
+    return {
+        "key": issue.get("key", ""),
+        "summary": (fields.get("summary") or "").strip(),
+        "status": (status.get("name") or "").strip(),
+        "status_category": category.get("key") or "",  # new / indeterminate / done
+        "issuetype": (fields.get("issuetype") or {}).get("name") or "",
+        "parent": parent.get("key"),
+    }
+
+
+def _search_chunk(jira_url: str, headers: dict, keys: List[str], fields: List[str] = FIELDS) -> Optional[List[dict]]:
+    """keys 를 한 번의 JQL로 조회. JQL이 거부되면(400) None."""
+    issues: List[dict] = []
+    next_token = None
+    while True:
+        payload = {
+            "jql": f"key in ({', '.join(keys)})",
+            "maxResults": MAX_RESULTS,
+            "fields": fields,
+        }
+        if next_token:
+            payload["nextPageToken"] = next_token
+        r = http.post(f"{jira_url}/rest/api/3/search/jql", headers=headers, json=payload)
+        if r.status_code == 400:
+            return None
+        if r.status_code != 200:
+            r.raise_for_status()
+        data = r.json()
+        issues.extend(data.get("issues", []))
+        next_token = data.get("nextPageToken")
+        if not next_token or data.get("isLast"):
+            return issues
+
+
+def _resolve(jira_url: str, headers: dict, keys: List[str], out: Dict[str, dict], fields: List[str] = FIELDS) -> None:
+    """out 에 키 -> 검색 결과 이슈 원본."""
+    issues = _search_chunk(jira_url, headers, keys, fields)
+    if issues is None:
+        if len(keys) == 1:
+            return  # 존재하지 않는 키
+        mid = len(keys) // 2
+        _resolve(jira_url, headers, keys[:mid], out, fields)
+        _resolve(jira_url, headers, keys[mid:], out, fields)
+        return
+    for issue in issues:
+        key = issue.get("key", "")
+        if key in keys:  # 옮겨진 이슈는 새 키로 나오므로 _fetch_one 으로 요청한 키에 맞춘다
+            out[key] = issue
+
+
+def _fetch_one(jira_url: str, headers: dict, key: str, fields: List[str] = FIELDS) -> Optional[dict]:
+    """이슈 하나 조회 (옮겨진 이슈는 JIRA가 새 키로 리다이렉트). 없으면 None."""
+    r = http.get(
+        f"{jira_url}/rest/api/3/issue/{key}",
+        headers=headers,
+        params={"fields": ",".join(fields)},
+        timeout=10,
+    )
+    if r.status_code == 404:
+        return None
+    if r.status_code != 200:
+        r.raise_for_status()
+    return r.json()
+
+
+def fetch_issues(
+    jira_url: str,
+    headers: dict,
+    keys: Iterable[str],
+    fields: Iterable[str] = FIELDS,
+    chunk_size: int = CHUNK_SIZE,
+) -> Dict[str, dict]:
+    """
+    이슈 키 집합의 지정 필드를 일괄 조회.
+    Returns: {key: 검색 결과 이슈 원본 ({"key", "fields": {...}, ...})}
+    조회되지 않은 키(없는 이슈, 네트워크 오류)는 결과에 포함되지 않는다.
+    옮겨진 이슈는 요청한 (옛) 키 아래에 새 키의 이슈 원본이 들어간다.
+    """
+    jira_url = jira_url.rstrip("/")
+    fields = list(fields)
+    unique = sorted({k.strip() for k in keys if k and k.strip()})
+    result: Dict[str, dict] = {}
+    unsearched = set()
+    for start in range(0, len(unique), chunk_size):
+        chunk = unique[start:start + chunk_size]
+        try:
+            _resolve(jira_url, headers, chunk, result, fields)
+        except Exception as e:
+            unsearched.update(chunk)
+            print(f"⚠ 이슈 일괄 조회 실패 ({chunk[0]}..{chunk[-1]}): {e}")
+    # 검색에 나오지 않은 키 (옮겨진·없는 이슈). 검색 자체가 실패한 청크는 다시 부르지 않는다.
+    for key in unique:
+        if key in result or key in unsearched:
+            continue
+        try:
+            issue = _fetch_one(jira_url, headers, key, fields)
+        except Exception as e:
+            print(f"⚠ 이슈 조회 실패 ({key}): {e}")
+            continue
+        if issue:
+            result[key] = issue
+    return result
+
+
+def fetch_issue_statuses(
+    jira_url: str,
+    headers: dict,
+    keys: Iterable[str],
+    chunk_size: int = CHUNK_SIZE,
+) -> Dict[str, dict]:
+    """
+    이슈 키 집합의 상태를 일괄 조회.
+    Returns: {key: {key, summary, status, status_category, issuetype, parent}}
+    조회되지 않은 키(없는 이슈, 네트워크 오류)는 결과에 포함되지 않는다.
+    """
+    issues = fetch_issues(jira_url, headers, keys, FIELDS, chunk_size)
+    return {key: issue_info(issue) for key, issue in issues.items()}
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Aho-Corasick 다중 패턴 매처 (순수 파이썬).
+
+검증 스크립트가 작업마다 파일 전체를 다시 읽고 패턴별로 `pat in text` 를 반복하던 것을 대체한다.
+모든 키워드로 오토마타를 한 번 만들고 각 파일을 한 번만 훑어
+어떤 패턴이 어떤 파일에 나오는지 한 번에 구한다.
+"""
+from collections import deque
+from typing import Dict, Hashable, Iterable, List, Mapping, Set
+
+
+class KeywordMatcher:
+    """부분 문자열(대소문자 구분) 다중 패턴 매처."""
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = sorted({p for p in patterns if p})
+        # 노드 i: _goto[i] (문자 -> 다음 노드), _fail[i], _out[i] (이 노드에서 끝나는 패턴들)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[str]] = [[]]
+        for pattern in self.patterns:
+            self._add(pattern)
+        self._link()
+
+    def _add(self, pattern: str) -> None:
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append(pattern)
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find(self, text: str) -> Set[str]:
+        """text 에 나오는 패턴 집합."""
+        goto, fail, out = self._goto, self._fail, self._out
+        found: Set[str] = set()
+        remaining = len(self.patterns)
+        node = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                found.update(out[node])
+                if len(found) == remaining:
+                    break
+        return found
+
+    def scan(self, texts: Mapping[Hashable, str]) -> Dict[str, Set[Hashable]]:
+        """{이름: 본문} 을 한 번씩 훑어 {패턴: 패턴이 나온 이름 집합} 반환 (없는 패턴은 빈 집합)."""
+        hits: Dict[str, Set[Hashable]] = {p: set() for p in self.patterns}
+        if not self.patterns:
+            return hits
+        for name, text in texts.items():
+            for pattern in self.find(text):
+                hits[pattern].add(name)
+        return hits
@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+"""
+HTTP 호출 계측 (jiralib.http 가 요청마다 기록).
+
+엔드포인트별로 다음을 모은다. 엔드포인트는 이슈 키·숫자 ID 를 {key}/{id} 로 바꾼 경로다.
+- 응답 시간 히스토그램
+- 상태 코드별 건수
+- 재시도 수, 스로틀(429/503) 수
+- 보낸/받은 바이트
+- 레이트 리미터 대기 시간
+첫 기록 시 종료 훅을 등록하고, 프로세스가 끝날 때 요약 표를 stderr 에 출력한다.
+같은 내용은 Prometheus node_exporter textfile collector 형식의 파일로도 원자적으로 기록한다.
+
+환경 변수:
+    JIRA_METRICS_DIR     .prom 파일 디렉터리 (기본 .github/.cache/metrics, 빈 값이면 기록 안 함)
+    JIRA_HTTP_SUMMARY    0 이면 종료 시 요약 출력 생략
+"""
+import atexit
+import os
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+METRICS_DIR = os.getenv("JIRA_METRICS_DIR", str(PROJECT_ROOT / ".github" / ".cache" / "metrics"))
+SUMMARY = os.getenv("JIRA_HTTP_SUMMARY", "1") != "0"
+BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+THROTTLE_STATUSES = (429, 503)
+
+_KEY_SEGMENT_RE = re.compile(r"^[A-Z][A-Z0-9_]+-\d+$")
+_ID_SEGMENT_RE = re.compile(r"^\d+$")
+
+
+def endpoint_of(url: str) -> Tuple[str, str]:
+    """URL -> (호스트, 경로 템플릿). 예: /rest/api/3/issue/GAM-12/transitions -> /rest/api/3/issue/{key}/transitions"""
+    parts = urlsplit(url)
+    segments: List[str] = []
+    for segment in parts.path.split("/"):
+        if _KEY_SEGMENT_RE.match(segment):
+            segment = "{key}"
+        elif _ID_SEGMENT_RE.match(segment) and segments[-1:] != ["api"]:  # /rest/api/3 의 버전은 유지
+            segment = "{id}"
+        segments.append(segment)
+    return parts.netloc, "/".join(segments) or "/"
+
+
+class EndpointStats:
+    """(메서드, 호스트, 경로 템플릿) 하나의 누적값."""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0  # 응답 없이 예외로 끝난 요청
+        self.retries = 0
+        self.throttled = 0
+        self.statuses: Dict[str, int] = {}
+        self.bucket_counts = [0] * len(BUCKETS)
+        self.latency_sum = 0.0
+        self.latencies: List[float] = []  # 요약의 백분위수용
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def observe(self, status: str, elapsed: float, retry: bool) -> None:
+        self.count += 1
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        if retry:
+            self.retries += 1
+        self.latency_sum += elapsed
+        self.latencies.append(elapsed)
+        for i, bound in enumerate(BUCKETS):
+            if elapsed <= bound:
+                self.bucket_counts[i] += 1
+
+
+_lock = threading.Lock()
+_stats: Dict[Tuple[str, str, str], EndpointStats] = {}
+_sleep: Dict[str, float] = {}  # 호스트 -> 레이트 리미터 대기 초
+_started = time.time()
+_registered = False
+
+
+def _entry(method: str, url: str) -> Tuple[str, EndpointStats]:
+    """호출자가 _lock 을 잡은 상태에서 사용."""
+    global _registered
+    if not _registered:
+        atexit.register(finish)
+        _registered = True
+    host, path = endpoint_of(url)
+    key = (method.upper(), host, path)
+    stats = _stats.get(key)
+    if stats is None:
+        stats = _stats[key] = EndpointStats()
+    return host, stats
+
+
+def _body_size(body) -> int:
+    if body is None:
+        return 0
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    return 0  # 스트림/파일 본문은 크기를 알 수 없음
+
+
+def record(method: str, url: str, response, elapsed: float, retry: bool = False, slept: float = 0.0) -> None:
+    """응답 한 건 기록. 받은 바이트는 Content-Length(압축 전송 크기), 없으면 본문 길이."""
+    request = getattr(response, "request", None)
+    sent = _body_size(getattr(request, "body", None))
+    length = response.headers.get("Content-Length")
+    try:
+        received = int(length) if length is not None else len(response.content or b"")
+    except (TypeError, ValueError):
+        received = 0
+    with _lock:
+        host, stats = _entry(method, url)
+        stats.observe(str(response.status_code), elapsed, retry)
+        if response.status_code in THROTTLE_STATUSES:
+            stats.throttled += 1
+        stats.bytes_sent += sent
+        stats.bytes_received += received
+        if slept:
+            _sleep[host] = _sleep.get(host, 0.0) + slept
+
+
+def record_error(method: str, url: str, elapsed: float, retry: bool = False, slept: float = 0.0) -> None:
+    """응답 없이 예외(타임아웃·연결 실패)로 끝난 요청 기록."""
+    with _lock:
+        host, stats = _entry(method, url)
+        stats.observe("error", elapsed, retry)
+        stats.errors += 1
+        if slept:
+            _sleep[host] = _sleep.get(host, 0.0) + slept
+
+
+def reset() -> None:
+    global _started
+    with _lock:
+        _stats.clear()
+        _sleep.clear()
+        _started = time.time()
+
+
+def _percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+def summary() -> str:
+    """엔드포인트별 요약 표 (요청이 없으면 빈 문자열)."""
+    with _lock:
+        items = sorted(_stats.items(), key=lambda kv: -kv[1].latency_sum)
+        sleep = dict(_sleep)
+    if not items:
+        return ""
+    lines = [
+        "=== HTTP 호출 요약 ===",
+        f"{'요청':>6} {'합계(s)':>8} {'p50(ms)':>8} {'p95(ms)':>8} {'재시도':>6} {'스로틀':>6} "
+        f"{'보냄(KB)':>9} {'받음(KB)':>9}  상태  엔드포인트",
+    ]
+    total = EndpointStats()
+    for (method, host, path), s in items:
+        statuses = ",".join(f"{code}×{n}" for code, n in sorted(s.statuses.items()))
+        lines.append(
+            f"{s.count:>6} {s.latency_sum:>8.2f} {_percentile(s.latencies, 0.5) * 1000:>8.0f} "
+            f"{_percentile(s.latencies, 0.95) * 1000:>8.0f} {s.retries:>6} {s.throttled:>6} "
+            f"{s.bytes_sent / 1024:>9.1f} {s.bytes_received / 1024:>9.1f}  {statuses}  {method} {host}{path}"
+        )
+        total.count += s.count
+        total.latency_sum += s.latency_sum
+        total.retries += s.retries
+        total.throttled += s.throttled
+        total.errors += s.errors
+    lines.append(
+        f"합계: 요청 {total.count}건, HTTP 시간 {total.latency_sum:.2f}초, 재시도 {total.retries}, "
+        f"스로틀 {total.throttled}, 오류 {total.errors}, 레이트 리미터 대기 {sum(sleep.values()):.2f}초, "
+        f"실행 {time.time() - _started:.1f}초"
+    )
+    return "\n".join(lines)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_text(job: str) -> str:
+    """textfile collector 형식 본문."""
+    with _lock:
+        items = sorted(_stats.items())
+        sleep = sorted(_sleep.items())
+    out = []
+
+    def metric(name: str, kind: str, help_text: str) -> None:
+        out.append(f"# HELP {name} {help_text}")
+        out.append(f"# TYPE {name} {kind}")
+
+    def labels(**kv) -> str:
+        return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in kv.items()) + "}"
+
+    metric("jira_http_request_duration_seconds", "histogram", "HTTP request latency by endpoint")
+    for (method, host, path), s in items:
+        base = dict(job=job, method=method, host=host, endpoint=path)
+        for bound, n in zip(BUCKETS, s.bucket_counts):
+            out.append(f"jira_http_request_duration_seconds_bucket{labels(**base, le=bound)} {n}")
+        out.append(f"jira_http_request_duration_seconds_bucket{labels(**base, le='+Inf')} {s.count}")
+        out.append(f"jira_http_request_duration_seconds_sum{labels(**base)} {s.latency_sum:.6f}")
+        out.append(f"jira_http_request_duration_seconds_count{labels(**base)} {s.count}")
+    metric("jira_http_responses_total", "counter", "HTTP responses by status code (error = no response)")
+    for (method, host, path), s in items:
+        for status, n in sorted(s.statuses.items()):
+            out.append(f"jira_http_responses_total{labels(job=job, method=method, host=host, endpoint=path, status=status)} {n}")
+    for name, attr, help_text in (
+        ("jira_http_retries_total", "retries", "Requests that were throttle retries"),
+        ("jira_http_throttled_total", "throttled", "429/503 throttle responses"),
+        ("jira_http_bytes_sent_total", "bytes_sent", "Request body bytes sent"),
+        ("jira_http_bytes_received_total", "bytes_received", "Response bytes received"),
+    ):
+        metric(name, "counter", help_text)
+        for (method, host, path), s in items:
+            out.append(f"{name}{labels(job=job, method=method, host=host, endpoint=path)} {getattr(s, attr)}")
+    metric("jira_http_rate_limit_sleep_seconds_total", "counter", "Time spent waiting on the rate limiter")
+    for host, seconds in sleep:
+        out.append(f"jira_http_rate_limit_sleep_seconds_total{labels(job=job, host=host)} {seconds:.6f}")
+    metric("jira_run_duration_seconds", "gauge", "Wall time of the last run")
+    out.append(f"jira_run_duration_seconds{labels(job=job)} {time.time() - _started:.3f}")
+    metric("jira_run_last_timestamp_seconds", "gauge", "Unix time the last run finished")
+    out.append(f"jira_run_last_timestamp_seconds{labels(job=job)} {time.time():.0f}")
+    return "\n".join(out) + "\n"
+
+
+def write_textfile(job: str, directory: Optional[str] = METRICS_DIR) -> Optional[str]:
+    """<directory>/jira_<job>.prom 을 원자적으로 교체 (collector 가 쓰는 중인 파일을 읽지 않도록)."""
+    if not directory:
+        return None
+    name = re.sub(r"[^A-Za-z0-9_]", "_", job)
+    path = os.path.join(directory, f"jira_{name}.prom")
+    try:
+        os.makedirs(directory, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(prometheus_text(job))
+        os.replace(tmp, path)
+    except OSError:
+        return None
+    return path
+
+
+def finish() -> None:
+    """종료 훅: 요약 출력 + textfile 기록. job 은 실행한 스크립트 파일명."""
+    if not _stats:
+        return
+    job = Path(sys.argv[0]).stem if sys.argv and sys.argv[0] else "python"
+    if SUMMARY:
+        print("\n" + summary(), file=sys.stderr)
+    write_textfile(job)
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+호스트별 적응형 토큰 버킷 레이트 리미터.
+
+스크립트마다 API 호출 뒤 고정 time.sleep(0.1~0.4)을 두던 방식을 대체한다.
+- 모든 요청은 호출 전에 acquire()로 토큰을 받는다 (스레드 간 공유)
+- 정상 응답이 이어지면 초당 허용량을 조금씩 올리고 (additive increase)
+- 429/503, Retry-After, X-RateLimit-* 헤더를 보면 허용량을 절반으로 줄이고
+  Retry-After 동안은 해당 호스트의 모든 요청을 멈춘다 (multiplicative decrease)
+
+환경 변수:
+    JIRA_RATE_LIMIT      시작 초당 요청 수 (기본 10, 0이면 제한 없음)
+    JIRA_RATE_LIMIT_MAX  상한 초당 요청 수 (기본 25)
+"""
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+DEFAULT_RATE = float(os.getenv("JIRA_RATE_LIMIT", "10"))
+MAX_RATE = float(os.getenv("JIRA_RATE_LIMIT_MAX", "25"))
+MIN_RATE = 0.5
+BURST = 5.0
+INCREASE_STEP = 0.5  # 정상 응답 1건당 증가량 (req/s)
+DECREASE_FACTOR = 0.5  # 429 등 스로틀 감지 시 배율
+NEAR_LIMIT_FACTOR = 0.8  # X-RateLimit-NearLimit / 잔여량 부족 시 배율
+LOW_REMAINING = 5  # X-RateLimit-Remaining 이 이 값 이하이면 감속
+THROTTLE_STATUSES = (429, 503)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP-date)를 대기 초로 변환."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class AdaptiveRateLimiter:
+    """스레드 안전 토큰 버킷. rate는 응답을 보고 AIMD 방식으로 조정된다."""
+
+    def __init__(self, rate: float = DEFAULT_RATE, max_rate: float = MAX_RATE,
+                 min_rate: float = MIN_RATE, burst: float = BURST):
+        self.rate = rate
+        self.max_rate = max(max_rate, rate)
+        self.min_rate = min(min_rate, rate)
+        self.burst = burst
+        self._tokens = burst
+        self._last = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+        self.waited = 0.0  # 누적 대기 시간(초)
+        self.throttled = 0  # 스로틀 응답 수
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def acquire(self) -> float:
+        """토큰 1개를 받을 때까지 대기. 실제 대기한 초를 반환."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._blocked_until:
+                    delay = self._blocked_until - now
+                elif self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    self.waited += waited
+                    return waited
+                else:
+                    delay = (1.0 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def backoff(self, retry_after: Optional[float] = None) -> None:
+        """스로틀 감지: 허용량 감소 + Retry-After(없으면 1틱) 동안 호스트 전체 정지."""
+        with self._lock:
+            self.throttled += 1
+            self.rate = max(self.min_rate, self.rate * DECREASE_FACTOR)
+            self._tokens = 0.0
+            pause = retry_after if retry_after is not None else 1.0 / self.rate
+            self._blocked_until = max(self._blocked_until, time.monotonic() + pause)
+
+    def observe(self, status_code: int, headers) -> bool:
+        """응답을 반영해 rate 조정. 스로틀 응답(재시도 필요)이면 True."""
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+        if status_code in THROTTLE_STATUSES:
+            self.backoff(retry_after)
+            return True
+        with self._lock:
+            near_limit = (headers.get("X-RateLimit-NearLimit") or "").lower() == "true"
+            remaining = headers.get("X-RateLimit-Remaining")
+            try:
+                low = remaining is not None and int(remaining) <= LOW_REMAINING
+            except ValueError:
+                low = False
+            if near_limit or low:
+                self.rate = max(self.min_rate, self.rate * NEAR_LIMIT_FACTOR)
+            else:
+                self.rate = min(self.max_rate, self.rate + INCREASE_STEP)
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+        return False
+
+
+_limiters: Dict[str, AdaptiveRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def limiter_for(host: str) -> Optional[AdaptiveRateLimiter]:
+    """호스트별 공유 리미터. JIRA_RATE_LIMIT=0 이면 None (제한 없음)."""
+    if DEFAULT_RATE <= 0:
+        return None
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = _limiters[host] = AdaptiveRateLimiter()
+        return limiter
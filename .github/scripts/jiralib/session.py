@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""
+프로세스 공유 상태: JIRA 환경 변수, 인증 헤더, 매핑 파일, 같은 프로세스 안의 스크립트 실행.
+
+스크립트마다 jira.env 파싱·인증 헤더 생성·jira-mapping.json 로드를 따로 하고,
+보고서처럼 다른 스크립트를 subprocess 로 띄우면 그때마다 인터프리터와 HTTP 커넥션 풀을 새로 만든다.
+jira-cli.py 와 run_script() 로 여러 스크립트를 한 프로세스에서 이어 실행하면
+- jiralib.http 세션(커넥션 풀)·레이트 리미터
+- backlog.load / load_mapping 메모, 이슈 조회 캐시(fetch_issues), 코드 인덱스, 전환 캐시,
+  이미 import 한 스크립트 모듈
+을 모두 공유한다.
+
+이슈 조회 캐시: (호스트, 키) 마다 조회한 필드와 이슈 원본을 두고, 요청 필드가 그 안에 있으면
+요청 없이 돌려준다. 이 프로세스가 쓰기 요청을 하나라도 보내면 (http.writes()) 캐시를 모두 버린다.
+"""
+import base64
+import copy
+import importlib.util
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from jiralib import http, issues
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+ENV_FILES = ("docs/jira/jira.env", "jira.env")
+MAPPING_FILE = PROJECT_ROOT / ".github" / "jira-mapping.json"
+
+
+def load_env_file(path: str) -> None:
+    """KEY=value 형식 파일을 읽어 os.environ 에 설정 (따옴표 값 지원)."""
+    if not path or not os.path.exists(path):
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#") or "=" not in line:
+                continue
+            key, _, value = line.partition("=")
+            key, value = key.strip(), value.strip()
+            if value.startswith('"') and value.endswith('"'):
+                value = value[1:-1].replace('\\"', '"')
+            elif value.startswith("'") and value.endswith("'"):
+                value = value[1:-1].replace("\\'", "'")
+            if key:
+                os.environ[key] = value
+
+
+def load_env(paths: Iterable[str] = ENV_FILES) -> None:
+    """JIRA_URL 이 없을 때만 paths 를 순서대로 읽어 JIRA_URL 을 주는 첫 파일까지 반영 (상대 경로는 프로젝트 루트 기준)."""
+    if os.getenv("JIRA_URL"):
+        return
+    for p in paths:
+        load_env_file(str(PROJECT_ROOT / p) if not os.path.isabs(p) else p)
+        if os.getenv("JIRA_URL"):
+            return
+
+
+def credentials() -> Tuple[str, str, str]:
+    """(JIRA_URL(끝 / 제거), JIRA_EMAIL, JIRA_API_TOKEN). 없는 값은 빈 문자열."""
+    return (
+        (os.getenv("JIRA_URL") or "").rstrip("/"),
+        os.getenv("JIRA_EMAIL") or "",
+        os.getenv("JIRA_API_TOKEN") or "",
+    )
+
+
+def auth_headers(email: Optional[str] = None, token: Optional[str] = None) -> Dict[str, str]:
+    """Basic 인증 JSON 요청 헤더 (인자가 없으면 환경 변수). 호출마다 새 dict."""
+    _, env_email, env_token = credentials()
+    auth = base64.b64encode(f"{email or env_email}:{token or env_token}".encode()).decode()
+    return {
+        "Authorization": f"Basic {auth}",
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+    }
+
+
+_mappings: Dict[str, tuple] = {}  # 경로 -> ((mtime_ns, size), dict)
+
+
+def load_mapping(path: Optional[str] = None) -> Dict:
+    """
+    jira-mapping.json 로드 (없거나 깨졌으면 {}). 파일이 바뀌지 않았으면 다시 읽지 않고
+    메모해 둔 내용의 복사본을 돌려준다 (호출한 쪽에서 고쳐도 다른 호출에 영향 없음).
+    """
+    path = os.path.abspath(path or MAPPING_FILE)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return {}
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _mappings.get(path)
+    if cached and cached[0] == signature:
+        return copy.deepcopy(cached[1])
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        data = {}
+    if not isinstance(data, dict):
+        data = {}
+    _mappings[path] = (signature, data)
+    return copy.deepcopy(data)
+
+
+_issues: Dict[Tuple[str, str], Tuple[FrozenSet[str], dict]] = {}  # (호스트, 키) -> (조회한 필드, 이슈 원본)
+_issues_writes = 0  # 캐시를 채울 때의 http.writes()
+_issues_lock = threading.Lock()
+
+
+def fetch_issues(
+    jira_url: str,
+    headers: dict,
+    keys: Iterable[str],
+    fields: Iterable[str] = issues.FIELDS,
+) -> Dict[str, dict]:
+    """
+    issues.fetch_issues 와 같되 프로세스 안에서 결과를 캐시한다 (모듈 설명 참고).
+    캐시에 없거나 필드가 모자란 키만 조회한다. 돌려주는 이슈 원본은 복사본.
+    """
+    global _issues_writes
+    jira_url = jira_url.rstrip("/")
+    fields = list(fields)
+    wanted = frozenset(fields)
+    unique = sorted({k.strip() for k in keys if k and k.strip()})
+    found: Dict[str, dict] = {}
+    with _issues_lock:
+        writes = http.writes()
+        if writes != _issues_writes:
+            _issues.clear()
+            _issues_writes = writes
+        for key in unique:
+            entry = _issues.get((jira_url, key))
+            if entry and wanted <= entry[0]:
+                found[key] = entry[1]
+    missing = [key for key in unique if key not in found]
+    if missing:
+        fetched = issues.fetch_issues(jira_url, headers, missing, fields)
+        with _issues_lock:
+            # 조회하는 동안 다른 스레드가 쓰기를 보냈으면 결과를 캐시하지 않는다
+            if http.writes() == writes == _issues_writes:
+                for key, issue in fetched.items():
+                    _issues[(jira_url, key)] = (wanted, issue)
+        found.update(fetched)
+    return copy.deepcopy(found)
+
+
+def fetch_issue_statuses(jira_url: str, headers: dict, keys: Iterable[str]) -> Dict[str, dict]:
+    """issues.fetch_issue_statuses 의 캐시 버전: {key: {key, summary, status, status_category, issuetype, parent}}."""
+    return {key: issues.issue_info(issue) for key, issue in fetch_issues(jira_url, headers, keys).items()}
+
+
+def clear_issues() -> None:
+    """이슈 조회 캐시를 비운다."""
+    with _issues_lock:
+        _issues.clear()
+
+
+_modules: Dict[str, ModuleType] = {}
+
+
+def _load_script(path: str) -> ModuleType:
+    module = _modules.get(path)
+    if module is None:
+        name = "_jira_script_" + Path(path).stem.replace("-", "_")
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _modules[path] = module
+    return module
+
+
+def _exit_code(code) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def run_script(path: str, argv: List[str]) -> int:
+    """
+    스크립트(jira-*.py 등)의 main() 을 현재 프로세스에서 argv 로 실행하고 종료 코드를 반환.
+    sys.exit() 는 종료 코드로 바꾸고, 실행 후 sys.argv 와 작업 디렉터리를 되돌린다.
+    모듈은 한 번만 import 하므로 모듈 수준 캐시는 다음 실행에서도 유지된다.
+    """
+    path = os.path.abspath(path)
+    module = _load_script(path)
+    if not callable(getattr(module, "main", None)):
+        raise AttributeError(f"{path}: main() 이 없습니다")
+    saved_argv, saved_cwd = sys.argv, os.getcwd()
+    sys.argv = [path, *argv]
+    try:
+        return _exit_code(module.main())
+    except SystemExit as e:
+        return _exit_code(e.code)
+    finally:
+        sys.argv = saved_argv
+        os.chdir(saved_cwd)
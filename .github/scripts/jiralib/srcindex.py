@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+"""
+소스 트리 인덱스 (한 번의 순회로 구축, 디스크에 증분 저장).
+
+코드 검증 스크립트가 클래스마다 os.walk(src) 를 다시 돌던 것을 대체한다.
+- 파일명 -> 경로 목록
+- Kotlin 타입 선언(class/interface, data/enum/sealed 포함) -> 선언된 파일
+- 검색 대상 확장자 파일별 키워드 포함 여부
+순회는 jiralib.walker (제외 디렉터리·.gitignore 는 들어가기 전에 가지치기)로 하고,
+읽을 파일이 많으면 읽기·분석을 프로세스 풀에 나눠 맡긴다.
+구축 후 클래스 파일 확인은 dict 조회로 끝나고, 키워드 검색은 scan_keywords() 로
+전체 키워드를 Aho-Corasick 한 번의 본문 순회로 처리한 뒤 집합 조회로 답한다.
+
+cache_name 을 주면 파일별 선언·키워드 결과를 .github/.cache/jira-<cache_name>.json 에 저장한다.
+- 재실행 시 mtime·크기가 같은 파일은 읽지 않고 저장된 결과를 쓴다
+- mtime 만 바뀐 파일(체크아웃 등)은 git blob 해시가 같으면 다시 분석하지 않는다
+- 새 키워드가 요청될 때만 전체 본문을 읽는다
+→ 커밋 하나로 파일 한두 개가 바뀐 뒤의 재검증은 디렉터리 순회 + 바뀐 파일 분석으로 끝난다.
+
+환경 변수:
+    JIRA_CODE_INDEX_DIR  인덱스 캐시 디렉터리 (기본 .github/.cache, 빈 값이면 비활성)
+    JIRA_INDEX_WORKERS   파일 분석 프로세스 수 (기본 CPU 수)
+"""
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from jiralib.matcher import KeywordMatcher
+from jiralib.walker import walk_files
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+CACHE_DIR = os.getenv("JIRA_CODE_INDEX_DIR", str(PROJECT_ROOT / ".github" / ".cache"))
+CACHE_VERSION = 1
+# 읽을 파일이 이보다 많을 때만 프로세스 풀 사용 (풀 기동 비용이 더 큼)
+PARALLEL_MIN_FILES = 200
+WORKERS = int(os.getenv("JIRA_INDEX_WORKERS", "0")) or os.cpu_count() or 1
+
+TEXT_EXTENSIONS = (".kt", ".yml", ".yaml", ".kts")
+# class X / data class X / enum class X / interface X / fun interface X
+DECLARATION_RE = re.compile(r"\b(?:class|interface)\s+([A-Za-z_]\w*)")
+
+
+def git_blob_hash(data: bytes) -> str:
+    """`git hash-object` 와 같은 blob SHA-1."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def analyze_files(paths: List[str], patterns: List[str], declarations: bool = True) -> List[Optional[dict]]:
+    """
+    파일별 {blob, declarations, keywords} (읽기 실패는 None). 프로세스 풀 작업 단위라 모듈 수준 함수.
+    매처는 호출(청크)당 한 번만 만든다.
+    """
+    matcher = KeywordMatcher(patterns) if patterns else None
+    results: List[Optional[dict]] = []
+    for path in paths:
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            results.append(None)
+            continue
+        text = data.decode("utf-8", errors="ignore")
+        results.append({
+            "blob": git_blob_hash(data),
+            "declarations": (
+                sorted({m.group(1) for m in DECLARATION_RE.finditer(text)})
+                if declarations and path.endswith(".kt") else []
+            ),
+            "keywords": sorted(matcher.find(text)) if matcher else [],
+        })
+    return results
+
+
+def _analyze_parallel(paths: List[str], patterns: List[str], declarations: bool) -> List[Optional[dict]]:
+    """파일이 많으면 청크로 나눠 프로세스 풀에서 읽기·매칭, 적으면 현재 프로세스에서."""
+    workers = min(WORKERS, len(paths) // (PARALLEL_MIN_FILES // 2) or 1)
+    if workers <= 1 or len(paths) < PARALLEL_MIN_FILES:
+        return analyze_files(paths, patterns, declarations)
+    size = -(-len(paths) // (workers * 4))
+    chunks = [paths[i:i + size] for i in range(0, len(paths), size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        parts = executor.map(analyze_files, chunks, repeat(patterns), repeat(declarations))
+        return [r for part in parts for r in part]
+
+
+class SourceIndex:
+    """root 이하 파일을 한 번 순회해 만든 인덱스."""
+
+    def __init__(
+        self,
+        root: Path,
+        extensions: Iterable[str] = TEXT_EXTENSIONS,
+        exclude: Optional[Callable[[str], bool]] = None,
+        cache_name: Optional[str] = None,
+        gitignore: bool = True,
+    ):
+        """
+        exclude: 디렉터리 경로 문자열을 받아 True 면 그 아래로 들어가지 않음.
+        cache_name: 지정 시 파일별 분석 결과를 디스크에 저장해 다음 실행에서 재사용.
+        gitignore: .gitignore 로 무시되는 파일/디렉터리 제외.
+        """
+        self.root = Path(root)
+        self.extensions = tuple(extensions)
+        self.exclude = exclude
+        self.gitignore = gitignore
+        self.cache_file = os.path.join(CACHE_DIR, f"jira-{cache_name}.json") if cache_name and CACHE_DIR else None
+        self.files_by_name: Dict[str, List[Path]] = {}
+        self.declarations: Dict[str, Set[Path]] = {}
+        self.keyword_files: Dict[str, Set[Path]] = {}
+        self.stats = {"files": 0, "reused": 0, "rescanned": 0}
+        self._entries: Dict[str, dict] = {}  # root 기준 상대 경로 -> 파일별 분석 결과
+        self._paths: Dict[str, Path] = {}  # 상대 경로 -> Path
+        self._dirty = False
+        if self.root.exists():
+            self._build()
+
+    # --- 캐시 ---
+    def _load_cache(self) -> Tuple[Dict[str, dict], List[str]]:
+        """(파일별 항목, 검색한 적 있는 패턴 목록). 루트/확장자가 다르면 버린다."""
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return {}, []
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}, []
+        if (
+            data.get("version") != CACHE_VERSION
+            or data.get("root") != str(self.root)
+            or data.get("extensions") != list(self.extensions)
+        ):
+            return {}, []
+        return data.get("files", {}), data.get("patterns", [])
+
+    def save(self) -> None:
+        """변경이 있을 때만 캐시 파일을 원자적으로 교체."""
+        if not self.cache_file or not self._dirty:
+            return
+        data = {
+            "version": CACHE_VERSION,
+            "root": str(self.root),
+            "extensions": list(self.extensions),
+            "patterns": sorted(self.keyword_files),
+            "files": self._entries,
+        }
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            tmp = f"{self.cache_file}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp, self.cache_file)
+            self._dirty = False
+        except OSError:
+            pass
+
+    # --- 구축 ---
+    def _build(self) -> None:
+        cached, patterns = self._load_cache()
+        root = str(self.root.resolve())
+        prefix_len = len(root.rstrip(os.sep)) + 1
+        pending: List[Tuple[str, str, os.stat_result]] = []  # 다시 읽을 파일 (상대 경로, 경로, stat)
+        for entry in walk_files(root, self.exclude, self.gitignore):
+            path = Path(entry.path)
+            self.files_by_name.setdefault(entry.name, []).append(path)
+            if not entry.name.endswith(self.extensions):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            rel = entry.path[prefix_len:]
+            self._paths[rel] = path
+            old = cached.get(rel)
+            if old and old["mtime_ns"] == stat.st_mtime_ns and old["size"] == stat.st_size:
+                self._entries[rel] = old
+            else:
+                pending.append((rel, entry.path, stat))
+
+        rescanned = 0
+        results = _analyze_parallel([path for _, path, _ in pending], patterns, True)
+        for (rel, _path, stat), result in zip(pending, results):
+            if result is None:
+                self._paths.pop(rel, None)
+                continue
+            old = cached.get(rel)
+            if old and old["blob"] == result["blob"]:
+                # 내용은 그대로, 시각만 바뀜
+                self._entries[rel] = dict(old, mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+            else:
+                self._entries[rel] = dict(result, mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+                rescanned += 1
+        if pending or set(cached) - set(self._entries):
+            self._dirty = True
+        self.stats.update(files=len(self._entries), rescanned=rescanned, reused=len(self._entries) - rescanned)
+
+        self.keyword_files = {p: set() for p in patterns}
+        for rel, entry in self._entries.items():
+            path = self._paths[rel]
+            for decl in entry["declarations"]:
+                self.declarations.setdefault(decl, set()).add(path)
+            for pattern in entry["keywords"]:
+                if pattern in self.keyword_files:
+                    self.keyword_files[pattern].add(path)
+        self.save()
+
+    # --- 조회 ---
+    def has_file(self, filename: str) -> bool:
+        return filename in self.files_by_name
+
+    def has_class_file(self, class_name: str, file_extension: str = ".kt") -> bool:
+        """ClassName.kt 파일이 있고 그 파일 안에 ClassName 이 선언되어 있는지."""
+        declared_in = self.declarations.get(class_name)
+        if not declared_in:
+            return False
+        return any(p in declared_in for p in self.files_by_name.get(class_name + file_extension, ()))
+
+    def scan_keywords(self, patterns: Iterable[str]) -> None:
+        """아직 검색하지 않은 패턴들을 매처 하나로 묶어 본문을 한 번만 훑는다."""
+        missing = sorted({p for p in patterns if p and p not in self.keyword_files})
+        if not missing:
+            return
+        rels = list(self._entries)
+        results = _analyze_parallel([str(self._paths[rel]) for rel in rels], missing, False)
+        for pattern in missing:
+            self.keyword_files[pattern] = set()
+        for rel, result in zip(rels, results):
+            if result is None:
+                continue
+            self._entries[rel]["keywords"] = self._entries[rel]["keywords"] + result["keywords"]
+            for pattern in result["keywords"]:
+                self.keyword_files[pattern].add(self._paths[rel])
+        self._dirty = True
+        self.save()
+
+    def contains_any(self, patterns: Iterable[str]) -> bool:
+        """패턴 중 하나라도 인덱스된 파일 본문에 포함되면 True."""
+        patterns = list(patterns)
+        self.scan_keywords(patterns)
+        return any(self.keyword_files.get(p) for p in patterns)
@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+로컬 SQLite 이슈 저장소 + 증분 동기화.
+
+jira-refresh-issues.py 가 매번 프로젝트 전체를 내려받던 것을 대체한다.
+- issues 테이블: key 기본키, parent/type/status 인덱스
+- 증분 동기화: `project = X ORDER BY updated DESC` 를 앞에서부터 읽다가
+  updated < 마지막 동기화 시각이 나오면 중단 (= updated >= last_sync).
+  JQL 날짜는 분 단위·사용자 시간대 기준이라 경계가 어긋나기 쉬우므로
+  비교는 응답의 updated(오프셋 포함 타임스탬프)로 한다.
+- 삭제 처리: 같은 응답의 total(프로젝트 전체 이슈 수)이 로컬 수와 다르면
+  키 목록만 다시 받아 사라진 키를 지운다.
+→ 변경이 100건 이하이고 삭제가 없으면 새로고침은 요청 1회.
+
+기본 경로: .github/.cache/jira-issues.sqlite (JIRA_ISSUE_STORE 로 변경)
+"""
+import os
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from jiralib import http
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+DEFAULT_PATH = os.getenv(
+    "JIRA_ISSUE_STORE", str(PROJECT_ROOT / ".github" / ".cache" / "jira-issues.sqlite")
+)
+SEARCH_FIELDS = "summary,issuetype,status,parent,created,updated"
+PAGE_SIZE = 100
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    key TEXT PRIMARY KEY,
+    project TEXT NOT NULL,
+    summary TEXT NOT NULL DEFAULT '',
+    type TEXT NOT NULL DEFAULT '',
+    status TEXT NOT NULL DEFAULT '',
+    status_category TEXT NOT NULL DEFAULT '',
+    parent TEXT,
+    created TEXT NOT NULL DEFAULT '',
+    updated TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_issues_parent ON issues(parent);
+CREATE INDEX IF NOT EXISTS idx_issues_type ON issues(type);
+CREATE INDEX IF NOT EXISTS idx_issues_status ON issues(status);
+CREATE INDEX IF NOT EXISTS idx_issues_project ON issues(project);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def parse_jira_time(value: Optional[str]) -> Optional[datetime]:
+    """'2026-01-02T03:04:05.000+0900' 형식을 aware datetime 으로."""
+    if not value:
+        return None
+    for fmt in ("%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S%z"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def _row_from_issue(issue: dict) -> tuple:
+    fields = issue.get("fields") or {}
+    status = fields.get("status") or {}
+    return (
+        issue["key"],
+        issue["key"].rsplit("-", 1)[0],
+        fields.get("summary") or "",
+        (fields.get("issuetype") or {}).get("name") or "",
+        status.get("name") or "",
+        (status.get("statusCategory") or {}).get("key") or "",
+        (fields.get("parent") or {}).get("key"),
+        fields.get("created") or "",
+        fields.get("updated") or "",
+    )
+
+
+def _issue_order(key: str) -> int:
+    num = key.rsplit("-", 1)[-1]
+    return int(num) if num.isdigit() else 0
+
+
+class IssueStore:
+    """이슈 스냅샷 저장소. 조회 결과는 jira-backend-issues.json 과 같은 dict 형식."""
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # --- meta ---
+    def get_meta(self, name: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return row["value"] if row else None
+
+    def set_meta(self, name: str, value: str) -> None:
+        self.conn.execute(
+            "INSERT INTO meta(name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = excluded.value",
+            (name, value),
+        )
+
+    # --- 쓰기 ---
+    def upsert(self, issues: Iterable[dict]) -> int:
+        """검색 API 응답 이슈들을 반영. 반영 건수 반환."""
+        rows = [_row_from_issue(i) for i in issues if i.get("key")]
+        self.conn.executemany(
+            "INSERT INTO issues(key, project, summary, type, status, status_category, parent, created, updated) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET project = excluded.project, summary = excluded.summary, "
+            "type = excluded.type, status = excluded.status, status_category = excluded.status_category, "
+            "parent = excluded.parent, created = excluded.created, updated = excluded.updated",
+            rows,
+        )
+        return len(rows)
+
+    def delete(self, keys: Iterable[str]) -> int:
+        keys = list(keys)
+        self.conn.executemany("DELETE FROM issues WHERE key = ?", [(k,) for k in keys])
+        return len(keys)
+
+    # --- 읽기 ---
+    def keys(self, project: str) -> Set[str]:
+        return {r["key"] for r in self.conn.execute("SELECT key FROM issues WHERE project = ?", (project,))}
+
+    def count(self, project: str) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM issues WHERE project = ?", (project,)).fetchone()[0]
+
+    def find(
+        self,
+        project: Optional[str] = None,
+        type: Optional[str] = None,
+        status: Optional[str] = None,
+        parent: Optional[str] = None,
+    ) -> List[Dict]:
+        """조건에 맞는 이슈 목록 (생성순). 반환 형식: {key, summary, type, status, parent}"""
+        where, args = [], []
+        for column, value in (("project", project), ("type", type), ("status", status), ("parent", parent)):
+            if value is not None:
+                where.append(f"{column} = ?")
+                args.append(value)
+        sql = "SELECT key, summary, type, status, parent, created FROM issues"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        rows = self.conn.execute(sql, args).fetchall()
+        rows.sort(key=lambda r: (r["created"], _issue_order(r["key"])))
+        return [
+            {"key": r["key"], "summary": r["summary"], "type": r["type"], "status": r["status"], "parent": r["parent"]}
+            for r in rows
+        ]
+
+    def get(self, key: str) -> Optional[Dict]:
+        row = self.conn.execute(
+            "SELECT key, summary, type, status, parent FROM issues WHERE key = ?", (key,)
+        ).fetchone()
+        return dict(row) if row else None
+
+    # --- 동기화 ---
+    def _search(self, jira_url: str, headers: dict, jql: str, start_at: int, fields: str) -> dict:
+        r = http.get(
+            f"{jira_url}/rest/api/2/search",
+            headers=headers,
+            params={"jql": jql, "fields": fields, "startAt": start_at, "maxResults": PAGE_SIZE},
+        )
+        r.raise_for_status()
+        return r.json()
+
+    def _remote_keys(self, jira_url: str, headers: dict, project: str, stats: Dict[str, int]) -> Set[str]:
+        keys: Set[str] = set()
+        start_at = 0
+        while True:
+            data = self._search(jira_url, headers, f"project = {project} ORDER BY key ASC", start_at, "created")
+            stats["requests"] += 1
+            batch = data.get("issues", [])
+            keys.update(i["key"] for i in batch)
+            start_at += len(batch)
+            if not batch or start_at >= data.get("total", 0):
+                return keys
+
+    def _full_sync(self, jira_url: str, headers: dict, project: str, stats: Dict[str, int]) -> Optional[datetime]:
+        """전체 동기화 (생성순 페이지네이션이라 도중 변경에도 순서가 밀리지 않음). 가장 최근 updated 반환."""
+        seen: Set[str] = set()
+        newest = None
+        start_at = 0
+        while True:
+            data = self._search(
+                jira_url, headers, f"project = {project} ORDER BY created ASC", start_at, SEARCH_FIELDS
+            )
+            stats["requests"] += 1
+            batch = data.get("issues", [])
+            stats["updated"] += self.upsert(batch)
+            for issue in batch:
+                seen.add(issue["key"])
+                updated = parse_jira_time((issue.get("fields") or {}).get("updated"))
+                if updated and (newest is None or updated > newest):
+                    newest = updated
+            start_at += len(batch)
+            if not batch or start_at >= data.get("total", 0):
+                break
+        # 이번에 보지 못한 키는 삭제된 이슈
+        stats["deleted"] = self.delete(self.keys(project) - seen)
+        return newest
+
+    def _incremental_sync(
+        self, jira_url: str, headers: dict, project: str, last_sync: datetime, stats: Dict[str, int]
+    ) -> datetime:
+        """updated 내림차순으로 읽다가 last_sync 이전 이슈가 나오면 중단. 가장 최근 updated 반환."""
+        newest = last_sync
+        remote_total = 0
+        start_at = 0
+        while True:
+            data = self._search(
+                jira_url, headers, f"project = {project} ORDER BY updated DESC", start_at, SEARCH_FIELDS
+            )
+            stats["requests"] += 1
+            remote_total = data.get("total", 0)
+            batch = data.get("issues", [])
+            changed = []
+            reached_last_sync = False
+            for issue in batch:
+                updated = parse_jira_time((issue.get("fields") or {}).get("updated"))
+                if updated and updated < last_sync:
+                    reached_last_sync = True
+                    break
+                changed.append(issue)
+                if updated and updated > newest:
+                    newest = updated
+            stats["updated"] += self.upsert(changed)
+            start_at += len(batch)
+            if reached_last_sync or not batch or start_at >= remote_total:
+                break
+        # 삭제(또는 다른 프로젝트로 이동)는 검색에 나오지 않으므로 전체 수로 감지
+        if self.count(project) != remote_total:
+            remote_keys = self._remote_keys(jira_url, headers, project, stats)
+            stats["deleted"] = self.delete(self.keys(project) - remote_keys)
+        return newest
+
+    def sync(self, jira_url: str, headers: dict, project: str, full: bool = False) -> Dict[str, int]:
+        """
+        JIRA와 동기화. 처음이거나 full=True 이면 전체, 아니면 마지막 동기화 이후 변경분만.
+        Returns: {"requests", "updated", "deleted", "total"}
+        """
+        jira_url = jira_url.rstrip("/")
+        stats = {"requests": 0, "updated": 0, "deleted": 0, "total": 0}
+        last_sync = None if full else parse_jira_time(self.get_meta(f"last_sync:{project}"))
+        if last_sync is None:
+            newest = self._full_sync(jira_url, headers, project, stats)
+        else:
+            newest = self._incremental_sync(jira_url, headers, project, last_sync, stats)
+        if newest:
+            self.set_meta(f"last_sync:{project}", newest.strftime("%Y-%m-%dT%H:%M:%S.%f%z"))
+        self.conn.commit()
+        stats["total"] = self.count(project)
+        return stats
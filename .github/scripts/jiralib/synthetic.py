@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+"""
+규모 테스트용 합성 프로젝트: 백로그 문서 + Kotlin 소스 트리 + JIRA 스냅샷/매핑.
+
+실제 JIRA_BACKLOG.md 와 src/ 는 작아서 백로그 파서(parse_backlog, parse_backlog_structure)나
+코드 검증(verify_class_file) 의 규모 문제가 운영에서야 드러난다. 같은 형식의 데이터를 원하는 크기
+(작업 10만 건 정도까지)로 만들어 미리 재 볼 수 있게 한다.
+- 백로그: jiralib.backlog 형식 그대로 (## Epic N / **Epic ID** / **Target Sprint**,
+  ### Story KEY / **Sprint**: Week N (일부는 "기한: YYYY-MM-DD"), **Tasks**: 의 `- [ ] KEY-N: 설명`)
+- 소스: 작업 제목의 XxxYyy.kt 중 implemented 비율만큼 src/main/kotlin/.../<계층>/ 에 클래스 생성
+- 스냅샷: jira-backend-issues.json 형식 (작업 parent 는 실제 스냅샷처럼 에픽), 매핑: 백로그 ID -> JIRA 키
+
+같은 인자(seed 포함)면 항상 같은 결과를 만든다. 큰 문서는 줄 단위로 스트리밍해 쓴다.
+
+    project = SyntheticProject(tasks=100_000)
+    project.write(Path("/tmp/synthetic"))     # docs/jira, src, .github 아래에 생성
+"""
+import json
+import os
+import random
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+# (계층 디렉터리, 클래스 접미사, 애너테이션, 선언)
+LAYERS = (
+    ("controller", "Controller", "@RestController", "class"),
+    ("service", "Service", "@Service", "class"),
+    ("repository", "Repository", "@Repository", "interface"),
+    ("domain/dto", "Response", "", "data class"),
+    ("domain/dto", "Request", "", "data class"),
+    ("domain/entity", "Entity", "@Entity", "class"),
+)
+PLAIN_TASKS = ("API 문서 업데이트", "통합 테스트 시나리오 정리", "응답 캐시 정책 검토", "에러 코드 표 정리")
+PRIORITIES = ("Critical", "High", "Medium", "Low")
+STATUSES = ("해야 할 일", "진행 중", "완료")
+BASE_PACKAGE = "com.goalmond.api.synthetic"
+START_DATE = date(2026, 1, 26)  # Week 1 시작일
+
+
+@dataclass
+class SyntheticTask:
+    id: str  # 백로그 ID (GAM-11-1)
+    key: str  # JIRA 키
+    summary: str
+    class_name: Optional[str]  # 제목의 XxxYyy.kt (일반 작업이면 None)
+    layer: int  # LAYERS 인덱스
+    implemented: bool  # 소스 트리에 클래스가 있는지
+    status: str
+
+
+@dataclass
+class SyntheticStory:
+    id: str
+    title: str
+    sprint: str
+    points: int
+    priority: str
+    tasks: List[SyntheticTask] = field(default_factory=list)
+
+
+@dataclass
+class SyntheticEpic:
+    id: str
+    number: int
+    name: str
+    week: int
+    stories: List[SyntheticStory] = field(default_factory=list)
+
+
+class SyntheticProject:
+    """에픽/스토리/작업 계층. 백로그 ID 는 에픽 1..E, 스토리 E+1.., 작업 <스토리>-N, JIRA 키는 작업에 이어서 부여."""
+
+    def __init__(
+        self,
+        tasks: int = 1000,
+        prefix: str = "GAM",
+        stories_per_epic: int = 5,
+        tasks_per_story: int = 4,
+        weeks: int = 6,
+        implemented: float = 0.5,
+        done: float = 0.5,
+        plain: float = 0.2,
+        seed: int = 0,
+    ):
+        self.prefix = prefix
+        self.weeks = weeks
+        rng = random.Random(seed)
+        per_epic = stories_per_epic * tasks_per_story
+        epic_count = max(1, -(-tasks // per_epic))
+        story_no = epic_count
+        next_key = epic_count + epic_count * stories_per_epic
+        remaining = tasks
+        self.epics: List[SyntheticEpic] = []
+        for e in range(1, epic_count + 1):
+            week = (e - 1) * weeks // epic_count + 1
+            epic = SyntheticEpic(f"{prefix}-{e}", e, f"합성 에픽 {e}", week)
+            for _ in range(stories_per_epic):
+                story_no += 1
+                sprint = f"Week {week}"
+                if story_no % 10 == 0:
+                    sprint += f" (기한: {(START_DATE + timedelta(weeks=week, days=-1)).isoformat()})"
+                story = SyntheticStory(
+                    f"{prefix}-{story_no}", f"합성 스토리 {story_no}", sprint,
+                    rng.choice((2, 3, 4, 5, 6)), rng.choice(PRIORITIES),
+                )
+                for t in range(1, tasks_per_story + 1):
+                    if remaining <= 0:
+                        break
+                    remaining -= 1
+                    next_key += 1
+                    layer = rng.randrange(len(LAYERS))
+                    if rng.random() < plain:
+                        class_name, summary = None, f"{rng.choice(PLAIN_TASKS)} ({story.title})"
+                    else:
+                        class_name = f"Synthetic{story_no}T{t}{LAYERS[layer][1]}"
+                        summary = f"{class_name}.kt 구현"
+                    story.tasks.append(SyntheticTask(
+                        id=f"{story.id}-{t}",
+                        key=f"{prefix}-{next_key}",
+                        summary=summary,
+                        class_name=class_name,
+                        layer=layer,
+                        implemented=class_name is not None and rng.random() < implemented,
+                        status="완료" if rng.random() < done else rng.choice(STATUSES[:2]),
+                    ))
+                epic.stories.append(story)
+            self.epics.append(epic)
+
+    def tasks(self) -> Iterator[SyntheticTask]:
+        for epic in self.epics:
+            for story in epic.stories:
+                yield from story.tasks
+
+    # ----- 백로그 -----
+
+    def backlog_lines(self) -> Iterator[str]:
+        yield f"# 합성 백로그 ({self.prefix}, 작업 {sum(1 for _ in self.tasks())}개)\n\n"
+        yield f"**예상 기간**: {self.weeks}주  \n**작성일**: {START_DATE.isoformat()}\n\n---\n\n"
+        for epic in self.epics:
+            points = sum(s.points for s in epic.stories)
+            yield (
+                f"## Epic {epic.number}: {epic.name} (Week {epic.week})\n\n"
+                f"**Epic ID**: {epic.id}  \n"
+                f"**Epic Name**: {epic.name}  \n"
+                f"**Business Value**: 합성 에픽 {epic.number} 의 사용자 가치  \n"
+                f"**Target Sprint**: Week {epic.week}  \n"
+                f"**Total Story Points**: {points} SP\n\n---\n\n"
+            )
+            for story in epic.stories:
+                yield from self._story_lines(epic, story)
+
+    def _story_lines(self, epic: SyntheticEpic, story: SyntheticStory) -> Iterator[str]:
+        yield (
+            f"### Story {story.id}: {story.title}\n\n"
+            f"**Story Type**: Story  \n"
+            f"**Priority**: {story.priority}  \n"
+            f"**Story Points**: {story.points} SP  \n"
+            f"**Assignee**: Backend Developer  \n"
+            f"**Sprint**: {story.sprint}  \n"
+            f"**Labels**: `synthetic`, `week{epic.week}`, `epic{epic.number}`\n\n"
+            f"**Description**:\n{story.title} 기능 구현. {epic.name} 의 일부로 API·서비스·저장소 계층을 추가한다.\n\n"
+            f"**User Story**:\n```\nAS A 학생 사용자\nI WANT {story.title} 기능을 사용하고\nSO THAT 유학 준비를 진행할 수 있다\n```\n\n"
+            f"**Acceptance Criteria**:\n"
+            f"- [ ] 정상 요청 시 200 응답\n- [ ] 잘못된 입력은 400 과 에러 코드 반환\n- [ ] 단위 테스트 작성\n\n"
+            f"**Tasks**:\n"
+        )
+        for task in story.tasks:
+            yield f"- [ ] {task.id}: {task.summary} - 1h\n"
+        classes = [t.class_name for t in story.tasks if t.class_name]
+        notes = "\n".join(f"src/main/kotlin/{self.class_path(t)}" for t in story.tasks if t.class_name)
+        yield (
+            f"\n**Technical Notes**:\n```kotlin\n// 파일 위치\n{notes or '// (없음)'}\n```\n\n"
+            f"**Definition of Done**:\n- {', '.join(classes) or '문서'} 작성 완료\n- 테스트 통과\n\n---\n\n"
+        )
+
+    def backlog_markdown(self) -> str:
+        return "".join(self.backlog_lines())
+
+    # ----- 소스 트리 -----
+
+    def class_path(self, task: SyntheticTask) -> str:
+        """src/main/kotlin 기준 상대 경로."""
+        directory = LAYERS[task.layer][0]
+        epic_no = task.id.split("-")[1]
+        return f"{BASE_PACKAGE.replace('.', '/')}/s{int(epic_no) // 100}/{directory}/{task.class_name}.kt"
+
+    def kotlin_source(self, task: SyntheticTask) -> str:
+        directory, _, annotation, declaration = LAYERS[task.layer]
+        epic_no = task.id.split("-")[1]
+        package = f"{BASE_PACKAGE}.s{int(epic_no) // 100}.{directory.replace('/', '.')}"
+        name = task.class_name
+        header = f"package {package}\n\n/**\n * {task.summary} ({task.id}).\n */\n"
+        if declaration == "data class":
+            return header + f"data class {name}(\n    val id: Long,\n    val name: String,\n    val score: Double = 0.0\n)\n"
+        if declaration == "interface":
+            return header + f"{annotation}\ninterface {name} {{\n    fun findById(id: Long): Any?\n    fun findAll(): List<Any>\n}}\n"
+        return header + (
+            f"{annotation}\n{declaration} {name} {{\n\n"
+            f"    fun handle(id: Long): String {{\n        require(id > 0) {{ \"invalid id\" }}\n        return \"{name}:$id\"\n    }}\n\n"
+            f"    fun list(limit: Int = 20): List<String> = (1..limit).map {{ \"{name}-$it\" }}\n}}\n"
+        )
+
+    def write_sources(self, src_root: Path) -> int:
+        """implemented 작업의 클래스 파일 생성. 생성한 파일 수."""
+        count = 0
+        made = set()
+        for task in self.tasks():
+            if not task.implemented:
+                continue
+            path = src_root / "main" / "kotlin" / self.class_path(task)
+            if path.parent not in made:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                made.add(path.parent)
+            path.write_text(self.kotlin_source(task), encoding="utf-8")
+            count += 1
+        return count
+
+    # ----- JIRA -----
+
+    def snapshot(self) -> List[dict]:
+        """jira-backend-issues.json 형식 (에픽, 스토리, 작업). 작업 parent 는 에픽."""
+        issues = []
+        for epic in self.epics:
+            done = all(t.status == "완료" for s in epic.stories for t in s.tasks)
+            issues.append({"key": epic.id, "summary": epic.name, "type": "에픽",
+                           "status": "완료" if done else "진행 중", "parent": None})
+        for epic in self.epics:
+            for story in epic.stories:
+                issues.append({"key": story.id, "summary": story.title, "type": "스토리",
+                               "status": "해야 할 일", "parent": epic.id})
+        for epic in self.epics:
+            for story in epic.stories:
+                for task in story.tasks:
+                    issues.append({"key": task.key, "summary": task.summary, "type": "작업",
+                                   "status": task.status, "parent": epic.id})
+        return issues
+
+    def mapping(self) -> Dict[str, str]:
+        """백로그 ID -> JIRA 키 (에픽·스토리는 같은 키)."""
+        result: Dict[str, str] = {}
+        for epic in self.epics:
+            result[epic.id] = epic.id
+            for story in epic.stories:
+                result[story.id] = story.id
+                for task in story.tasks:
+                    result[task.id] = task.key
+        return result
+
+    # ----- 한 번에 쓰기 -----
+
+    def write(self, root: Path, sources: bool = True, jira: bool = True) -> Dict[str, int]:
+        """
+        root 아래 프로젝트 구조로 기록:
+            docs/jira/JIRA_BACKLOG.md, docs/jira/FRONT_JIRA_BACKLOG.md(빈 문서)
+            src/main/kotlin/...                        (sources)
+            .github/jira-backend-issues.json, .github/jira-mapping.json   (jira)
+        Returns: {"tasks", "backlog_bytes", "sources", "issues"}
+        """
+        docs = root / "docs" / "jira"
+        docs.mkdir(parents=True, exist_ok=True)
+        backlog_path = docs / "JIRA_BACKLOG.md"
+        with open(backlog_path, "w", encoding="utf-8") as f:
+            f.writelines(self.backlog_lines())
+        front = docs / "FRONT_JIRA_BACKLOG.md"
+        if not front.exists():
+            front.write_text("# 합성 프론트엔드 백로그 (비어 있음)\n", encoding="utf-8")
+        stats = {
+            "tasks": sum(1 for _ in self.tasks()),
+            "backlog_bytes": os.path.getsize(backlog_path),
+            "sources": self.write_sources(root / "src") if sources else 0,
+            "issues": 0,
+        }
+        if jira:
+            github = root / ".github"
+            github.mkdir(parents=True, exist_ok=True)
+            issues = self.snapshot()
+            (github / "jira-backend-issues.json").write_text(
+                json.dumps(issues, ensure_ascii=False, indent=2), encoding="utf-8"
+            )
+            (github / "jira-mapping.json").write_text(
+                json.dumps(self.mapping(), ensure_ascii=False, indent=2), encoding="utf-8"
+            )
+            stats["issues"] = len(issues)
+        return stats
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+제목 매칭 인덱스 (백로그 항목 ↔ JIRA 이슈 키 해석용).
+
+제목 목록 전체를 이중 루프로 비교하던 것을 대체한다.
+- 정확히 일치: 정규화된 제목 -> 첫 항목 위치 해시
+- 질의를 포함하는 제목: n-gram -> 항목 위치 목록 중 가장 짧은 목록만 확인
+- 질의에 포함되는 제목: 제목의 첫 n-gram -> 항목 위치 (질의의 n-gram 으로 후보 조회)
+여러 항목이 맞으면 기존 루프와 같이 추가 순서상 첫 항목을 돌려준다.
+정규화 결과가 빈 제목/질의는 매칭하지 않는다.
+
+    index = TitleIndex(((i["key"], i["summary"]) for i in issues), normalize=normalize_summary)
+    jira_key = index.first_match(title)                   # 같거나 title 을 포함하는 요약
+    bl_key = index.first_match(summary, within=True)      # 위 조건 + summary 에 포함되는 제목
+"""
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+NGRAM = 3
+
+
+class TitleIndex:
+    """(키, 제목) 목록에 대한 정확/포함 매칭 인덱스."""
+
+    def __init__(
+        self,
+        items: Iterable[Tuple[Hashable, str]] = (),
+        normalize: Optional[Callable[[str], str]] = None,
+        n: int = NGRAM,
+    ):
+        self.normalize = normalize or (lambda s: s)
+        self.n = n
+        self.keys: List[Hashable] = []
+        self.titles: List[str] = []  # 정규화된 제목
+        self._exact: Dict[str, int] = {}
+        self._grams: Dict[str, List[int]] = {}  # n-gram -> 그 n-gram 이 있는 항목 위치 (오름차순)
+        self._heads: Dict[str, List[int]] = {}  # 첫 n-gram -> 항목 위치
+        self._short: List[int] = []  # n 글자보다 짧은 제목
+        for key, title in items:
+            self.add(key, title)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _ngrams(self, text: str) -> set:
+        return {text[i:i + self.n] for i in range(len(text) - self.n + 1)}
+
+    def add(self, key: Hashable, title: str) -> None:
+        norm = self.normalize(title or "")
+        if not norm:
+            return
+        pos = len(self.keys)
+        self.keys.append(key)
+        self.titles.append(norm)
+        self._exact.setdefault(norm, pos)
+        if len(norm) < self.n:
+            self._short.append(pos)
+            return
+        self._heads.setdefault(norm[:self.n], []).append(pos)
+        for gram in self._ngrams(norm):
+            self._grams.setdefault(gram, []).append(pos)
+
+    # --- 위치 조회 (없으면 None) ---
+    def _containing(self, query: str) -> Optional[int]:
+        """query 를 포함하는 첫 제목."""
+        if len(query) < self.n:
+            return next((i for i, t in enumerate(self.titles) if query in t), None)
+        postings = []
+        for gram in self._ngrams(query):
+            found = self._grams.get(gram)
+            if not found:
+                return None
+            postings.append(found)
+        # 가장 드문 n-gram 의 항목만 실제 포함 여부 확인
+        rarest = min(postings, key=len)
+        titles = self.titles
+        return next((i for i in rarest if query in titles[i]), None)
+
+    def _within(self, text: str) -> Optional[int]:
+        """text 에 포함되는 첫 제목."""
+        titles = self.titles
+        best = next((i for i in self._short if titles[i] in text), None)
+        for gram in self._ngrams(text):
+            for i in self._heads.get(gram, ()):
+                if best is not None and i >= best:
+                    break
+                if titles[i] in text:
+                    best = i
+        return best
+
+    # --- 공개 조회 ---
+    def exact(self, text: str) -> Optional[Hashable]:
+        """정규화 후 제목이 같은 첫 항목의 키."""
+        pos = self._exact.get(self.normalize(text or ""))
+        return None if pos is None else self.keys[pos]
+
+    def first_match(self, text: str, contains: bool = True, within: bool = False) -> Optional[Hashable]:
+        """
+        제목이 text 와 같거나, (contains) text 를 포함하거나, (within) text 에 포함되는
+        항목 중 추가 순서상 첫 항목의 키.
+        """
+        query = self.normalize(text or "")
+        if not query:
+            return None
+        candidates = [self._exact.get(query)]
+        if contains:
+            candidates.append(self._containing(query))
+        if within:
+            candidates.append(self._within(query))
+        found = [pos for pos in candidates if pos is not None]
+        return self.keys[min(found)] if found else None
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""
+os.scandir 기반 프로젝트 순회 (.gitignore 반영, 들어가기 전에 가지치기).
+
+os.walk 후 경로 문자열로 build/.git/node_modules 를 거르면 이미 그 트리를 모두 읽은 뒤다.
+walk_files() 는 디렉터리에 들어가기 전에 exclude 와 .gitignore 로 판단해
+Gradle 빌드 출력 등 제외 대상 트리는 열지 않는다.
+
+.gitignore 지원 범위: 빈 줄/주석, `!` 부정, 끝의 `/` (디렉터리만), `/` 포함 시 해당 .gitignore 기준 고정,
+`*`, `?`, `[...]`, `**`. 루트의 상위(저장소 최상위까지)와 순회 중 만나는 .gitignore 를 모두 적용한다.
+"""
+import os
+import re
+from typing import Callable, Iterator, List, Optional, Tuple
+
+
+def _glob_to_regex(pattern: str) -> str:
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        ch = pattern[i]
+        if ch == "*":
+            if pattern[i:i + 3] == "**/":
+                out.append("(?:.*/)?")
+                i += 3
+                continue
+            if pattern[i:i + 2] == "**":
+                out.append(".*")
+                i += 2
+                continue
+            out.append("[^/]*")
+        elif ch == "?":
+            out.append("[^/]")
+        elif ch == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                out.append(re.escape(ch))
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = end
+        elif ch == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(ch))
+        i += 1
+    return "".join(out)
+
+
+class GitIgnore:
+    """한 .gitignore 파일의 규칙. base 는 그 파일이 있는 디렉터리."""
+
+    def __init__(self, base: str, lines: List[str]):
+        self.base = base
+        self.rules: List[Tuple[re.Pattern, bool, bool]] = []  # (정규식, 부정, 디렉터리만)
+        for raw in lines:
+            line = raw.rstrip("\n")
+            if not line or line.startswith("#"):
+                continue
+            if not line.endswith("\\ "):
+                line = line.rstrip()
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            elif line.startswith("\\"):
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+            # 끝의 `/` 를 뗀 뒤 앞이나 가운데에 `/` 가 남아 있어야 고정 (`/build/` 는 고정, `build/` 는 아무 깊이)
+            anchored = "/" in line
+            line = line.lstrip("/")
+            regex = _glob_to_regex(line)
+            if not anchored:
+                regex = "(?:.*/)?" + regex
+            self.rules.append((re.compile(regex + r"\Z"), negate, dir_only))
+
+    @classmethod
+    def load(cls, directory: str) -> Optional["GitIgnore"]:
+        path = os.path.join(directory, ".gitignore")
+        try:
+            with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                ignore = cls(directory, f.readlines())
+        except OSError:
+            return None
+        return ignore if ignore.rules else None
+
+    def match(self, path: str, is_dir: bool) -> Optional[bool]:
+        """무시면 True, 부정 규칙으로 다시 포함이면 False, 해당 규칙 없으면 None (마지막 규칙 우선)."""
+        prefix = self.base.rstrip(os.sep) + os.sep
+        if not path.startswith(prefix):
+            return None
+        rel = path[len(prefix):].replace(os.sep, "/")
+        result = None
+        for regex, negate, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(rel):
+                result = not negate
+        return result
+
+
+def _is_ignored(ignores: List[GitIgnore], path: str, is_dir: bool) -> bool:
+    # 안쪽(나중에 추가된) .gitignore 가 우선
+    for ignore in reversed(ignores):
+        result = ignore.match(path, is_dir)
+        if result is not None:
+            return result
+    return False
+
+
+def _parent_ignores(root: str) -> List[GitIgnore]:
+    """root 의 상위 디렉터리(저장소 최상위까지)의 .gitignore 들, 바깥쪽부터."""
+    ignores: List[GitIgnore] = []
+    if os.path.exists(os.path.join(root, ".git")):
+        return ignores
+    current = os.path.dirname(root)
+    while current and current != os.path.dirname(current):
+        ignore = GitIgnore.load(current)
+        if ignore:
+            ignores.append(ignore)
+        if os.path.exists(os.path.join(current, ".git")):
+            break
+        current = os.path.dirname(current)
+    ignores.reverse()
+    return ignores
+
+
+def walk_files(
+    root: str,
+    exclude: Optional[Callable[[str], bool]] = None,
+    gitignore: bool = True,
+) -> Iterator[os.DirEntry]:
+    """
+    root 이하 파일의 DirEntry 를 순회.
+    exclude(디렉터리 경로) 가 True 이거나 .gitignore 로 무시되는 디렉터리는 열지 않는다.
+    """
+    root = os.path.abspath(root)
+    if exclude and exclude(root):
+        return
+    base_ignores = _parent_ignores(root) if gitignore else []
+    stack: List[Tuple[str, List[GitIgnore]]] = [(root, base_ignores)]
+    while stack:
+        directory, ignores = stack.pop()
+        if gitignore:
+            own = GitIgnore.load(directory)
+            if own:
+                ignores = ignores + [own]
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            if ignores and _is_ignored(ignores, entry.path, is_dir):
+                continue
+            if is_dir:
+                # os.walk 와 같이 디렉터리 심볼릭 링크는 따라가지 않음
+                if entry.name == ".git" or entry.is_symlink() or (exclude and exclude(entry.path)):
+                    continue
+                subdirs.append(entry.path)
+            else:
+                yield entry
+        stack.extend((d, ignores) for d in reversed(subdirs))
@@ -0,0 +1,290 @@
+# -*- coding: utf-8 -*-
+"""
+워크플로 전환(transition) 목록 디스크 캐시.
+
+전환 스크립트는 매 이슈마다 GET /issue/{key}/transitions 후 POST 하므로 요청이 2배가 된다.
+가능한 전환은 워크플로(프로젝트+이슈 유형으로 결정)와 현재 상태에만 의존하므로
+(호스트, 프로젝트, 이슈 유형, 상태) 단위로 캐시해 두고 재사용한다.
+
+- prime(): 대상 키들의 유형/상태를 jiralib.session 이슈 캐시로 한 번에 조회 (100건당 요청 1회)
+  → 이후 get_transitions()는 캐시 히트 시 요청 없음, 이슈당 POST 1회만 발생
+- prime 하지 않은 이슈는 GET /issue/{key}?expand=transitions 한 번으로 유형·상태·전환을 함께 받아 캐시
+- 무효화: TTL 경과, 캐시된 전환으로 POST 실패하거나 캐시된 목록에 목표 전환이 없으면
+  해당 항목 삭제 후 새로 조회해 재시도 (빈 목록은 권한·이슈별 조건 탓일 수 있어 캐시하지 않음)
+- transition_many(): (이슈, 목표) 목록을 asyncio로 동시 전환 (동시 실행 수 제한, 공용 레이트 리미터 적용)
+
+환경 변수:
+    JIRA_TRANSITION_CACHE      캐시 파일 경로 (기본 .github/.cache/jira-transitions.json, 빈 값이면 비활성)
+    JIRA_TRANSITION_CACHE_TTL  캐시 유효 시간(초, 기본 7일)
+    JIRA_CONCURRENCY           transition_many 기본 동시 실행 수 (jiralib.http 공용, 기본 8)
+"""
+import asyncio
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from jiralib import http, session
+from jiralib.http import DEFAULT_CONCURRENCY
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+CACHE_VERSION = 1
+CACHE_FILE = os.getenv(
+    "JIRA_TRANSITION_CACHE", str(PROJECT_ROOT / ".github" / ".cache" / "jira-transitions.json")
+)
+CACHE_TTL = float(os.getenv("JIRA_TRANSITION_CACHE_TTL", str(7 * 24 * 3600)))
+
+# 전환 목표: 목표 상태 이름(전환 이름 또는 도착 상태에 포함되면 일치) 또는 전환 목록 -> 전환 ID 선택 함수
+Target = Union[str, Callable[[List[dict]], Optional[str]]]
+
+_lock = threading.Lock()
+_entries: Optional[Dict[str, dict]] = None  # cache key -> {"saved_at", "transitions"}
+_issues: Dict[str, Dict[str, str]] = {}  # issue key -> {"issuetype", "status"}
+
+
+def _cache_key(jira_url: str, issue_key: str, issuetype: str, status: str) -> str:
+    host = urlsplit(jira_url).netloc
+    project = issue_key.rsplit("-", 1)[0]
+    return "|".join([host, project, issuetype, status])
+
+
+def _load() -> Dict[str, dict]:
+    global _entries
+    if _entries is None:
+        _entries = {}
+        if CACHE_FILE and os.path.exists(CACHE_FILE):
+            try:
+                with open(CACHE_FILE, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") == CACHE_VERSION:
+                    _entries = data.get("entries", {})
+            except (OSError, ValueError):
+                pass
+    return _entries
+
+
+def _save() -> None:
+    if not CACHE_FILE:
+        return
+    try:
+        os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+        tmp = f"{CACHE_FILE}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "entries": _entries}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, CACHE_FILE)
+    except OSError:
+        pass
+
+
+def _get_cached(key: str) -> Optional[List[dict]]:
+    with _lock:
+        entry = _load().get(key)
+        if not entry or time.time() - entry.get("saved_at", 0) > CACHE_TTL:
+            return None
+        return entry["transitions"]
+
+
+def _put_cached(key: str, transitions: List[dict]) -> None:
+    # 전환 판단에 쓰는 필드만 보관
+    slim = [
+        {"id": t.get("id"), "name": t.get("name"), "to": {"name": (t.get("to") or {}).get("name")}}
+        for t in transitions
+    ]
+    with _lock:
+        _load()[key] = {"saved_at": time.time(), "transitions": slim}
+        _save()
+
+
+def invalidate(jira_url: str, issue_key: str) -> None:
+    """이슈의 현재 (유형, 상태)에 해당하는 캐시 항목과 이슈 상태 정보를 버린다."""
+    with _lock:
+        info = _issues.pop(issue_key, None)
+        if info:
+            key = _cache_key(jira_url, issue_key, info["issuetype"], info["status"])
+            if _load().pop(key, None) is not None:
+                _save()
+
+
+def remember(issue_key: str, issuetype: str, status: str) -> None:
+    """이미 조회한 이슈의 유형·상태를 등록 (prime 없이 캐시 사용)."""
+    _issues[issue_key] = {"issuetype": issuetype, "status": status}
+
+
+def prime(jira_url: str, headers: dict, issue_keys: Iterable[str]) -> None:
+    """대상 이슈들의 유형·상태를 일괄 조회해 두어 get_transitions()가 캐시를 쓰게 한다."""
+    missing = [k for k in issue_keys if k not in _issues]
+    if not missing:
+        return
+    for key, info in session.fetch_issue_statuses(jira_url, headers, missing).items():
+        remember(key, info["issuetype"], info["status"])
+
+
+def _fetch_fresh(jira_url: str, headers: dict, issue_key: str) -> List[dict]:
+    """GET /issue/{key}?expand=transitions 로 유형·상태·전환을 한 번에 받아 캐시 (빈 목록은 캐시 안 함)."""
+    try:
+        r = http.get(
+            f"{jira_url}/rest/api/3/issue/{issue_key}",
+            headers=headers,
+            params={"fields": "issuetype,status", "expand": "transitions"},
+        )
+        if r.status_code != 200:
+            return []
+        data = r.json()
+    except Exception:
+        return []
+    fields = data.get("fields") or {}
+    info = {
+        "issuetype": (fields.get("issuetype") or {}).get("name") or "",
+        "status": (fields.get("status") or {}).get("name") or "",
+    }
+    transitions = data.get("transitions", [])
+    _issues[issue_key] = info
+    # 빈 목록은 워크플로가 아니라 이 이슈의 권한·조건·검증기 탓일 수 있어 같은 (유형, 상태) 전체에 퍼뜨리지 않음
+    if transitions:
+        _put_cached(_cache_key(jira_url, issue_key, info["issuetype"], info["status"]), transitions)
+    return transitions
+
+
+def _cached_transitions(jira_url: str, issue_key: str) -> Optional[List[dict]]:
+    """이슈의 알려진 (유형, 상태)에 해당하는 캐시된 전환 목록. 없으면 None."""
+    info = _issues.get(issue_key)
+    if not info or not CACHE_FILE:
+        return None
+    return _get_cached(_cache_key(jira_url, issue_key, info["issuetype"], info["status"]))
+
+
+def get_transitions(jira_url: str, headers: dict, issue_key: str) -> List[dict]:
+    """이슈의 가능한 전환 목록. 캐시 히트 시 요청 없음."""
+    jira_url = jira_url.rstrip("/")
+    cached = _cached_transitions(jira_url, issue_key)
+    if cached is not None:
+        return cached
+    return _fetch_fresh(jira_url, headers, issue_key)
+
+
+def post_transition(jira_url: str, headers: dict, issue_key: str, transition_id: str) -> bool:
+    """
+    전환 실행. 성공 시 이슈의 알려진 상태를 갱신한다.
+    캐시된 목록에서 고른 전환이 거부되면 캐시를 무효화하고, 새 목록에도 같은 전환이 있으면 한 번 재시도.
+    """
+    jira_url = jira_url.rstrip("/")
+    for attempt in range(2):
+        info = _issues.get(issue_key)
+        target = None
+        if info and CACHE_FILE:
+            cached = _get_cached(_cache_key(jira_url, issue_key, info["issuetype"], info["status"])) or []
+            target = next((t for t in cached if t.get("id") == transition_id), None)
+        r = http.post(
+            f"{jira_url}/rest/api/3/issue/{issue_key}/transitions",
+            headers=headers,
+            json={"transition": {"id": transition_id}},
+        )
+        if r.status_code == 204:
+            to_status = ((target or {}).get("to") or {}).get("name")
+            if info and to_status:
+                info["status"] = to_status
+            else:
+                _issues.pop(issue_key, None)
+            return True
+        if attempt or target is None:
+            return False
+        invalidate(jira_url, issue_key)
+        fresh = _fetch_fresh(jira_url, headers, issue_key)
+        if not any(t.get("id") == transition_id for t in fresh):
+            return False
+    return False
+
+
+def _choose(transitions: List[dict], target: Target) -> Optional[str]:
+    if callable(target):
+        return target(transitions)
+    wanted = target.strip().lower()
+    for t in transitions:
+        to_name = ((t.get("to") or {}).get("name") or "").strip().lower()
+        if wanted == to_name or wanted in (t.get("name") or "").strip().lower():
+            return t.get("id")
+    return None
+
+
+def transition_one(jira_url: str, headers: dict, issue_key: str, target: Target) -> dict:
+    """
+    이슈 하나를 목표로 전환하고 결과를 반환.
+    Returns: {"key", "ok", "from", "to", "error"}
+    """
+    jira_url = jira_url.rstrip("/")
+    info = _issues.get(issue_key) or {}
+    result = {"key": issue_key, "ok": False, "from": info.get("status", ""), "to": "", "error": ""}
+    if isinstance(target, str) and info.get("status", "").strip().lower() == target.strip().lower():
+        result.update(ok=True, to=info["status"], error="이미 목표 상태")
+        return result
+    try:
+        cached = _cached_transitions(jira_url, issue_key)
+        transitions = cached if cached is not None else _fetch_fresh(jira_url, headers, issue_key)
+        tid = _choose(transitions, target)
+        if not tid and cached is not None:
+            # 캐시된 목록은 같은 (유형, 상태)의 다른 이슈 것이라 이 이슈에서는 다를 수 있음 → 새로 조회해 한 번 더
+            invalidate(jira_url, issue_key)
+            transitions = _fetch_fresh(jira_url, headers, issue_key)
+            tid = _choose(transitions, target)
+        result["from"] = (_issues.get(issue_key) or {}).get("status", result["from"])
+        if not tid:
+            result["error"] = "전환 가능한 상태 없음"
+            return result
+        to_name = next(
+            (((t.get("to") or {}).get("name") or "") for t in transitions if t.get("id") == tid), ""
+        )
+        if post_transition(jira_url, headers, issue_key, tid):
+            result.update(ok=True, to=to_name)
+        else:
+            result["error"] = "전환 요청 실패"
+    except Exception as e:
+        result["error"] = str(e)
+    return result
+
+
+async def transition_all(
+    jira_url: str,
+    headers: dict,
+    items: Iterable[Tuple[str, Target]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    on_result: Optional[Callable[[dict], None]] = None,
+) -> List[dict]:
+    """
+    (이슈 키, 목표) 목록을 동시에 전환. 동시 실행 수는 concurrency 로 제한하고
+    요청 속도는 jiralib.http 의 호스트별 레이트 리미터가 조절한다.
+    결과는 입력 순서대로 반환하며, on_result 는 이슈가 끝날 때마다 호출된다.
+    """
+    items = list(items)
+    concurrency = max(1, concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        async def run(issue_key: str, target: Target) -> dict:
+            async with semaphore:
+                result = await loop.run_in_executor(
+                    executor, transition_one, jira_url, headers, issue_key, target
+                )
+            if on_result:
+                on_result(result)
+            return result
+
+        return await asyncio.gather(*(run(key, target) for key, target in items))
+
+
+def transition_many(
+    jira_url: str,
+    headers: dict,
+    items: Iterable[Tuple[str, Target]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    on_result: Optional[Callable[[dict], None]] = None,
+) -> List[dict]:
+    """transition_all 동기 래퍼. 대상 이슈를 먼저 prime 해 이슈당 POST 1회로 처리한다."""
+    jira_url = jira_url.rstrip("/")
+    items = list(items)
+    prime(jira_url, headers, [key for key, _ in items])
+    return asyncio.run(transition_all(jira_url, headers, items, concurrency, on_result))
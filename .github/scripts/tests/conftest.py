@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+jiralib 테스트 공용 픽스처 (합성 프로젝트, 가짜 JIRA 서버).
+
+사용법:
+    pip install requests pytest
+    python3 -m pytest .github/scripts/tests
+"""
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1]
+PROJECT_ROOT = SCRIPTS_DIR.parents[1]
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+# 테스트가 레이트 리미터 대기·지표 파일·디스크 캐시에 영향받지 않도록 (jiralib 임포트 전에 설정)
+os.environ.setdefault("JIRA_RATE_LIMIT", "0")
+os.environ.setdefault("JIRA_METRICS_DIR", "")
+os.environ.setdefault("JIRA_HTTP_SUMMARY", "0")
+os.environ.setdefault("JIRA_BACKLOG_CACHE_DIR", "")
+os.environ.setdefault("JIRA_TRANSITION_CACHE", "")
+
+from jiralib.fakejira import FakeJira, FakeJiraServer  # noqa: E402
+from jiralib.synthetic import SyntheticProject  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def synthetic() -> SyntheticProject:
+    """작업 300건짜리 합성 프로젝트 (시드 고정)."""
+    return SyntheticProject(tasks=300, seed=7)
+
+
+@pytest.fixture
+def fake_jira(synthetic):
+    """합성 스냅샷을 올린 가짜 JIRA 서버. (FakeJira, 서버 URL, 인증 헤더)."""
+    jira = FakeJira()
+    jira.load(synthetic.snapshot())
+    with FakeJiraServer(jira) as server:
+        yield jira, server.url, {"Authorization": "Basic eDp4", "Accept": "application/json"}
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""jiralib.backlog.parse 결과를 이전 임포터의 정규식 파서(legacy_parse)와 비교."""
+import re
+
+import pytest
+
+from jiralib import backlog
+from conftest import PROJECT_ROOT
+
+FRONT_BACKLOG = PROJECT_ROOT / "docs" / "plan-front" / "JIRA_ISSUES.md"
+
+
+def _field(name: str, text: str, default: str = "") -> str:
+    m = re.search(rf"\*\*{name}\*\*:\s*(.+?)(?:\n|$)", text)
+    return m.group(1).strip() if m else default
+
+
+def _points(name: str, text: str) -> str:
+    m = re.search(rf"\*\*{name}\*\*:\s*(\d+)\s*SP", text)
+    return m.group(1) if m else ""
+
+
+def legacy_parse(content: str):
+    """jira-backlog-importer.py 가 jiralib.backlog 이전에 쓰던 정규식 파싱 (비교에 쓰는 필드만)."""
+    epics, stories = [], []
+    for epic_match in re.finditer(r"## Epic \d+:(.*?)(?=## Epic \d+:|$)", content, re.DOTALL):
+        epic_text = epic_match.group(1)
+        epic_id_match = re.search(r"\*\*Epic ID\*\*:\s*(\S+)", epic_text)
+        if not epic_id_match:
+            continue
+        epic_id = epic_id_match.group(1).strip()
+        epics.append((epic_id, _field("Epic Name", epic_text), _field("Target Sprint", epic_text),
+                      _points("Total Story Points", epic_text)))
+        story_pattern = r"### Story (\S+):\s*(.+?)(?=### Story \S+:|## Epic \d+:|$)"
+        for story_match in re.finditer(story_pattern, epic_text, re.DOTALL):
+            story_id = story_match.group(1).strip()
+            story_text = story_match.group(2)
+            labels_str = _field("Labels", story_text)
+            tasks_match = re.search(
+                r"\*\*Tasks\*\*:\s*(.+?)(?:\*\*Technical Notes\*\*:|\*\*Definition of Done\*\*:|$)",
+                story_text, re.DOTALL,
+            )
+            tasks_text = tasks_match.group(1) if tasks_match else ""
+            tasks = [
+                (m.group(1).strip(), m.group(2).strip())
+                for m in re.finditer(r"- \[ \] (\S+):\s*(.+?)(?=\n- \[ \]|\n\n|$)", tasks_text, re.DOTALL)
+            ]
+            stories.append((
+                story_id, epic_id,
+                _field("Story Type", story_text, "Story"),
+                _field("Priority", story_text, "Medium"),
+                _points("Story Points", story_text),
+                _field("Assignee", story_text),
+                _field("Sprint", story_text),
+                [label.strip().strip("`") for label in labels_str.split(",")] if labels_str else [],
+                tasks,
+            ))
+    return epics, stories
+
+
+def tree_parse(content: str):
+    """backlog.parse 트리를 legacy_parse 와 같은 모양으로 (임포터 parse_backlog 와 같은 규칙)."""
+    doc = backlog.parse(content)
+    epics, stories = [], []
+    for epic in doc.epics:
+        if not epic.id:
+            continue
+        epics.append((epic.id, epic.name, epic.fields.get("Target Sprint", ""),
+                      backlog.parse_points(epic.fields.get("Total Story Points", ""))))
+        for story in epic.stories:
+            labels_str = story.fields.get("Labels", "")
+            stories.append((
+                story.id, epic.id,
+                story.fields.get("Story Type") or "Story",
+                story.fields.get("Priority") or "Medium",
+                backlog.parse_points(story.fields.get("Story Points", "")),
+                story.fields.get("Assignee", ""),
+                story.fields.get("Sprint", ""),
+                [label.strip().strip("`") for label in labels_str.split(",")] if labels_str else [],
+                [(t.id, t.description) for t in story.tasks if not t.checked],
+            ))
+    return epics, stories
+
+
+def test_front_backlog_matches_legacy_parser():
+    content = FRONT_BACKLOG.read_text(encoding="utf-8")
+    epics, stories = tree_parse(content)
+    assert epics and stories and any(s[-1] for s in stories)
+    assert (epics, stories) == legacy_parse(content)
+
+
+def test_synthetic_backlog_matches_legacy_parser(synthetic):
+    content = synthetic.backlog_markdown()
+    epics, stories = tree_parse(content)
+    assert len(epics) == len(synthetic.epics)
+    assert sum(len(s[-1]) for s in stories) == sum(1 for _ in synthetic.tasks())
+    assert (epics, stories) == legacy_parse(content)
+
+
+@pytest.mark.parametrize("newline", ["\r\n", "\r"])
+def test_load_normalizes_newlines(tmp_path, newline):
+    content = FRONT_BACKLOG.read_text(encoding="utf-8").replace("\r\n", "\n")
+    path = tmp_path / "backlog.md"
+    path.write_bytes(content.replace("\n", newline).encode("utf-8"))
+    doc = backlog.load(str(path))
+    assert "\r" not in doc.text
+    assert tree_parse(doc.text) == tree_parse(content)
+
+
+def test_references_finds_document_keys():
+    doc = backlog.parse("### Story GAM-11: 제목\n- [ ] GAM-11-1: GAM-7 참고, XGAM-9 는 아님\n")
+    assert doc.references("GAM") == {"GAM-11", "GAM-11-1", "GAM-7"}
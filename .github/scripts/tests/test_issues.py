@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""jiralib.issues 일괄 조회를 가짜 JIRA 서버로 검사 (없는 키가 섞인 400 JQL 분할 포함)."""
+from jiralib.issues import fetch_issue_statuses, fetch_issues
+
+
+def test_fetch_issues_returns_requested_fields(fake_jira, synthetic):
+    jira, url, headers = fake_jira
+    keys = [t.key for t in synthetic.tasks()][:250]
+    jira.reset_stats()
+    issues = fetch_issues(url, headers, keys, ["summary", "status"])
+    assert set(issues) == set(keys)
+    assert issues[keys[0]]["fields"]["summary"] == jira.issues[keys[0]]["fields"]["summary"]
+    assert jira.stats()["calls"] == {"POST /rest/api/3/search/jql": 3}  # 100건당 1회
+
+
+def test_bad_key_is_isolated_by_bisection(fake_jira, synthetic):
+    jira, url, headers = fake_jira
+    keys = [t.key for t in synthetic.tasks()][:100]
+    jira.reset_stats()
+    statuses = fetch_issue_statuses(url, headers, keys + ["GAM-999999"])
+    assert set(statuses) == set(keys)
+    assert statuses[keys[0]]["status"] == jira.issues[keys[0]]["fields"]["status"]["name"]
+    calls = jira.stats()["calls"]
+    # 101키 → 400 후 반씩 나눠 없는 키 하나만 남을 때까지 (log2 단계), 마지막으로 GET 1회 (404)
+    assert calls["POST /rest/api/3/search/jql"] <= 2 * 8 + 1
+    assert calls["GET /rest/api/3/issue/{key}"] == 1
+
+
+def test_all_bad_keys(fake_jira):
+    _, url, headers = fake_jira
+    assert fetch_issues(url, headers, ["GAM-999998", "GAM-999999"]) == {}
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""jiralib.matcher.KeywordMatcher 결과를 `pattern in text` 와 비교."""
+import random
+
+import pytest
+
+from jiralib.matcher import KeywordMatcher
+
+
+def naive_scan(patterns, texts):
+    return {p: {name for name, text in texts.items() if p in text} for p in set(patterns) if p}
+
+
+@pytest.mark.parametrize("patterns, text", [
+    (["he", "she", "his", "hers"], "ushers"),
+    (["a", "aa", "aaa"], "aaaa"),
+    (["abcd", "bc", "c"], "xbcx"),  # 긴 패턴 실패 후 fail 링크로 짧은 패턴
+    (["Service", "UserService", "UserServiceImpl"], "class UserServiceImpl"),
+    (["구현", "Repository 구현"], "UserRepository 구현 - 1h"),
+    (["", "x"], "xyz"),  # 빈 패턴은 무시
+    (["abc"], ""),
+])
+def test_find_matches_substring_check(patterns, text):
+    expected = {p for p in patterns if p and p in text}
+    assert KeywordMatcher(patterns).find(text) == expected
+
+
+def test_random_alphabet_matches_substring_check():
+    rng = random.Random(1)
+    for _ in range(200):
+        patterns = ["".join(rng.choice("ab") for _ in range(rng.randint(1, 5))) for _ in range(rng.randint(1, 8))]
+        texts = {i: "".join(rng.choice("abc") for _ in range(rng.randint(0, 30))) for i in range(5)}
+        assert KeywordMatcher(patterns).scan(texts) == naive_scan(patterns, texts)
+
+
+def test_scan_synthetic_sources(synthetic):
+    """합성 Kotlin 소스에서 클래스 이름(서로 접두사 관계 포함)·키워드 검색."""
+    tasks = [t for t in synthetic.tasks() if t.class_name]
+    texts = {synthetic.class_path(t): synthetic.kotlin_source(t) for t in tasks[:120]}
+    patterns = [t.class_name for t in tasks] + ["class ", "interface ", "@Service", "fun findAll", "없는키워드"]
+    patterns += [t.class_name[:-3] for t in tasks[:20]]  # 다른 패턴의 접두사
+    hits = KeywordMatcher(patterns).scan(texts)
+    assert hits == naive_scan(patterns, texts)
+    assert hits["없는키워드"] == set()
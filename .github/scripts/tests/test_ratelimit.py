@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""jiralib.ratelimit: Retry-After 해석과 AIMD 허용량 조정."""
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from jiralib.ratelimit import AdaptiveRateLimiter, parse_retry_after
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("-1") == 0.0
+    assert parse_retry_after("soon") is None
+    later = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 <= parse_retry_after(later) <= 30
+
+
+def test_aimd_rate_adjustment():
+    limiter = AdaptiveRateLimiter(rate=10, max_rate=12, min_rate=1, burst=5)
+    for _ in range(10):
+        assert limiter.observe(200, {}) is False
+    assert limiter.rate == 12  # 정상 응답마다 증가, 상한에서 멈춤
+    assert limiter.observe(429, {"Retry-After": "0"}) is True
+    assert limiter.rate == 6 and limiter.throttled == 1  # 스로틀 시 절반
+    limiter.observe(200, {"X-RateLimit-NearLimit": "true"})
+    assert limiter.rate == 6 * 0.8
+    for _ in range(10):
+        limiter.observe(503, {"Retry-After": "0"})
+    assert limiter.rate == 1  # 하한
+
+
+def test_acquire_waits_for_tokens():
+    limiter = AdaptiveRateLimiter(rate=1000, max_rate=1000, burst=2)
+    waited = [limiter.acquire() for _ in range(4)]
+    assert waited[:2] == [0.0, 0.0]  # 버스트 안에서는 대기 없음
+    assert all(w > 0 for w in waited[2:])
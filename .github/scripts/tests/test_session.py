@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""jiralib.session: 프로세스 이슈 조회 캐시와 매핑 메모."""
+import json
+
+import pytest
+
+from jiralib import http, session
+
+SEARCH = "POST /rest/api/3/search/jql"
+
+
+@pytest.fixture(autouse=True)
+def empty_issue_cache():
+    session.clear_issues()
+    yield
+    session.clear_issues()
+
+
+def test_issue_cache_reuses_fetched_fields(fake_jira, synthetic):
+    jira, url, headers = fake_jira
+    keys = [t.key for t in synthetic.tasks()][:150]
+    jira.reset_stats()
+    first = session.fetch_issues(url, headers, keys, ["summary", "status"])
+    assert jira.stats()["calls"] == {SEARCH: 2}
+    # 같은 키 + 이미 조회한 필드의 부분 집합 → 요청 없음
+    again = session.fetch_issues(url, headers, keys[:100], ["status"])
+    assert jira.stats()["calls"] == {SEARCH: 2}
+    assert again[keys[0]] == first[keys[0]]
+    # 필드가 모자란 키만 다시 조회: 상태 조회는 issuetype·parent 가 더 필요
+    statuses = session.fetch_issue_statuses(url, headers, keys[:10])
+    assert set(statuses) == set(keys[:10]) and jira.stats()["calls"] == {SEARCH: 3}
+    session.fetch_issues(url, headers, keys[:20], ["issuetype"])  # 앞 10건은 캐시, 나머지 10건만
+    assert jira.stats()["calls"] == {SEARCH: 4}
+
+
+def test_write_invalidates_issue_cache(fake_jira, synthetic):
+    jira, url, headers = fake_jira
+    key = next(synthetic.tasks()).key
+    before = session.fetch_issues(url, headers, [key], ["summary"])[key]
+    before["fields"]["summary"] = "호출한 쪽에서 고친 값"  # 복사본이라 캐시에 영향 없음
+    assert session.fetch_issues(url, headers, [key], ["summary"])[key]["fields"]["summary"] != "호출한 쪽에서 고친 값"
+    writes = http.writes()
+    r = http.put(f"{url}/rest/api/3/issue/{key}", headers=headers, json={"fields": {"summary": "새 제목"}})
+    assert r.status_code == 204 and http.writes() == writes + 1
+    assert session.fetch_issues(url, headers, [key], ["summary"])[key]["fields"]["summary"] == "새 제목"
+
+
+def test_load_mapping_returns_copy(tmp_path):
+    path = tmp_path / "jira-mapping.json"
+    path.write_text(json.dumps({"GAM-1": "GAM-101", "_jiraToBacklog": {"GAM-101": "GAM-1"}}))
+    mapping = session.load_mapping(str(path))
+    mapping["GAM-1"] = "changed"
+    mapping["_jiraToBacklog"].clear()
+    assert session.load_mapping(str(path)) == {"GAM-1": "GAM-101", "_jiraToBacklog": {"GAM-101": "GAM-1"}}
+    assert session.load_mapping(str(tmp_path / "missing.json")) == {}
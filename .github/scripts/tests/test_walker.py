@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""jiralib.walker: .gitignore 규칙 해석과 가지치기 순회."""
+import os
+
+import pytest
+
+from jiralib.walker import GitIgnore, walk_files
+
+# (규칙들, base 기준 상대 경로, 디렉터리 여부, 기대값: True 무시 / False 다시 포함 / None 해당 없음)
+CASES = [
+    # 고정(anchored): 앞이나 가운데 `/`
+    (["/build/"], "build", True, True),
+    (["/build/"], "sub/build", True, None),
+    (["/build"], "sub/build", True, None),
+    (["docs/tmp"], "docs/tmp", True, True),
+    (["docs/tmp"], "x/docs/tmp", True, None),
+    # 고정 안 됨: 아무 깊이
+    (["build/"], "build", True, True),
+    (["build/"], "sub/build", True, True),
+    (["build"], "sub/build", False, True),
+    # 디렉터리만
+    (["build/"], "build", False, None),
+    (["/out/"], "out", False, None),
+    # 부정 (마지막 규칙 우선)
+    (["*.log", "!keep.log"], "keep.log", False, False),
+    (["*.log", "!keep.log"], "a/other.log", False, True),
+    (["!keep.log", "*.log"], "keep.log", False, True),
+    # 와일드카드
+    (["*.kt"], "src/A.kt", False, True),
+    (["src/*.kt"], "src/a/A.kt", False, None),
+    (["a?c"], "abc", False, True),
+    (["[ab]x"], "bx", False, True),
+    (["[!ab]x"], "bx", False, None),
+    # **
+    (["**/generated"], "generated", True, True),
+    (["**/generated"], "a/b/generated", True, True),
+    (["src/**/gen"], "src/gen", True, True),
+    (["src/**/gen"], "src/a/b/gen", True, True),
+    (["src/**/gen"], "lib/src/a/gen", True, None),
+    (["logs/**"], "logs/a/b.txt", False, True),
+    # 주석·빈 줄·이스케이프
+    (["# build", "", "\\#file"], "#file", False, True),
+    (["# build"], "build", True, None),
+]
+
+
+@pytest.mark.parametrize("rules, rel, is_dir, expected", CASES)
+def test_gitignore_rules(rules, rel, is_dir, expected):
+    base = os.path.join(os.sep, "repo")
+    ignore = GitIgnore(base, rules)
+    assert ignore.match(os.path.join(base, *rel.split("/")), is_dir) is expected
+
+
+def test_walk_prunes_ignored_directories(tmp_path):
+    for rel in ["build/a.kt", "sub/build/b.kt", "sub/c.kt", "out.log", "keep.log"]:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".gitignore").write_text("/build/\n*.log\n!keep.log\n")
+    found = {os.path.relpath(e.path, tmp_path).replace(os.sep, "/") for e in walk_files(str(tmp_path))}
+    assert found == {"sub/build/b.kt", "sub/c.kt", "keep.log", ".gitignore"}
@@ -10,18 +10,25 @@ import re
 import sys
 import json
 import argparse
-import base64
-import requests
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
+# 공용 HTTP 클라이언트(.github/scripts/jiralib) 경로 추가
+sys.path.insert(0, str(next(p for p in Path(__file__).resolve().parents if (p / ".github" / "scripts").is_dir()) / ".github" / "scripts"))
+from jiralib import backlog, http, session  # noqa: E402
+from jiralib.titleindex import TitleIndex  # noqa: E402
+
 
 DONE_STATUSES = {'done', '완료', 'complete', 'closed', '종료', 'resolved', '해결됨'}
 IN_PROGRESS_STATUSES = {'in progress', '진행 중', 'in progress', 'code review', 'testing'}
 TO_DO_STATUSES = {'to do', '해야 할 일', 'open', 'backlog'}
 
+STORY_KEY_RE = re.compile(r'GAM-\d+')
+TASK_KEY_RE = re.compile(r'GAM-\d+-\d+')
+FRONTEND_STORY_KEY_RE = re.compile(r'GAMF-\d+')
+
 
 def normalize_status(s: str) -> str:
     t = (s or '').strip().lower()
@@ -44,52 +51,28 @@ def load_display_titles_from_backlogs(
     titles: Dict[str, str] = {}
     # 백엔드: Epic ID/Name, Story KEY: Title, Task KEY: Title
     if os.path.exists(backend_backlog_path):
-        content = Path(backend_backlog_path).read_text(encoding='utf-8')
-        for m in re.finditer(r'\*\*Epic ID\*\*:\s*(\S+).*?\*\*Epic Name\*\*:\s*(.+?)(?:\n|$)', content, re.DOTALL):
-            key, name = m.group(1).strip(), m.group(2).strip()
-            if key and name:
-                titles[key] = name
-        for m in re.finditer(r'### Story (GAM-\d+):\s*(.+?)(?:\n|$)', content):
-            key, name = m.group(1).strip(), m.group(2).strip()
-            if key and name:
-                titles[key] = name
-        for m in re.finditer(r'- \[ \] (GAM-\d+-\d+):\s*(.+?)(?:\n|$)', content):
-            key, name = m.group(1).strip(), m.group(2).strip()
-            if key and name:
-                titles[key] = name
+        for key, name in _backlog_key_titles(backlog.load(backend_backlog_path)):
+            titles[key] = name
     # 프론트: Epic ID/Name, Story GAMF-xx: Title; 매핑(백로그 ID -> JIRA 키)으로 표시 제목 대입
     mapping_backlog_to_jira: Dict[str, str] = {}
-    if os.path.exists(mapping_file):
-        with open(mapping_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        for k, v in data.items():
-            if not k.startswith('_') and isinstance(v, str):
-                mapping_backlog_to_jira[k] = v  # GAMF-11 -> GAM-145
+    for k, v in session.load_mapping(mapping_file).items():
+        if not k.startswith('_') and isinstance(v, str):
+            mapping_backlog_to_jira[k] = v  # GAMF-11 -> GAM-145
     if os.path.exists(frontend_backlog_path):
-        content = Path(frontend_backlog_path).read_text(encoding='utf-8')
-        for m in re.finditer(r'\*\*Epic ID\*\*:\s*(\S+).*?\*\*Epic Name\*\*:\s*(.+?)(?:\n|$)', content, re.DOTALL):
-            key, name = m.group(1).strip(), m.group(2).strip()
-            if key and name:
-                jira_key = mapping_backlog_to_jira.get(key)
-                if jira_key:
-                    titles[jira_key] = name
-        for m in re.finditer(r'### Story (GAMF-\d+):\s*(.+?)(?:\n|$)', content):
-            key, name = m.group(1).strip(), m.group(2).strip()
-            if key and name:
-                jira_key = mapping_backlog_to_jira.get(key)
-                if jira_key:
-                    titles[jira_key] = name
+        doc = backlog.load(frontend_backlog_path)
+        entries = [(e.id, e.name) for e in doc.epics]
+        entries += [(s.id, s.title) for s in doc.stories if FRONTEND_STORY_KEY_RE.fullmatch(s.id)]
+        for key, name in entries:
+            jira_key = mapping_backlog_to_jira.get(key)
+            if key and name and jira_key:
+                titles[jira_key] = name
     return titles
 
 
 def load_frontend_jira_keys(mapping_file: str) -> set:
     """매핑에서 GAMF-* 키에 대응하는 JIRA 이슈 키(GAM-xxx) 집합 반환. 프론트엔드 구분용."""
     frontend = set()
-    if not os.path.exists(mapping_file):
-        return frontend
-    with open(mapping_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    for k, v in data.items():
+    for k, v in session.load_mapping(mapping_file).items():
         if not k.startswith('_') and isinstance(v, str) and k.startswith('GAMF-'):
             frontend.add(v)
     return frontend
@@ -102,38 +85,29 @@ def _normalize_title(s: str) -> str:
     return re.sub(r"\s+", " ", (s or "").strip())
 
 
+def _backlog_key_titles(doc: backlog.Backlog) -> List[Tuple[str, str]]:
+    """Epic ID/Name, Story GAM-xx: Title, Task GAM-xx-x: Title 순서의 (키, 제목) 목록."""
+    result: List[Tuple[str, str]] = [(e.id, e.name) for e in doc.epics if e.id and e.name]
+    result += [(s.id, s.title) for s in doc.stories if STORY_KEY_RE.fullmatch(s.id) and s.title]
+    result += [(t.id, t.title) for t in doc.tasks if not t.checked and TASK_KEY_RE.fullmatch(t.id) and t.title]
+    return result
+
+
 def load_backlog_key_titles(backend_backlog_path: str) -> List[Tuple[str, str]]:
     """
     백엔드 백로그에서 (backlog_key, title) 목록을 순서대로 로드.
     Epic ID/Name, Story GAM-xx: Title, Task GAM-xx-x: Title 패턴 파싱.
     """
-    result: List[Tuple[str, str]] = []
     if not os.path.exists(backend_backlog_path):
-        return result
-    content = Path(backend_backlog_path).read_text(encoding="utf-8")
-    for m in re.finditer(r"\*\*Epic ID\*\*:\s*(\S+).*?\*\*Epic Name\*\*:\s*(.+?)(?:\n|$)", content, re.DOTALL):
-        key, name = m.group(1).strip(), m.group(2).strip()
-        if key and name and not key.startswith("GAMF"):
-            result.append((key, name))
-    for m in re.finditer(r"### Story (GAM-\d+):\s*(.+?)(?:\n|$)", content):
-        key, name = m.group(1).strip(), m.group(2).strip()
-        if key and name:
-            result.append((key, name))
-    for m in re.finditer(r"- \[ \] (GAM-\d+-\d+):\s*(.+?)(?:\n|$)", content):
-        key, name = m.group(1).strip(), m.group(2).strip()
-        if key and name:
-            result.append((key, name))
-    return result
+        return []
+    doc = backlog.load(backend_backlog_path)
+    return [(key, name) for key, name in _backlog_key_titles(doc) if not key.startswith("GAMF")]
 
 
 def load_jira_to_backlog_mapping(mapping_file: str) -> Dict[str, str]:
     """매핑 파일의 _jiraToBacklog (JIRA 실제 키 → 백로그 키) 로드."""
     out: Dict[str, str] = {}
-    if not os.path.exists(mapping_file):
-        return out
-    with open(mapping_file, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    j2b = data.get("_jiraToBacklog")
+    j2b = session.load_mapping(mapping_file).get("_jiraToBacklog")
     if isinstance(j2b, dict):
         for k, v in j2b.items():
             if isinstance(k, str) and isinstance(v, str):
@@ -144,11 +118,7 @@ def load_jira_to_backlog_mapping(mapping_file: str) -> Dict[str, str]:
 def load_frontend_jira_to_backlog(mapping_file: str) -> Dict[str, str]:
     """매핑 파일에서 GAMF-* → GAM-xxx 항목을 역매핑: JIRA 키 → 백로그 키(GAMF-*)."""
     out: Dict[str, str] = {}
-    if not os.path.exists(mapping_file):
-        return out
-    with open(mapping_file, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    for backlog_key, jira_key in data.items():
+    for backlog_key, jira_key in session.load_mapping(mapping_file).items():
         if backlog_key.startswith("_") or not isinstance(backlog_key, str) or not isinstance(jira_key, str):
             continue
         if backlog_key.startswith("GAMF-"):
@@ -166,11 +136,7 @@ def resolve_jira_to_backlog(
     반환: (jira_key -> backlog_key, 매칭된 JIRA 키 집합).
     """
     backlog_by_key = {b[0]: b[1] for b in backlog_key_titles}
-    backlog_title_to_key: Dict[str, str] = {}
-    for bk, title in backlog_key_titles:
-        norm = _normalize_title(title)
-        if norm and norm not in backlog_title_to_key:
-            backlog_title_to_key[norm] = bk
+    title_index = TitleIndex(backlog_key_titles, normalize=_normalize_title)
 
     jira_to_backlog: Dict[str, str] = {}
     matched_jira_keys: set = set()
@@ -180,15 +146,14 @@ def resolve_jira_to_backlog(
         if not jira_key:
             continue
         summary = (raw.get("fields") or {}).get("summary") or ""
-        summary_norm = _normalize_title(summary)
 
         backlog_key = None
         if jira_key in jira_to_backlog_map:
             backlog_key = jira_to_backlog_map[jira_key]
         elif jira_key in backlog_by_key:
             backlog_key = jira_key
-        elif summary_norm and summary_norm in backlog_title_to_key:
-            backlog_key = backlog_title_to_key[summary_norm]
+        else:
+            backlog_key = title_index.exact(summary)
 
         if backlog_key:
             jira_to_backlog[jira_key] = backlog_key
@@ -203,55 +168,56 @@ def load_canonical_keys(mapping_file: str, backend_backlog_path: Optional[str] =
     - 매핑 파일의 값(GAM-xxx) + 백엔드 백로그에 등장하는 ID(GAM-*, GAM-*-*)를 정규로 간주.
     """
     canonical = set()
-    if os.path.exists(mapping_file):
-        with open(mapping_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        for k, v in data.items():
-            if not k.startswith('_') and isinstance(v, str):
-                canonical.add(v)
+    for k, v in session.load_mapping(mapping_file).items():
+        if not k.startswith('_') and isinstance(v, str):
+            canonical.add(v)
     if backend_backlog_path and os.path.exists(backend_backlog_path):
-        content = Path(backend_backlog_path).read_text(encoding='utf-8')
-        for m in re.finditer(r'\b(GAM-\d+(?:-\d+)?)\b', content):
-            canonical.add(m.group(1))
+        doc = backlog.load(backend_backlog_path)
+        canonical.update(doc.references('GAM'))
     return canonical
 
 
+REPORT_FIELDS = ["summary", "issuetype", "status", "duedate", "created"]
+
+
 def fetch_all_issues(jira_url: str, headers: dict, project_key: str) -> List[dict]:
-    """JIRA 프로젝트의 모든 이슈 조회 (search/jql, 페이지네이션)."""
+    """JIRA 프로젝트의 모든 이슈 조회 (search/jql, 페이지네이션).
+
+    검색 요청에 필요한 필드를 직접 지정해 이슈별 상세 조회(N+1)를 없애고,
+    현재 페이지를 처리하는 동안 다음 페이지를 미리 요청한다.
+    """
     url = f"{jira_url}/rest/api/3/search/jql"
-    all_issues = []
-    next_token = None
     max_results = 100
-    while True:
+
+    def fetch_page(next_token: Optional[str]) -> Optional[dict]:
         payload = {
             "jql": f"project = {project_key} ORDER BY key ASC",
-            "maxResults": max_results
+            "maxResults": max_results,
+            "fields": REPORT_FIELDS,
         }
         if next_token:
             payload["nextPageToken"] = next_token
-        try:
-            r = requests.post(url, headers=headers, json=payload)
-            if r.status_code != 200:
+        r = http.post(url, headers=headers, json=payload)
+        if r.status_code != 200:
+            return None
+        return r.json()
+
+    all_issues = []
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(fetch_page, None)
+        while pending is not None:
+            try:
+                data = pending.result()
+            except Exception:
                 break
-            data = r.json()
-            batch = data.get('issues', [])
-            if not batch:
+            if not data:
                 break
-            for issue in batch:
-                issue_id = issue.get('id')
-                if not issue_id:
-                    continue
-                # 상세 필드가 없을 수 있으므로 개별 조회
-                detail_url = f"{jira_url}/rest/api/3/issue/{issue_id}"
-                dr = requests.get(detail_url, headers=headers, params={"fields": "key,summary,issuetype,status,duedate,created"})
-                if dr.status_code == 200:
-                    all_issues.append(dr.json())
+            batch = data.get('issues', [])
             next_token = data.get('nextPageToken')
-            if not next_token or data.get('isLast'):
-                break
-            time.sleep(0.3)
-        except Exception:
-            break
+            pending = None
+            if batch and next_token and not data.get('isLast'):
+                pending = executor.submit(fetch_page, next_token)
+            all_issues.extend(issue for issue in batch if issue.get('key'))
     return all_issues
 
 
@@ -392,33 +358,9 @@ def build_report_markdown(
     return "\n".join(lines)
 
 
-def load_jira_env_from_file(path: str) -> None:
-    """docs/jira/jira.env 등 KEY=value 형식 파일을 읽어 os.environ에 설정."""
-    if not path or not os.path.exists(path):
-        return
-    with open(path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            if '=' in line:
-                key, _, value = line.partition('=')
-                key, value = key.strip(), value.strip()
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1].replace('\\"', '"')
-                elif value.startswith("'") and value.endswith("'"):
-                    value = value[1:-1].replace("\\'", "'")
-                if key:
-                    os.environ[key] = value
-
-
 def main():
     # 환경 변수가 없으면 docs/jira/jira.env 참조 (docs는 push 제외)
-    if not os.getenv('JIRA_URL'):
-        for p in ('docs/jira/jira.env', 'jira.env'):
-            load_jira_env_from_file(p)
-            if os.getenv('JIRA_URL'):
-                break
+    session.load_env()
     parser = argparse.ArgumentParser(description='JIRA 진행 상황 보고서 생성')
     parser.add_argument('--jira-url', default=os.getenv('JIRA_URL'), help='JIRA URL')
     parser.add_argument('--jira-email', default=os.getenv('JIRA_EMAIL'), help='JIRA 이메일')
@@ -454,12 +396,7 @@ def main():
         sys.exit(1)
 
     report_date = args.date or datetime.now().strftime('%Y-%m-%d')
-    auth = base64.b64encode(f"{args.jira_email}:{args.jira_api_token}".encode()).decode()
-    headers = {
-        "Authorization": f"Basic {auth}",
-        "Content-Type": "application/json",
-        "Accept": "application/json"
-    }
+    headers = session.auth_headers(args.jira_email, args.jira_api_token)
 
     print("JIRA 이슈 조회 중...", file=sys.stderr)
     issues = fetch_all_issues(jira_url, headers, args.project_key)
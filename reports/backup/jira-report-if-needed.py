@@ -5,19 +5,19 @@
 최신 보고서·JIRA_BACKLOG·실제 JIRA 상태를 확인하고, 필요 시에만 보고서를 생성하는 스크립트.
 """
 import argparse
-import base64
 import json
 import os
 import re
 import shutil
 import subprocess
 import sys
-import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Set
 
-import requests
+# 공용 JIRA 라이브러리(.github/scripts/jiralib) 경로 추가
+sys.path.insert(0, str(next(p for p in Path(__file__).resolve().parents if (p / ".github" / "scripts").is_dir()) / ".github" / "scripts"))
+from jiralib import backlog, session  # noqa: E402
 
 
 # 정규 키·상태 판별용 (jira-generate-report.py와 동일 로직)
@@ -34,16 +34,12 @@ def normalize_status(s: str) -> str:
 def load_canonical_keys(mapping_file: str, backend_backlog_path: Optional[str] = None) -> Set[str]:
     """정규(참조할) 이슈 키 집합 로드."""
     canonical = set()
-    if os.path.exists(mapping_file):
-        with open(mapping_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        for k, v in data.items():
-            if not k.startswith('_') and isinstance(v, str):
-                canonical.add(v)
+    for k, v in session.load_mapping(mapping_file).items():
+        if not k.startswith('_') and isinstance(v, str):
+            canonical.add(v)
     if backend_backlog_path and os.path.exists(backend_backlog_path):
-        content = Path(backend_backlog_path).read_text(encoding='utf-8')
-        for m in re.finditer(r'\b(GAM-\d+(?:-\d+)?)\b', content):
-            canonical.add(m.group(1))
+        # 파싱 캐시 공유 (이후 실행되는 jira-generate-report.py 도 같은 캐시를 읽음)
+        canonical.update(backlog.load(backend_backlog_path).references('GAM'))
     return canonical
 
 
@@ -74,40 +70,6 @@ def parse_done_keys_from_report(report_path: str) -> Set[str]:
     return keys
 
 
-def get_jira_status(jira_url: str, headers: dict, issue_key: str) -> Optional[str]:
-    """이슈 한 건의 status.name 조회. 실패 시 None."""
-    try:
-        url = f"{jira_url}/rest/api/3/issue/{issue_key}"
-        r = requests.get(url, headers=headers, params={"fields": "status"}, timeout=15)
-        if r.status_code != 200:
-            return None
-        data = r.json()
-        name = (data.get('fields') or {}).get('status') or {}
-        return (name.get('name') or '').strip()
-    except Exception:
-        return None
-
-
-def load_jira_env_from_file(path: str) -> None:
-    """docs/jira/jira.env 등 KEY=value 형식 파일을 읽어 os.environ에 설정."""
-    if not path or not os.path.exists(path):
-        return
-    with open(path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            if '=' in line:
-                key, _, value = line.partition('=')
-                key, value = key.strip(), value.strip()
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1].replace('\\"', '"')
-                elif value.startswith("'") and value.endswith("'"):
-                    value = value[1:-1].replace("\\'", "'")
-                if key:
-                    os.environ[key] = value
-
-
 def main():
     parser = argparse.ArgumentParser(
         description='로컬 commit 시, JIRA 일정 관련 작업인 경우에만 조건을 확인하고 필요 시 보고서 생성'
@@ -139,15 +101,8 @@ def main():
             pass
 
     # 환경 변수가 없으면 docs/jira/jira.env 참조 (docs는 push 제외)
-    if not os.getenv('JIRA_URL'):
-        for p in ('docs/jira/jira.env', 'jira.env'):
-            load_jira_env_from_file(str(project_root / p))
-            if os.getenv('JIRA_URL'):
-                break
-
-    jira_url = (os.getenv('JIRA_URL') or '').rstrip('/')
-    jira_email = os.getenv('JIRA_EMAIL', '')
-    jira_api_token = os.getenv('JIRA_API_TOKEN', '')
+    session.load_env()
+    jira_url, jira_email, jira_api_token = session.credentials()
     if not jira_url or not jira_email or not jira_api_token:
         print("JIRA_URL, JIRA_EMAIL, JIRA_API_TOKEN 환경 변수가 필요합니다.", file=sys.stderr)
         print("env.jira.example 을 복사해 docs/jira/jira.env 에 값을 채우거나 export 하세요.", file=sys.stderr)
@@ -183,18 +138,12 @@ def main():
         sys.exit(0)
 
     # 4) JIRA에서 이미 완료인지
-    auth = base64.b64encode(f"{jira_email}:{jira_api_token}".encode()).decode()
-    headers = {
-        "Authorization": f"Basic {auth}",
-        "Accept": "application/json",
-    }
-    all_done_in_jira = True
-    for key in schedule_keys:
-        status_name = get_jira_status(jira_url, headers, key)
-        if status_name is None or normalize_status(status_name) != 'done':
-            all_done_in_jira = False
-            break
-        time.sleep(0.2)
+    headers = session.auth_headers(jira_email, jira_api_token)
+    statuses = session.fetch_issue_statuses(jira_url, headers, schedule_keys)
+    all_done_in_jira = all(
+        key in statuses and normalize_status(statuses[key]['status']) == 'done'
+        for key in schedule_keys
+    )
     if all_done_in_jira:
         print("실제 JIRA에 이미 완료로 처리된 작업 일정입니다. 보고서 미생성.", file=sys.stderr)
         sys.exit(0)
@@ -205,25 +154,20 @@ def main():
     report_file = reports_dir / f"report-{report_date}.md"
     latest_file = reports_dir / "report-latest.md"
 
-    script_dir = Path(__file__).resolve().parent
-    generate_script = script_dir / "jira-generate-report.py"
-    env = os.environ.copy()
-    env["JIRA_URL"] = jira_url
-    env["JIRA_EMAIL"] = jira_email
-    env["JIRA_API_TOKEN"] = jira_api_token
-    cmd = [
-        sys.executable,
-        str(generate_script),
+    # 같은 프로세스에서 실행: 인터프리터 기동 없이 HTTP 커넥션 풀·백로그/매핑 캐시를 이어 씀
+    generate_script = Path(__file__).resolve().parent / "jira-generate-report.py"
+    os.environ["JIRA_URL"] = jira_url
+    argv = [
         "--config", str(project_root / ".github" / "jira-config.json"),
         # --canonical-only 제거하여 프론트엔드 포함
         "--output", str(report_file),
         "--date", report_date,
     ]
     try:
-        subprocess.run(cmd, env=env, check=True, timeout=120, cwd=str(project_root))
-    except subprocess.CalledProcessError as e:
-        print(f"보고서 생성 실패: {e}", file=sys.stderr)
-        sys.exit(1)
+        code = session.run_script(str(generate_script), argv)
+        if code != 0:
+            print(f"보고서 생성 실패: 종료 코드 {code}", file=sys.stderr)
+            sys.exit(1)
     except Exception as e:
         print(f"보고서 생성 오류: {e}", file=sys.stderr)
         sys.exit(1)